@@ -0,0 +1,5 @@
+from .progress_analytics import ProgressAnalytics
+
+__all__ = [
+    'ProgressAnalytics'
+]
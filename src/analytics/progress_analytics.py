@@ -0,0 +1,316 @@
+import threading
+from datetime import date
+
+import numpy as np
+
+from database.streaks import to_date
+
+# date.toordinal() of the numpy datetime64 epoch
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def ordinal(value):
+    return to_date(value).toordinal()
+
+
+class ProgressAnalytics:
+    """The progress table held as columnar NumPy arrays for vectorised stats.
+
+    Progress is loaded once, then kept current through the DatabaseManager
+    write listener, so none of the queries here go back to SQLite. There is
+    one entry per progress row in each column:
+
+        day        date ordinal (date.toordinal())
+        game       index into game_ids
+        completed  whether the game was completed that day
+        score      score_value, or NaN if there isn't a numeric score
+
+    Methods take dates (or ISO strings) and treat ranges as inclusive. Days
+    are returned as ordinals; use date.fromordinal to turn them back into
+    dates.
+
+    Loading can read from another connection to the same database (e.g. a
+    reader borrowed on a background thread). Writes committed while a load
+    is reading are held back and replayed on top of what it read. On a
+    'reset' the arrays reload themselves, unless reload_on_reset is False
+    because the owner reloads them in the background instead.
+    """
+
+    def __init__(self, db, source=None, reload_on_reset=True):
+        self.db = db
+        self.reload_on_reset = reload_on_reset
+        self._lock = threading.RLock()
+        self._load_lock = threading.Lock()
+        self.game_ids = []
+        self.game_index = {}
+        self.size = 0
+        self._rows = {}
+        self._allocate(64)
+        # Listen before reading, so no write falls between the two
+        self._replay = []
+        db.add_write_listener(self.on_write)
+        self.load(source)
+
+    def close(self):
+        self.db.remove_write_listener(self.on_write)
+
+    def load(self, source=None):
+        """(Re)load every progress row, from source's connection if given.
+
+        The current arrays stay queryable until the new ones are filled.
+        """
+        with self._load_lock:
+            with self._lock:
+                if self._replay is None:
+                    self._replay = []
+            conn = (source or self.db).conn
+            rows = conn.execute(
+                'SELECT game_id, date, completed, score_value FROM progress'
+            ).fetchall()
+            game_ids = [row[0] for row in conn.execute('SELECT id FROM games ORDER BY id')]
+
+            with self._lock:
+                self._fill(rows, game_ids)
+                replay, self._replay = self._replay, None
+                for event, payload in replay:
+                    self._apply(event, payload)
+        if self.reload_on_reset and any(event == 'reset' for event, _ in replay):
+            # What was read may predate the other connection's change
+            self.load(source)
+
+    def _fill(self, rows, game_ids):
+        with self._lock:
+            self.game_ids = []
+            self.game_index = {}
+            for game_id in game_ids:
+                self._game(game_id)
+
+            count = len(rows)
+            self._allocate(max(count, 64))
+            if count:
+                columns = list(zip(*rows))
+                self._day[:count] = (
+                    np.array([str(day)[:10] for day in columns[1]], dtype='datetime64[D]')
+                    .astype(np.int64) + EPOCH_ORDINAL
+                )
+                self._gamecol[:count] = [self._game(game_id) for game_id in columns[0]]
+                self._completed[:count] = np.array(columns[2], dtype=bool)
+                self._score[:count] = np.array(columns[3], dtype=float)
+            self.size = count
+            self._rows = {
+                (game, day): row
+                for row, (game, day) in enumerate(zip(self._gamecol[:count].tolist(),
+                                                      self._day[:count].tolist()))
+            }
+
+    def _allocate(self, capacity):
+        self._day = np.zeros(capacity, dtype=np.int64)
+        self._gamecol = np.zeros(capacity, dtype=np.int32)
+        self._completed = np.zeros(capacity, dtype=bool)
+        self._score = np.full(capacity, np.nan)
+
+    def _grow(self):
+        capacity = len(self._day) * 2
+        for name in ('_day', '_gamecol', '_completed', '_score'):
+            old = getattr(self, name)
+            new = np.full(capacity, np.nan) if name == '_score' else np.zeros(capacity, old.dtype)
+            new[:self.size] = old[:self.size]
+            setattr(self, name, new)
+
+    def _game(self, game_id):
+        """Index of game_id in game_ids, adding it if it's new"""
+        if game_id not in self.game_index:
+            self.game_index[game_id] = len(self.game_ids)
+            self.game_ids.append(game_id)
+        return self.game_index[game_id]
+
+    # Write listener
+
+    def on_write(self, event, payload):
+        with self._lock:
+            if self._replay is not None:
+                # A load is reading; apply this once it has filled the arrays
+                self._replay.append((event, payload))
+                return
+            self._apply(event, payload)
+        if event == 'reset' and self.reload_on_reset:
+            self.load()
+
+    def _apply(self, event, payload):
+        if event == 'progress':
+            for game_id, day, completed, score_value in payload:
+                self._put(game_id, day, completed, score_value)
+        elif event == 'game_added':
+            self._game(payload)
+        elif event == 'game_deleted':
+            self._drop_game(payload)
+
+    def _put(self, game_id, day, completed, score_value):
+        key = (self._game(game_id), ordinal(day))
+        row = self._rows.get(key)
+        if row is None:
+            if self.size == len(self._day):
+                self._grow()
+            row = self.size
+            self.size += 1
+            self._rows[key] = row
+            self._gamecol[row], self._day[row] = key
+        self._completed[row] = completed
+        self._score[row] = np.nan if score_value is None else score_value
+
+    def _drop_game(self, game_id):
+        game = self.game_index.get(game_id)
+        if game is None:
+            return
+        keep = np.flatnonzero(self._gamecol[:self.size] != game)
+        for column in (self._day, self._gamecol, self._completed, self._score):
+            column[:len(keep)] = column[keep]
+        self._score[len(keep):self.size] = np.nan
+        self.size = len(keep)
+
+        # Games after it move up one place in game_ids
+        del self.game_ids[game]
+        self.game_index = {game_id: i for i, game_id in enumerate(self.game_ids)}
+        gamecol = self._gamecol[:self.size]
+        gamecol[gamecol > game] -= 1
+        self._rows = {
+            (game, day): row
+            for row, (game, day) in enumerate(zip(self._gamecol[:self.size].tolist(),
+                                                  self._day[:self.size].tolist()))
+        }
+
+    # Queries
+
+    def _mask(self, game_id=None, start=None, end=None):
+        """Boolean mask over the live rows for a game and inclusive ordinal range"""
+        mask = np.ones(self.size, dtype=bool)
+        if game_id is not None:
+            game = self.game_index.get(game_id)
+            if game is None:
+                return np.zeros(self.size, dtype=bool)
+            mask &= self._gamecol[:self.size] == game
+        if start is not None:
+            mask &= self._day[:self.size] >= start
+        if end is not None:
+            mask &= self._day[:self.size] <= end
+        return mask
+
+    def _range(self, start, end, game_id=None):
+        """Ordinals for start and end, defaulting to the first progress day and today"""
+        end = ordinal(end or date.today())
+        if start is None:
+            days = self._day[:self.size][self._mask(game_id)]
+            start = int(days.min()) if len(days) else end
+        else:
+            start = ordinal(start)
+        return start, end
+
+    def daily_scores(self, game_id, start=None, end=None):
+        """A game's score on each day from start to end, NaN on days without one"""
+        with self._lock:
+            return self._daily_scores(game_id, *self._range(start, end, game_id))
+
+    def _daily_scores(self, game_id, start, end):
+        scores = np.full(max(end - start + 1, 0), np.nan)
+        mask = self._mask(game_id, start, end)
+        scores[self._day[:self.size][mask] - start] = self._score[:self.size][mask]
+        return np.arange(start, end + 1), scores
+
+    def rolling_average(self, game_id, window=7, start=None, end=None):
+        """Mean score over the window days up to and including each day.
+
+        Returns (days, averages). Days without a score don't count towards
+        the mean; the average is NaN when the whole window has no scores.
+        """
+        with self._lock:
+            start, end = self._range(start, end, game_id)
+            days, scores = self._daily_scores(game_id, start - window + 1, end)
+
+        present = ~np.isnan(scores)
+        sums = np.concatenate(([0.0], np.cumsum(np.where(present, scores, 0.0))))
+        counts = np.concatenate(([0], np.cumsum(present)))
+        totals = sums[window:] - sums[:-window]
+        scored = counts[window:] - counts[:-window]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            averages = totals / scored
+        return days[window - 1:], averages
+
+    def streaks(self, game_id=None, today=None):
+        """(current, longest) run of consecutive completed days.
+
+        Counts days a specific game was completed, or any game when game_id
+        is None. Like the streak_runs table, the current streak may end
+        yesterday if today isn't done yet.
+        """
+        with self._lock:
+            mask = self._mask(game_id) & self._completed[:self.size]
+            days = np.unique(self._day[:self.size][mask])
+        if not len(days):
+            return 0, 0
+
+        breaks = np.flatnonzero(np.diff(days) != 1)
+        starts = days[np.concatenate(([0], breaks + 1))]
+        ends = days[np.concatenate((breaks, [len(days) - 1]))]
+        lengths = ends - starts + 1
+
+        today = ordinal(today or date.today())
+        current = np.flatnonzero((ends >= today - 1) & (starts <= today))
+        if len(current):
+            run = current[0]
+            current_length = int(min(ends[run], today) - starts[run] + 1)
+        else:
+            current_length = 0
+        return current_length, int(lengths.max())
+
+    def completion_rate(self, start, end=None, game_id=None):
+        """Fraction of days from start to end on which the game (or any game) was completed"""
+        start, end = ordinal(start), ordinal(end or date.today())
+        if end < start:
+            return 0.0
+        with self._lock:
+            mask = self._mask(game_id, start, end) & self._completed[:self.size]
+            completed_days = len(np.unique(self._day[:self.size][mask]))
+        return completed_days / (end - start + 1)
+
+    def completion_rates(self, start, end=None):
+        """{game_id: completion_rate} for every game over the same window"""
+        start, end = ordinal(start), ordinal(end or date.today())
+        with self._lock:
+            mask = self._mask(None, start, end) & self._completed[:self.size]
+            # There is at most one progress row per game and day
+            counts = np.bincount(self._gamecol[:self.size][mask], minlength=len(self.game_ids))
+            game_ids = list(self.game_ids)
+        days = max(end - start + 1, 1)
+        return {game_id: float(counts[i] / days) for i, game_id in enumerate(game_ids)}
+
+    def score_percentiles(self, game_id, percentiles=(25, 50, 75, 90), start=None, end=None):
+        """{percentile: score} over the game's numeric scores, or {} if it has none"""
+        with self._lock:
+            start = ordinal(start) if start else None
+            end = ordinal(end) if end else None
+            scores = self._score[:self.size][self._mask(game_id, start, end)]
+        scores = scores[~np.isnan(scores)]
+        if not len(scores):
+            return {}
+        return dict(zip(percentiles, np.percentile(scores, percentiles).tolist()))
+
+    def activity(self, days, end=None):
+        """Every game's recent days as matrices, one row per game in game_ids order.
+
+        Returns (game_ids, completed, scores) for the days days up to end:
+        completed holds 1 or 0 where there is progress and -1 where there
+        isn't, scores the numeric score or NaN.
+        """
+        end = ordinal(end or date.today())
+        start = end - days + 1
+        with self._lock:
+            game_ids = list(self.game_ids)
+            completed = np.full((len(game_ids), days), -1, dtype=np.int8)
+            scores = np.full((len(game_ids), days), np.nan)
+            mask = self._mask(None, start, end)
+            games = self._gamecol[:self.size][mask]
+            offsets = self._day[:self.size][mask] - start
+            completed[games, offsets] = self._completed[:self.size][mask]
+            scores[games, offsets] = self._score[:self.size][mask]
+        return game_ids, completed, scores
+
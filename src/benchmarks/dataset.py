@@ -0,0 +1,54 @@
+"""Synthetic game histories for benchmarks and query plan checks."""
+import random
+from datetime import date, datetime, timedelta
+
+from models.game import Game
+
+# Score generators by format name; each takes the rng and the game's score type
+SCORE_FORMATS = {
+    'int': lambda rng, score_type: str(rng.randint(0, int(score_type))),
+    'float': lambda rng, score_type: f"{rng.uniform(0, int(score_type)):.1f}",
+    'fraction': lambda rng, score_type: f"{rng.randint(1, 6)}/6",
+    'time': lambda rng, score_type: f"{rng.randint(0, 9)}:{rng.randint(0, 59):02d}",
+    'none': lambda rng, score_type: None,
+}
+
+
+def generate_dataset(db, games=20, years=1.0, density=0.7, activity=0.9,
+                     score_formats=('int', 'none'), seed=0, end_date=None):
+    """Fill db with daily history and return the new game ids.
+
+    Each game is played on a day with probability activity, and a played
+    day is completed with probability density. Games cycle through
+    score_formats; numeric formats get a score type of "10".
+    """
+    rng = random.Random(seed)
+    end_date = end_date or date.today()
+    days = int(years * 365)
+    start_date = end_date - timedelta(days=days)
+
+    game_ids = []
+    formats = []
+    for i in range(games):
+        score_format = score_formats[i % len(score_formats)]
+        game_ids.append(db.add_game(Game(
+            id=None,
+            name=f"Game {i}",
+            url=f"example.com/game-{i}",
+            description=f"Synthetic game {i} ({score_format} scores)",
+            score_type="10" if score_format in ('int', 'float') else score_format,
+            reminder_time=None,
+            created_at=datetime.combine(start_date, datetime.min.time())
+        )))
+        formats.append(SCORE_FORMATS[score_format])
+
+    for offset in range(days + 1):
+        day = start_date + timedelta(days=offset)
+        entries = []
+        for game_id, make_score in zip(game_ids, formats):
+            if rng.random() < activity:
+                completed = rng.random() < density
+                score = make_score(rng, "10") if completed else None
+                entries.append((game_id, day, completed, score, None))
+        db.update_game_progress_many(entries)
+    return game_ids
@@ -0,0 +1,201 @@
+"""Time DatabaseManager methods against a synthetic database.
+
+Run from the src directory:
+
+    python -m benchmarks.run --games 50 --years 5 --output results.json
+
+Results are written as JSON (per-method min/median/mean/max in
+milliseconds, plus the dataset parameters and git commit) so runs from
+different commits can be compared. Stats queries are timed both cold,
+with the stats cache cleared before every call, and warm. ProgressAnalytics
+queries run against arrays loaded from the same database.
+"""
+import argparse
+import json
+import platform
+import sqlite3
+import statistics
+import subprocess
+import sys
+import time
+from datetime import date, timedelta
+
+from database.db_manager import DatabaseManager, MEMORY_PATH
+from benchmarks.dataset import SCORE_FORMATS, generate_dataset
+from analytics import ProgressAnalytics
+
+
+def read_queries(db, game_id):
+    today = date.today()
+    return {
+        'get_daily_progress': lambda: db.get_daily_progress(today),
+        'get_day_games': lambda: db.get_day_games(today.isoformat()),
+        'get_month_completion_stats': lambda: db.get_month_completion_stats(today.year, today.month),
+        'get_completion_range(1y)': lambda: db.get_completion_range(
+            (today - timedelta(days=365)).isoformat(), today.isoformat()
+        ),
+        'get_completion_months(12)': lambda: db.get_completion_months(today.year - 1, today.month, 12),
+        'get_current_streak': db.get_current_streak,
+        'get_longest_streak': db.get_longest_streak,
+        'get_game_streak': lambda: db.get_game_streak(game_id, 10),
+        'get_game_streaks': db.get_game_streaks,
+        'get_game_stats': db.get_game_stats,
+        'get_game_stats(game_id)': lambda: db.get_game_stats(game_id),
+        'get_monthly_scores': lambda: db.get_monthly_scores(game_id, today.year, today.month),
+        'get_score_series(all, buckets)': lambda: db.get_score_series(game_id, None, None, 200),
+        'get_score_series(all, lttb)': lambda: db.get_score_series(game_id, None, None, 200, 'lttb'),
+        'get_game_profile': lambda: db.get_game_profile(game_id),
+        'get_completion_percentage': lambda: db.get_completion_percentage(game_id),
+        'get_game_history': lambda: db.get_game_history(game_id),
+        'get_game_history_page': lambda: db.get_game_history_page(game_id, today.isoformat()),
+        'get_all_games': db.get_all_games,
+    }
+
+
+def analytics_queries(db, game_id):
+    today = date.today()
+    analytics = ProgressAnalytics(db)
+    month_ago = today - timedelta(days=29)
+    return {
+        'ProgressAnalytics.load': analytics.load,
+        'ProgressAnalytics.rolling_average(7)': lambda: analytics.rolling_average(game_id, 7),
+        'ProgressAnalytics.streaks': analytics.streaks,
+        'ProgressAnalytics.streaks(game_id)': lambda: analytics.streaks(game_id),
+        'ProgressAnalytics.completion_rates(30d)': lambda: analytics.completion_rates(month_ago),
+        'ProgressAnalytics.score_percentiles': lambda: analytics.score_percentiles(game_id),
+        'ProgressAnalytics.activity(28)': lambda: analytics.activity(28),
+    }
+
+
+def write_queries(db, game_ids):
+    today = date.today()
+    toggle = {'completed': False}
+
+    def update_one():
+        toggle['completed'] = not toggle['completed']
+        db.update_game_progress(game_ids[0], today, toggle['completed'], '5', None)
+
+    def update_all():
+        toggle['completed'] = not toggle['completed']
+        db.update_game_progress_many([
+            (game_id, today, toggle['completed'], '5', None) for game_id in game_ids
+        ])
+
+    return {
+        'update_game_progress': update_one,
+        'update_game_progress_many(all games)': update_all,
+    }
+
+
+def time_call(call, repeat, before=None):
+    timings = []
+    for _ in range(repeat):
+        if before:
+            before()
+        start = time.perf_counter()
+        call()
+        timings.append((time.perf_counter() - start) * 1000)
+    return {
+        'min_ms': min(timings),
+        'median_ms': statistics.median(timings),
+        'mean_ms': statistics.fmean(timings),
+        'max_ms': max(timings),
+        'runs': repeat
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args):
+    db = DatabaseManager(args.db or MEMORY_PATH)
+    start = time.perf_counter()
+    game_ids = generate_dataset(
+        db, games=args.games, years=args.years, density=args.density,
+        activity=args.activity, score_formats=args.score_formats, seed=args.seed
+    )
+    generate_ms = (time.perf_counter() - start) * 1000
+    progress_rows = db.conn.execute('SELECT COUNT(*) FROM progress').fetchone()[0]
+
+    results = {}
+    for name, call in read_queries(db, game_ids[len(game_ids) // 2]).items():
+        results[name] = {
+            'cold': time_call(call, args.repeat, before=db.stats_cache.clear),
+            'warm': time_call(call, args.repeat),
+        }
+    for name, call in analytics_queries(db, game_ids[len(game_ids) // 2]).items():
+        results[name] = {'cold': time_call(call, args.repeat)}
+    for name, call in write_queries(db, game_ids).items():
+        results[name] = {'cold': time_call(call, args.repeat)}
+    db.close()
+
+    return {
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'sqlite': sqlite3.sqlite_version,
+        'dataset': {
+            'db': args.db or MEMORY_PATH,
+            'games': args.games,
+            'years': args.years,
+            'density': args.density,
+            'activity': args.activity,
+            'score_formats': list(args.score_formats),
+            'seed': args.seed,
+            'progress_rows': progress_rows,
+            'generate_ms': generate_ms
+        },
+        'results': results
+    }
+
+
+def print_table(report, stream):
+    print(f"{report['dataset']['progress_rows']} progress rows, "
+          f"generated in {report['dataset']['generate_ms']:.0f} ms", file=stream)
+    print(f"{'method':44} {'cold median':>12} {'warm median':>12}", file=stream)
+    for name, timing in report['results'].items():
+        warm = timing.get('warm')
+        warm_text = f"{warm['median_ms']:10.3f}ms" if warm else ''
+        print(f"{name:44} {timing['cold']['median_ms']:10.3f}ms {warm_text:>12}", file=stream)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--db', help="database file to create (default: in memory)")
+    parser.add_argument('--games', type=int, default=20)
+    parser.add_argument('--years', type=float, default=1.0)
+    parser.add_argument('--density', type=float, default=0.7,
+                        help="chance a played day is completed")
+    parser.add_argument('--activity', type=float, default=0.9,
+                        help="chance a game is played on a given day")
+    parser.add_argument('--score-formats', default='int,none',
+                        type=lambda value: tuple(value.split(',')),
+                        help=f"comma separated, from: {', '.join(SCORE_FORMATS)}")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', help="write JSON results here instead of stdout")
+    args = parser.parse_args(argv)
+
+    unknown = set(args.score_formats) - set(SCORE_FORMATS)
+    if unknown:
+        parser.error(f"unknown score formats: {', '.join(sorted(unknown))}")
+
+    report = run(args)
+    print_table(report, sys.stderr)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
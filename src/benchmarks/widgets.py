@@ -0,0 +1,140 @@
+"""Time building the UI's widgets against a database with a few hundred games.
+
+Run from the src directory:
+
+    python -m benchmarks.widgets --games 300 --output widgets.json
+
+Each page is built and shown offscreen repeatedly, so timings include Qt
+polishing every widget against the stylesheets. Results use the same
+JSON layout as benchmarks.run (per-build min/median/mean/max in
+milliseconds plus the git commit), so runs from different commits can be
+compared.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+from benchmarks.dataset import generate_dataset
+from benchmarks.run import git_commit, time_call
+
+
+def widget_builds(app, window, games, progress):
+    """Build-and-show callables keyed by name, each with a cleanup to run before it"""
+    from ui.pages.daily_page import DailyPage
+    from ui.pages.calendar_page import CalendarPage
+    from ui.pages.stats_page import StatsPage
+    from PyQt6.QtCore import QDate
+
+    built = []
+
+    def show(widget):
+        window.stacked_widget.addWidget(widget)
+        window.stacked_widget.setCurrentWidget(widget)
+        app.processEvents()
+        built.append(widget)
+
+    def cleanup():
+        window.stacked_widget.setCurrentWidget(window.main_menu_page)
+        while built:
+            widget = built.pop()
+            window.stacked_widget.removeWidget(widget)
+            widget.deleteLater()
+        app.processEvents()
+
+    def daily_page():
+        page = DailyPage(window.db, window)
+        # Fill the list from the prefetched rows rather than the page's own background load
+        window.queries.cancel('daily_progress')
+        page.show_daily_games(progress)
+        show(page)
+
+    def calendar_page():
+        page = CalendarPage(window.db, window)
+        show(page)
+        page.show_day_games(QDate.currentDate(), games)
+        app.processEvents()
+
+    return {
+        'main menu': (lambda: show(window.create_main_menu()), cleanup),
+        f'DailyPage with {len(progress)} games': (daily_page, cleanup),
+        'CalendarPage with day panel': (calendar_page, cleanup),
+        'StatsPage': (lambda: show(StatsPage(window.db, window)), cleanup),
+    }
+
+
+def run(args):
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication([])
+    commit = git_commit()
+
+    # MainWindow opens game_tracker.db in the working directory
+    os.chdir(tempfile.mkdtemp())
+    from ui.main_window import MainWindow
+    window = MainWindow()
+    start = time.perf_counter()
+    generate_dataset(window.db, games=args.games, years=args.years, seed=args.seed)
+    generate_ms = (time.perf_counter() - start) * 1000
+
+    # Warm the query caches and the analytics arrays so the timings are the widgets'
+    loaded = []
+    window.analytics(loaded.append)
+    while not loaded:
+        app.processEvents()
+    window.db.get_game_stats()
+    games = window.db.get_day_games(time.strftime('%Y-%m-%d'))
+    progress = window.db.get_daily_progress(time.strftime('%Y-%m-%d'))
+
+    results = {}
+    for name, (build, cleanup) in widget_builds(app, window, games, progress).items():
+        results[name] = {'cold': time_call(build, args.repeat, before=cleanup)}
+        cleanup()
+    window.close()
+
+    return {
+        'commit': commit,
+        'python': platform.python_version(),
+        'dataset': {
+            'games': args.games,
+            'years': args.years,
+            'seed': args.seed,
+            'generate_ms': generate_ms
+        },
+        'results': results
+    }
+
+
+def print_table(report, stream):
+    print(f"{report['dataset']['games']} games", file=stream)
+    print(f"{'build':32} {'median':>12} {'min':>12}", file=stream)
+    for name, timing in report['results'].items():
+        cold = timing['cold']
+        print(f"{name:32} {cold['median_ms']:10.1f}ms {cold['min_ms']:10.1f}ms", file=stream)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--games', type=int, default=300)
+    parser.add_argument('--years', type=float, default=0.25)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', help="write JSON results here instead of stdout")
+    args = parser.parse_args(argv)
+
+    report = run(args)
+    print_table(report, sys.stderr)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,267 @@
+"""Track games from the command line, without starting the UI.
+
+Run from the src directory:
+
+    python cli.py today
+    python cli.py complete Wordle --score 4
+    python cli.py --json streak Wordle
+
+Games can be named by id or by name (case-insensitive). Dates default to
+today and are given as YYYY-MM-DD. Only DatabaseManager is loaded, never
+Qt, NumPy or matplotlib, so commands start fast enough for shell prompts
+and cron jobs. --json prints the result as JSON instead of text.
+"""
+import argparse
+import calendar
+import json
+import os
+import sys
+from datetime import date
+
+from database.db_manager import DatabaseManager
+
+DEFAULT_DB = 'game_tracker.db'  # The file MainWindow opens in its working directory
+
+
+class CommandError(Exception):
+    """A command that can't be carried out, reported without a traceback"""
+
+
+def parse_date(value):
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a YYYY-MM-DD date: {value}")
+
+
+def parse_month(value):
+    try:
+        year, month = (int(part) for part in value.split('-'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a YYYY-MM month: {value}")
+    if not 1 <= month <= 12:
+        raise argparse.ArgumentTypeError(f"not a YYYY-MM month: {value}")
+    return year, month
+
+
+def find_game(db, name):
+    """The Game with id or name `name`"""
+    games = db.get_all_games()
+    matches = [game for game in games if name.isdigit() and game.id == int(name)]
+    if not matches:
+        matches = [game for game in games if game.name.lower() == name.lower()]
+    if not matches:
+        raise CommandError(f"no game named {name}")
+    if len(matches) > 1:
+        ids = ', '.join(str(game.id) for game in matches)
+        raise CommandError(f"more than one game is named {name} (ids {ids}); use the id")
+    return matches[0]
+
+
+def day_progress(db, game, day):
+    """The game's row from get_day_games for day"""
+    for row in db.get_day_games(day.isoformat()):
+        if row['id'] == game.id:
+            return row
+    raise CommandError(f"no game with id {game.id}")
+
+
+def write_progress(db, args, **changes):
+    """Update some of a game's completed, score and note for a day, keeping the rest"""
+    game = find_game(db, args.game)
+    row = day_progress(db, game, args.date)
+    row.update(changes)
+    db.update_game_progress(game.id, args.date, row['completed'], row['score'], row['note'])
+    return row
+
+
+def format_score(row):
+    if not row['score']:
+        return ''
+    score_type = (row['score_type'] or '').strip()
+    return f"{row['score']}/{score_type}" if score_type.isdigit() else f"{row['score']} {score_type}"
+
+
+def format_progress(row):
+    line = f"[{'x' if row['completed'] else ' '}] {row['name']}"
+    score = format_score(row)
+    if score:
+        line += f"  {score}"
+    if row['note']:
+        line += f"  ({row['note']})"
+    return line
+
+
+# Commands: each returns (result, text), result being what --json prints
+
+def cmd_today(db, args):
+    rows = db.get_day_games(args.date.isoformat())
+    done = sum(row['completed'] for row in rows)
+    lines = [f"{args.date.isoformat()}: {done}/{len(rows)} completed"]
+    lines += [format_progress(row) for row in rows]
+    return {'date': args.date.isoformat(), 'games': rows}, '\n'.join(lines)
+
+
+def cmd_complete(db, args):
+    changes = {'completed': not args.undo}
+    if args.score is not None:
+        changes['score'] = args.score
+    if args.note is not None:
+        changes['note'] = args.note
+    row = write_progress(db, args, **changes)
+    return row, format_progress(row)
+
+
+def cmd_score(db, args):
+    row = write_progress(db, args, score=args.score)
+    return row, format_progress(row)
+
+
+def cmd_note(db, args):
+    row = write_progress(db, args, note=args.note)
+    return row, format_progress(row)
+
+
+def game_stats_dict(row):
+    return {key: row[key] for key in row.keys()}
+
+
+def cmd_stats(db, args):
+    if args.game:
+        rows = db.get_game_stats(find_game(db, args.game).id)
+    else:
+        rows = db.get_game_stats()
+    streaks = db.get_game_streaks()
+    result = []
+    lines = []
+    for row in rows:
+        stats = game_stats_dict(row)
+        stats['current_streak'], stats['longest_streak'] = streaks.get(row['id'], (0, 0))
+        result.append(stats)
+
+        line = f"{row['name']}: completed {row['times_completed']} times"
+        if row['avg_score'] is not None:
+            line += (f", average {row['avg_score']:.2f}, best {row['best_score']:g}"
+                     f" ({row['best_score_date']})")
+        line += f", streak {stats['current_streak']} (longest {stats['longest_streak']})"
+        lines.append(line)
+    return result, '\n'.join(lines) or "No games tracked"
+
+
+def cmd_streak(db, args):
+    if not args.game:
+        result = {'current': db.get_current_streak(), 'longest': db.get_longest_streak()}
+        return result, f"Current streak: {result['current']} days\nLongest streak: {result['longest']} days"
+
+    game = find_game(db, args.game)
+    streak = db.get_game_streak(game.id, args.runs)
+    result = {
+        'game': game.id,
+        'current': streak['current'],
+        'longest': streak['longest'],
+        'runs': [{'start': start, 'end': end, 'length': length}
+                 for start, end, length in streak['runs']],
+    }
+    lines = [f"{game.name}",
+             f"Current streak: {streak['current']} days",
+             f"Longest streak: {streak['longest']} days"]
+    lines += [f"  {start} to {end}: {length} days" for start, end, length in streak['runs']]
+    return result, '\n'.join(lines)
+
+
+def cmd_month(db, args):
+    year, month = args.month or (date.today().year, date.today().month)
+    stats = db.get_month_completion_stats(year, month)
+    days = calendar.monthrange(year, month)[1]
+    complete = sum(1 for day in stats.values() if day['total'] and day['completed'] == day['total'])
+    played = sum(1 for day in stats.values() if day['completed'])
+    lines = [f"{calendar.month_name[month]} {year}: {played}/{days} days with a completed game, "
+             f"{complete} with every game completed"]
+    lines += [f"  {day}  {day_stats['completed']}/{day_stats['total']}"
+              for day, day_stats in sorted(stats.items())]
+    result = {'year': year, 'month': month, 'days': stats}
+    return result, '\n'.join(lines)
+
+
+def cmd_rebuild(db, args):
+    db.rebuild_daily_summary()
+    # Overall streaks are built from daily_summary, so they come after it
+    db.rebuild_streaks()
+    db.rebuild_game_streaks()
+    result = {'current': db.get_current_streak(), 'longest': db.get_longest_streak()}
+    return result, ("Rebuilt daily summaries and streaks "
+                    f"(current {result['current']}, longest {result['longest']})")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--db', default=DEFAULT_DB,
+                        help=f"database file (default: {DEFAULT_DB})")
+    parser.add_argument('--json', action='store_true', help="print results as JSON")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    def command(name, handler, help):
+        sub = commands.add_parser(name, help=help)
+        sub.set_defaults(handler=handler)
+        return sub
+
+    def dated(sub):
+        sub.add_argument('--date', type=parse_date, default=date.today(),
+                         help="day to use (default: today)")
+        return sub
+
+    dated(command('today', cmd_today, "list the day's games and their progress"))
+
+    sub = dated(command('complete', cmd_complete, "mark a game completed"))
+    sub.add_argument('game')
+    sub.add_argument('--score')
+    sub.add_argument('--note')
+    sub.add_argument('--undo', action='store_true', help="mark it not completed instead")
+
+    sub = dated(command('score', cmd_score, "record a game's score"))
+    sub.add_argument('game')
+    sub.add_argument('score')
+
+    sub = dated(command('note', cmd_note, "set a game's note"))
+    sub.add_argument('game')
+    sub.add_argument('note')
+
+    sub = command('stats', cmd_stats, "completion and score stats per game")
+    sub.add_argument('game', nargs='?')
+
+    sub = command('streak', cmd_streak, "overall streaks, or one game's streaks and runs")
+    sub.add_argument('game', nargs='?')
+    sub.add_argument('--runs', type=int, default=10, help="recent runs to list for a game")
+
+    sub = command('month', cmd_month, "completion for each day of a month")
+    sub.add_argument('month', nargs='?', type=parse_month, help="YYYY-MM (default: this month)")
+
+    command('rebuild', cmd_rebuild, "recompute daily summaries and streaks from progress")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if not os.path.exists(args.db):
+        print(f"error: no database at {args.db}", file=sys.stderr)
+        return 1
+
+    db = DatabaseManager(args.db)
+    try:
+        result, text = args.handler(db, args)
+    except CommandError as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 1
+    finally:
+        db.close()
+
+    if args.json:
+        json.dump(result, sys.stdout, indent=2, default=str)
+        print()
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
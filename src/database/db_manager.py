@@ -1,14 +1,181 @@
+import functools
+import math
 import sqlite3
-from datetime import datetime, date
+import statistics
+import sys
+import threading
+import uuid
+from pathlib import Path
+from datetime import date
 from models.game import Game
+from database.streaks import StreakRuns, to_date
+from database.reader_pool import ReaderPool
+from database.stats_cache import StatsCache, cached_game_stats, cached_stats
+from database.series import lttb
+
+
+def parse_score(score):
+    """Return the numeric value of a score string, or None if it isn't a number"""
+    if score is None:
+        return None
+    try:
+        value = float(str(score).strip())
+    except ValueError:
+        return None
+    return value if math.isfinite(value) else None
+
+
+def month_offset(year, month, delta):
+    """The (year, month) delta months after (or before, if negative) year/month"""
+    index = year * 12 + month - 1 + delta
+    return index // 12, index % 12 + 1
+
+
+def serialized_write(method):
+    """Run a mutating DatabaseManager method while holding the writer lock"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.read_only:
+            raise sqlite3.OperationalError(f"{method.__name__} called on a read-only connection")
+        with self.write_lock:
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                self.stats_cache.bump()
+    return wrapper
+
+
+# Pass as db_path for a throwaway database that lives only in memory
+MEMORY_PATH = ':memory:'
+
+SYNCHRONOUS_LEVELS = ('OFF', 'NORMAL', 'FULL', 'EXTRA', '0', '1', '2', '3')
+
+# Indexes introduced by each schema version, created by migrate_database
+INDEXES = {
+    6: [
+        '''CREATE INDEX IF NOT EXISTS idx_progress_date_completed
+           ON progress (date, completed)''',
+        '''CREATE INDEX IF NOT EXISTS idx_progress_completed_date
+           ON progress (date) WHERE completed = 1''',
+        '''CREATE INDEX IF NOT EXISTS idx_progress_game_score
+           ON progress (game_id, score_value)''',
+    ],
+    8: [
+        # With the date, the first day a game reached a given score is one seek
+        '''DROP INDEX IF EXISTS idx_progress_game_score''',
+        '''CREATE INDEX IF NOT EXISTS idx_progress_game_score_date
+           ON progress (game_id, score_value, date)''',
+    ],
+}
+
 
 class DatabaseManager:
-    def __init__(self):
-        self.conn = sqlite3.connect('game_tracker.db')
+    def __init__(self, db_path='game_tracker.db', read_only=False,
+                 synchronous='NORMAL', busy_timeout=5000, reader_count=2,
+                 stats_cache=None):
+        if str(synchronous).upper() not in SYNCHRONOUS_LEVELS:
+            raise ValueError(f"Unknown synchronous level: {synchronous}")
+        if db_path == MEMORY_PATH:
+            # A named shared-cache database so pooled readers see the same data
+            db_path = f'file:game-tracker-{uuid.uuid4().hex}?mode=memory&cache=shared'
+        self.db_path = db_path
+        self.in_memory = db_path.startswith('file:') and 'mode=memory' in db_path
+        self.read_only = read_only
+        self.synchronous = synchronous
+        self.busy_timeout = busy_timeout
+        self.write_lock = threading.RLock()
+        self.stats_cache = stats_cache or StatsCache()
+        self._data_version = None
+        self.write_listeners = []
+        if self.in_memory:
+            self.conn = sqlite3.connect(db_path, uri=True, check_same_thread=False)
+        elif read_only:
+            # Readers never create or migrate the schema; the writer owns that
+            uri = Path(db_path).resolve().as_uri() + '?mode=ro'
+            self.conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        else:
+            self.conn = sqlite3.connect(db_path, check_same_thread=False)
         self.conn.row_factory = sqlite3.Row
-        self.current_version = 2  # Increment this when schema changes
-        self.create_tables()
-        self.migrate_database()
+        self.configure_connection()
+        self.current_version = 8  # Increment this when schema changes
+        self.streaks = StreakRuns()
+        self.game_streaks = StreakRuns('game_streak_runs', key_column='game_id')
+        self.readers = None
+        if not read_only:
+            self.create_tables()
+            self.migrate_database()
+            self.readers = ReaderPool(self.open_reader, reader_count)
+
+    def configure_connection(self):
+        cursor = self.conn.cursor()
+        cursor.execute(f'PRAGMA busy_timeout = {int(self.busy_timeout)}')
+        if self.read_only and self.in_memory:
+            # Shared-cache memory databases can't be opened with mode=ro
+            cursor.execute('PRAGMA query_only = ON')
+        elif not self.read_only and not self.in_memory:
+            # WAL lets readers keep going while the writer commits
+            cursor.execute('PRAGMA journal_mode = WAL')
+        cursor.execute(f'PRAGMA synchronous = {self.synchronous}')
+
+    def open_reader(self):
+        """Open a read-only DatabaseManager on the same database file"""
+        return DatabaseManager(
+            self.db_path,
+            read_only=True,
+            synchronous=self.synchronous,
+            busy_timeout=self.busy_timeout,
+            stats_cache=self.stats_cache
+        )
+
+    def check_external_writes(self):
+        """Invalidate cached stats if another connection committed since the last check.
+
+        Called before every cached query and polled by the UI, possibly
+        from different threads; the lock makes sure one commit is only
+        reported once.
+        """
+        with self.write_lock:
+            data_version = self.conn.execute('PRAGMA data_version').fetchone()[0]
+            changed = self._data_version is not None and data_version != self._data_version
+            self._data_version = data_version
+        if changed:
+            self.stats_cache.bump()
+            if not self.read_only:
+                # Readers also see this process's own commits here; only the
+                # writer knows the change came from elsewhere
+                self.stats_cache.touch_games()
+                self.notify_write('reset')
+
+    def add_write_listener(self, listener):
+        """Call listener(event, payload) after every committed write.
+
+        Events and their payloads:
+          'progress'      list of (game_id, date, completed, score_value),
+                          date an ISO string and score_value a float or None
+          'game_added'    the new game's id
+          'game_deleted'  the deleted game's id
+          'reset'         None; another connection changed the database, so
+                          anything derived from it should be reloaded
+        Listeners run on the thread that made the write, after the commit.
+        """
+        self.write_listeners.append(listener)
+
+    def remove_write_listener(self, listener):
+        if listener in self.write_listeners:
+            self.write_listeners.remove(listener)
+
+    def notify_write(self, event, payload=None):
+        for listener in list(self.write_listeners):
+            try:
+                listener(event, payload)
+            except Exception as error:
+                # The write is already committed; a broken listener mustn't undo that
+                print(f"Write listener failed on '{event}': {error}", file=sys.stderr)
+
+    def close(self):
+        if self.readers:
+            self.readers.close()
+        self.conn.close()
 
     def create_tables(self):
         cursor = self.conn.cursor()
@@ -46,6 +213,21 @@ class DatabaseManager:
                 UNIQUE(game_id, date)
             )
         ''')
+
+        # Per-day completion totals, kept up to date on every write
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS daily_summary (
+                date DATE PRIMARY KEY,
+                total_games INTEGER NOT NULL DEFAULT 0,
+                completed_games INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+
+        # Runs of consecutive days with at least one completed game
+        self.streaks.create_table(cursor)
+
+        # The same runs for each game on its own
+        self.game_streaks.create_table(cursor)
         
         self.conn.commit()
 
@@ -55,6 +237,7 @@ class DatabaseManager:
         result = cursor.fetchone()
         return result[0] if result else 0
 
+    @serialized_write
     def migrate_database(self):
         current_version = self.get_db_version()
         
@@ -86,6 +269,31 @@ class DatabaseManager:
                 # Drop old table and rename new one
                 cursor.execute('DROP TABLE progress')
                 cursor.execute('ALTER TABLE progress_new RENAME TO progress')
+
+            if current_version < 3:
+                # Migrate to version 3: Add typed score_value column
+                columns = [row[1] for row in cursor.execute('PRAGMA table_info(progress)')]
+                if 'score_value' not in columns:
+                    cursor.execute('ALTER TABLE progress ADD COLUMN score_value REAL')
+                self.backfill_score_values()
+
+            if current_version < 4:
+                # Migrate to version 4: Populate daily_summary from history
+                self.rebuild_daily_summary()
+
+            if current_version < 5:
+                # Migrate to version 5: Build streak runs from daily_summary
+                self.rebuild_streaks()
+
+            if current_version < 7:
+                # Migrate to version 7: Build per-game streak runs from progress
+                self.rebuild_game_streaks()
+
+            # Create the indexes of every version newer than the database
+            for version, statements in sorted(INDEXES.items()):
+                if current_version < version:
+                    for statement in statements:
+                        cursor.execute(statement)
             
             # Update schema version
             cursor.execute('DELETE FROM schema_version')
@@ -94,6 +302,117 @@ class DatabaseManager:
             
             self.conn.commit()
 
+    def backfill_score_values(self, batch_size=500):
+        """Fill score_value for rows written before the column existed"""
+        cursor = self.conn.cursor()
+        last_id = 0
+        while True:
+            cursor.execute('''
+                SELECT id, score
+                FROM progress
+                WHERE id > ?
+                AND score IS NOT NULL
+                AND score_value IS NULL
+                ORDER BY id
+                LIMIT ?
+            ''', (last_id, batch_size))
+            rows = cursor.fetchall()
+            if not rows:
+                break
+            cursor.executemany(
+                'UPDATE progress SET score_value = ? WHERE id = ?',
+                [(parse_score(row[1]), row[0]) for row in rows]
+            )
+            last_id = rows[-1][0]
+
+    @serialized_write
+    def rebuild_daily_summary(self):
+        """Recompute daily_summary from scratch out of games and progress.
+
+        Streak runs are built from daily_summary, so follow this with
+        rebuild_streaks() unless they are rebuilt anyway.
+        """
+        cursor = self.conn.cursor()
+        cursor.execute('DELETE FROM daily_summary')
+        cursor.execute('''
+            INSERT INTO daily_summary (date, total_games, completed_games)
+            SELECT 
+                d.date,
+                (SELECT COUNT(*) FROM games) as total_games,
+                (SELECT COUNT(*)
+                 FROM progress p
+                 JOIN games g ON g.id = p.game_id
+                 WHERE p.date = d.date
+                 AND p.completed = 1) as completed_games
+            FROM (SELECT DISTINCT date FROM progress) d
+        ''')
+        cursor.execute('DELETE FROM daily_summary WHERE total_games <= 0')
+        self.conn.commit()
+
+    @serialized_write
+    def rebuild_streaks(self):
+        """Recompute streak runs from the completed days in daily_summary"""
+        cursor = self.conn.cursor()
+        cursor.execute('SELECT date FROM daily_summary WHERE completed_games > 0')
+        self.streaks.rebuild(cursor, [row[0] for row in cursor.fetchall()])
+        self.conn.commit()
+
+    @serialized_write
+    def rebuild_game_streaks(self):
+        """Recompute every game's streak runs from its completed progress rows"""
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT game_id, date
+            FROM progress
+            WHERE completed = 1
+            AND game_id IN (SELECT id FROM games)
+            ORDER BY game_id
+        ''')
+        days = {}
+        for game_id, day in cursor.fetchall():
+            days.setdefault(game_id, []).append(day)
+        self.game_streaks.clear(cursor)
+        for game_id, game_days in days.items():
+            self.game_streaks.rebuild(cursor, game_days, game_id)
+        self.conn.commit()
+        self.stats_cache.touch_games()
+
+    def _update_daily_summary(self, cursor, game_id, date, was_completed, completed):
+        """Apply one progress write to the summary row for its date.
+
+        Every game counts towards every day's total, as in the calendar
+        before daily_summary existed. was_completed is None when the
+        progress row is new.
+        """
+        cursor.execute('''
+            INSERT INTO daily_summary (date, total_games, completed_games)
+            SELECT ?, COUNT(*), 0
+            FROM games
+            WHERE true  -- Lets SQLite parse ON CONFLICT after a SELECT
+            ON CONFLICT(date) DO NOTHING
+        ''', (date,))
+
+        completed_delta = int(bool(completed)) - int(bool(was_completed))
+        if completed_delta > 0:
+            self.game_streaks.add_day(cursor, date, game_id)
+        elif completed_delta < 0:
+            self.game_streaks.remove_day(cursor, date, game_id)
+
+        if completed_delta:
+            cursor.execute('''
+                UPDATE daily_summary
+                SET completed_games = completed_games + ?
+                WHERE date = ?
+            ''', (completed_delta, date))
+            cursor.execute(
+                'SELECT completed_games FROM daily_summary WHERE date = ?', (date,)
+            )
+            completed_games = cursor.fetchone()[0]
+            if completed_games > 0 and completed_games - completed_delta <= 0:
+                self.streaks.add_day(cursor, date)
+            elif completed_games <= 0:
+                self.streaks.remove_day(cursor, date)
+
     def get_daily_progress(self, target_date):
         cursor = self.conn.cursor()
         cursor.execute('''
@@ -128,15 +447,51 @@ class DatabaseManager:
         return results
 
     def update_game_progress(self, game_id, date, completed, score=None, note=None):
+        self.update_game_progress_many([(game_id, date, completed, score, note)])
+
+    @serialized_write
+    def update_game_progress_many(self, entries):
+        """Write (game_id, date, completed, score, note) entries in one transaction.
+
+        Later entries for the same game and date replace earlier ones.
+        """
+        latest = {}
+        for game_id, day, completed, score, note in entries:
+            day = to_date(day).isoformat()
+            latest[(game_id, day)] = (game_id, day, completed, score, note)
+        if not latest:
+            return
+
         cursor = self.conn.cursor()
-        cursor.execute('''
-            INSERT INTO progress (game_id, date, completed, score, note)
-            VALUES (?, ?, ?, ?, ?)
+        previous = {}
+        for key in latest:
+            cursor.execute(
+                'SELECT completed FROM progress WHERE game_id = ? AND date = ?', key
+            )
+            row = cursor.fetchone()
+            previous[key] = row[0] if row else None
+
+        rows = []
+        written = []
+        for game_id, day, completed, score, note in latest.values():
+            score_value = parse_score(score)
+            written.append((game_id, day, bool(completed), score_value))
+            rows.append((game_id, day, completed, score, note, score_value,
+                         completed, score, note, score_value))
+        cursor.executemany('''
+            INSERT INTO progress (game_id, date, completed, score, note, score_value)
+            VALUES (?, ?, ?, ?, ?, ?)
             ON CONFLICT(game_id, date) 
-            DO UPDATE SET completed = ?, score = ?, note = ?
-        ''', (game_id, date, completed, score, note, completed, score, note))
+            DO UPDATE SET completed = ?, score = ?, note = ?, score_value = ?
+        ''', rows)
+
+        for key, (game_id, day, completed, score, note) in latest.items():
+            self._update_daily_summary(cursor, game_id, day, previous[key], completed)
         self.conn.commit()
+        self.stats_cache.touch_games({game_id for game_id, _ in latest})
+        self.notify_write('progress', written)
 
+    @serialized_write
     def add_game(self, game):
         cursor = self.conn.cursor()
         cursor.execute('''
@@ -146,7 +501,11 @@ class DatabaseManager:
             game.name, game.url, game.description, 
             game.score_type, game.reminder_time, game.created_at
         ))
+        cursor.execute('UPDATE daily_summary SET total_games = total_games + 1')
         self.conn.commit()
+        # A new game may reuse a deleted game's id
+        self.stats_cache.touch_games([cursor.lastrowid])
+        self.notify_write('game_added', cursor.lastrowid)
         return cursor.lastrowid
 
     def get_all_games(self):
@@ -155,42 +514,80 @@ class DatabaseManager:
         return [Game(**dict(row)) for row in cursor.fetchall()]
 
 
+    @serialized_write
     def delete_game(self, game_id):
         cursor = self.conn.cursor()
+        cursor.execute('SELECT 1 FROM games WHERE id = ?', (game_id,))
+        if cursor.fetchone():
+            # The game counts towards every day
+            cursor.execute('''
+                UPDATE daily_summary
+                SET total_games = total_games - 1,
+                    completed_games = completed_games - COALESCE((
+                        SELECT completed FROM progress
+                        WHERE game_id = ? AND date = daily_summary.date
+                    ), 0)
+            ''', (game_id,))
+            cursor.execute('DELETE FROM daily_summary WHERE total_games <= 0')
+        # Days are only summarised while some game has progress on them
+        cursor.execute('''
+            DELETE FROM daily_summary
+            WHERE date IN (SELECT date FROM progress WHERE game_id = ?)
+            AND NOT EXISTS (
+                SELECT 1 FROM progress p
+                WHERE p.date = daily_summary.date AND p.game_id != ?
+            )
+        ''', (game_id, game_id))
+        cursor.execute('''
+            SELECT p.date
+            FROM progress p
+            LEFT JOIN daily_summary s ON s.date = p.date
+            WHERE p.game_id = ?
+            AND p.completed = 1
+            AND COALESCE(s.completed_games, 0) <= 0
+        ''', (game_id,))
+        for row in cursor.fetchall():
+            self.streaks.remove_day(cursor, row[0])
+        self.game_streaks.clear(cursor, game_id)
         cursor.execute('DELETE FROM progress WHERE game_id = ?', (game_id,))
         cursor.execute('DELETE FROM games WHERE id = ?', (game_id,))
         self.conn.commit()
+        self.stats_cache.touch_games([game_id])
+        self.notify_write('game_deleted', game_id)
     
 
+    @cached_stats
     def get_month_completion_stats(self, year, month):
         """Get completion statistics for each day in the specified month."""
+        return self.get_completion_range(
+            f"{year}-{month:02d}-01",
+            f"{year}-{month:02d}-31"
+        )
+
+    @cached_stats
+    def get_completion_months(self, year, month, months):
+        """Get completion statistics for months consecutive months from year/month.
+
+        Returns {(year, month): {date: {'total': ..., 'completed': ...}}}
+        with an entry for every month, read with a single range query.
+        """
+        last_year, last_month = month_offset(year, month, months - 1)
+        stats = {month_offset(year, month, i): {} for i in range(months)}
+        for day, day_stats in self.get_completion_range(
+            f"{year}-{month:02d}-01", f"{last_year}-{last_month:02d}-31"
+        ).items():
+            stats[(int(day[:4]), int(day[5:7]))][day] = day_stats
+        return stats
+
+    def get_completion_range(self, start_date, end_date):
+        """Get completion statistics for each tracked day between two dates (inclusive)."""
         cursor = self.conn.cursor()
-        
         cursor.execute('''
-            WITH RECURSIVE dates(date) AS (
-                SELECT date(?, '-01')
-                UNION ALL
-                SELECT date(date, '+1 day')
-                FROM dates
-                WHERE strftime('%m', date) = strftime('%m', ?)
-            ),
-            daily_stats AS (
-                SELECT 
-                    p.date,
-                    COUNT(DISTINCT g.id) as total_games,
-                    COUNT(DISTINCT CASE WHEN p.completed = 1 THEN g.id END) as completed_games
-                FROM dates d
-                CROSS JOIN games g
-                LEFT JOIN progress p ON g.id = p.game_id AND p.date = d.date
-                GROUP BY d.date
-            )
-            SELECT 
-                date,
-                COALESCE(total_games, 0) as total_games,
-                COALESCE(completed_games, 0) as completed_games
-            FROM daily_stats
+            SELECT date, total_games, completed_games
+            FROM daily_summary
+            WHERE date BETWEEN ? AND ?
             ORDER BY date
-        ''', (f"{year}-{month:02d}", f"{year}-{month:02d}"))
+        ''', (start_date, end_date))
         
         return {row[0]: {'total': row[1], 'completed': row[2]} 
                 for row in cursor.fetchall()}
@@ -225,122 +622,259 @@ class DatabaseManager:
             results.append(game)
         return results
 
+    @cached_stats
     def get_current_streak(self):
         """Calculate current streak of consecutive days with completed games"""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            WITH RECURSIVE dates AS (
-                SELECT date('now', 'localtime') as date
-                UNION ALL
-                SELECT date(date, '-1 day')
-                FROM dates
-                WHERE EXISTS (
-                    SELECT 1 FROM progress 
-                    WHERE date = date(date, '-1 day')
-                    AND completed = 1
-                )
-            )
-            SELECT COUNT(*) FROM dates
-        """)
-        return cursor.fetchone()[0]
+        return self.streaks.current(self.conn.cursor())
 
+    @cached_stats
     def get_longest_streak(self):
         """Calculate longest streak of consecutive days with completed games"""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            WITH consecutive_days AS (
-                SELECT date,
-                       date(date, 
-                            '-' || ROW_NUMBER() OVER (ORDER BY date) || ' days'
-                       ) as grp
-                FROM progress
-                WHERE completed = 1
-                GROUP BY date
-            )
-            SELECT COUNT(*) as streak_length
-            FROM consecutive_days
-            GROUP BY grp
-            ORDER BY streak_length DESC
-            LIMIT 1
-        """)
-        result = cursor.fetchone()
-        return result[0] if result else 0
+        return self.streaks.longest(self.conn.cursor())
 
+    @cached_game_stats
+    def get_game_streak(self, game_id, history_limit=None):
+        """Get a game's (current, longest) streak and its runs of completed days.
+
+        Returns {'current': int, 'longest': int, 'runs': [(start_date,
+        end_date, length), ...]} with the most recent run first, capped at
+        history_limit runs.
+        """
+        return self._game_streak(self.conn.cursor(), game_id, history_limit)
+
+    def _game_streak(self, cursor, game_id, history_limit):
+        return {
+            'current': self.game_streaks.current(cursor, key=game_id),
+            'longest': self.game_streaks.longest(cursor, game_id),
+            'runs': [tuple(row) for row in self.game_streaks.runs(cursor, game_id, history_limit)],
+        }
+
+    @cached_stats
+    def get_game_streaks(self):
+        """Get {game_id: (current, longest)} streaks for every game"""
+        return self.game_streaks.by_key(self.conn.cursor(), 'SELECT id FROM games')
+
+    @cached_game_stats
     def get_game_stats(self, game_id=None):
-        """Get statistics for a specific game or all games"""
+        """Get statistics for a specific game or all games.
+
+        Rows are (id, name, score_type, times_completed, times_scored,
+        avg_score, best_score, best_score_date, worst_score,
+        worst_score_date, median_score), ordered by id. Scores come from
+        the numeric score_value; the dates are the first day each best and
+        worst score was reached.
+        """
         cursor = self.conn.cursor()
-        
+        score_filter = progress_filter = game_filter = ''
+        params = ()
         if game_id:
-            cursor.execute("""
-                SELECT g.name, g.score_type,
-                       COUNT(CASE WHEN p.completed = 1 THEN 1 END) as times_completed,
-                       COUNT(p.score) as times_scored,
-                       AVG(CASE WHEN p.score GLOB '*[0-9]*' AND p.score NOT GLOB '*[A-Za-z]*' 
-                               THEN CAST(p.score AS INTEGER) END) as avg_score,
-                       MAX(CASE WHEN p.score GLOB '*[0-9]*' AND p.score NOT GLOB '*[A-Za-z]*' 
-                               THEN CAST(p.score AS INTEGER) END) as best_score,
-                       (SELECT date 
-                        FROM progress 
-                        WHERE game_id = g.id 
-                        AND score = (SELECT MAX(score) FROM progress WHERE game_id = g.id)
-                        LIMIT 1) as best_score_date
-                FROM games g
-                LEFT JOIN progress p ON g.id = p.game_id
-                WHERE g.id = ?
-                GROUP BY g.id
-            """, (game_id,))
-        else:
-            cursor.execute("""
-                SELECT g.id, g.name, g.score_type,
-                       COUNT(CASE WHEN p.completed = 1 THEN 1 END) as times_completed,
-                       COUNT(p.score) as times_scored,
-                       AVG(CASE WHEN p.score GLOB '*[0-9]*' AND p.score NOT GLOB '*[A-Za-z]*' 
-                               THEN CAST(p.score AS INTEGER) END) as avg_score,
-                       MAX(CASE WHEN p.score GLOB '*[0-9]*' AND p.score NOT GLOB '*[A-Za-z]*' 
-                               THEN CAST(p.score AS INTEGER) END) as best_score,
-                       (SELECT date 
-                        FROM progress 
-                        WHERE game_id = g.id 
-                        AND score = (SELECT MAX(score) FROM progress WHERE game_id = g.id)
-                        LIMIT 1) as best_score_date
-                FROM games g
-                LEFT JOIN progress p ON g.id = p.game_id
-                GROUP BY g.id
-            """)
+            score_filter = 'AND game_id = ?'
+            progress_filter = 'WHERE game_id = ?'
+            game_filter = 'WHERE g.id = ?'
+            params = (game_id, game_id, game_id)
+
+        # Scores are ranked in one pass over the (game_id, score_value, date)
+        # index; the best and worst dates are then single index seeks per game
+        cursor.execute(f"""
+            WITH scores AS (
+                SELECT game_id, score_value,
+                       ROW_NUMBER() OVER by_score AS position,
+                       COUNT(*) OVER game AS scored
+                FROM progress
+                WHERE score_value IS NOT NULL
+                {score_filter}
+                WINDOW by_score AS (PARTITION BY game_id ORDER BY score_value),
+                       game AS (by_score ROWS BETWEEN UNBOUNDED PRECEDING
+                                AND UNBOUNDED FOLLOWING)
+            ),
+            score_stats AS (
+                SELECT game_id,
+                       AVG(score_value) AS avg_score,
+                       MAX(score_value) AS best_score,
+                       MIN(score_value) AS worst_score,
+                       AVG(CASE WHEN position IN ((scored + 1) / 2, (scored + 2) / 2)
+                                THEN score_value END) AS median_score
+                FROM scores
+                GROUP BY game_id
+            ),
+            counts AS (
+                SELECT game_id,
+                       COUNT(CASE WHEN completed = 1 THEN 1 END) AS times_completed,
+                       COUNT(score) AS times_scored
+                FROM progress
+                {progress_filter}
+                GROUP BY game_id
+            )
+            SELECT g.id, g.name, g.score_type,
+                   COALESCE(c.times_completed, 0) AS times_completed,
+                   COALESCE(c.times_scored, 0) AS times_scored,
+                   s.avg_score,
+                   s.best_score,
+                   (SELECT MIN(date) FROM progress
+                    WHERE game_id = g.id AND score_value = s.best_score) AS best_score_date,
+                   s.worst_score,
+                   (SELECT MIN(date) FROM progress
+                    WHERE game_id = g.id AND score_value = s.worst_score) AS worst_score_date,
+                   s.median_score
+            FROM games g
+            LEFT JOIN counts c ON c.game_id = g.id
+            LEFT JOIN score_stats s ON s.game_id = g.id
+            {game_filter}
+            ORDER BY g.id
+        """, params)
         
         return cursor.fetchall()
 
+    @cached_stats
+    def get_game_profile(self, game_id, scores_since=None, history_limit=50, streak_limit=10):
+        """Get everything the game detail view shows in one pass over the game's progress.
+
+        Returns a dict with:
+          'stats': the game's get_game_stats() row (id, name, score_type,
+                   times_completed, times_scored, avg_score, best_score,
+                   best_score_date, worst_score, worst_score_date, median_score)
+          'completion': (completed, total) as get_completion_percentage
+          'scores': get_score_series style (date, score, score, score, 1)
+                    tuples from scores_since (default: all), oldest first
+          'history': the first get_game_history_page of up to history_limit rows
+          'streak': get_game_streak with up to streak_limit runs
+        or None if the game doesn't exist.
+        """
+        cursor = self.conn.cursor()
+        cursor.execute('SELECT id, name, score_type FROM games WHERE id = ?', (game_id,))
+        game = cursor.fetchone()
+        if game is None:
+            return None
+        scores_since = to_date(scores_since).isoformat() if scores_since else ''
+
+        # Newest first, with whether any game was completed that day
+        cursor.execute("""
+            SELECT p.date, p.completed, p.score, p.note, p.score_value,
+                   COALESCE(s.completed_games, 0) > 0 AS active
+            FROM progress p
+            LEFT JOIN daily_summary s ON s.date = p.date
+            WHERE p.game_id = ?
+            ORDER BY p.date DESC
+        """, (game_id,))
+
+        times_completed = times_scored = completion_total = 0
+        best_score = best_date = worst_score = worst_date = None
+        values, scores, history = [], [], []
+        for day, completed, score, note, score_value, active in cursor:
+            if completed:
+                times_completed += 1
+                if len(history) < history_limit:
+                    history.append((day, completed, score, note))
+            if active:
+                completion_total += 1
+            if score is not None:
+                times_scored += 1
+            if score_value is not None:
+                values.append(score_value)
+                # Rows come newest first, so >= and <= keep the earliest dates
+                if best_score is None or score_value >= best_score:
+                    best_score, best_date = score_value, day
+                if worst_score is None or score_value <= worst_score:
+                    worst_score, worst_date = score_value, day
+                if day >= scores_since:
+                    scores.append((day, score_value, score_value, score_value, 1))
+        scores.reverse()
+
+        return {
+            'stats': (game[0], game[1], game[2], times_completed, times_scored,
+                      statistics.fmean(values) if values else None, best_score, best_date,
+                      worst_score, worst_date, statistics.median(values) if values else None),
+            'completion': (times_completed, completion_total),
+            'scores': scores,
+            'history': history,
+            'streak': self._game_streak(cursor, game_id, streak_limit),
+        }
 
     def get_monthly_scores(self, game_id, year, month):
         """Get daily scores for a game in the specified month"""
         cursor = self.conn.cursor()
         cursor.execute("""
-            SELECT date, score
+            SELECT date, score_value
             FROM progress
             WHERE game_id = ? 
-            AND strftime('%Y-%m', date) = ?
-            AND score IS NOT NULL
-            AND score GLOB '*[0-9]*' 
-            AND score NOT GLOB '*[A-Za-z]*'
+            AND date BETWEEN ? AND ?
+            AND score_value IS NOT NULL
             ORDER BY date
-        """, (game_id, f"{year}-{month:02d}"))
+        """, (game_id, f"{year}-{month:02d}-01", f"{year}-{month:02d}-31"))
         return cursor.fetchall()
 
-    def get_completion_percentage(self, game_id):
-        """Get completion percentage for days where any game was played"""
+    def get_score_series(self, game_id, start=None, end=None, max_points=200, method='buckets'):
+        """Get a game's numeric scores between two dates, downsampled to max_points.
+
+        Returns (date, mean, min, max, count) tuples in date order. Short
+        ranges come back as one tuple per score. Longer ones are either
+        aggregated into max_points equal-width date buckets in SQL
+        (method='buckets') or thinned with LTTB (method='lttb'), which keeps
+        individual points. start defaults to the game's first score and end
+        to today.
+        """
         cursor = self.conn.cursor()
+        if start is None:
+            cursor.execute(
+                'SELECT MIN(date) FROM progress WHERE game_id = ? AND score_value IS NOT NULL',
+                (game_id,)
+            )
+            start = cursor.fetchone()[0]
+            if start is None:
+                return []
+        start = to_date(start).isoformat()
+        end = to_date(end or date.today()).isoformat()
+
         cursor.execute("""
-            WITH active_days AS (
-                SELECT DISTINCT date
+            SELECT COUNT(*)
+            FROM progress
+            WHERE game_id = ?
+            AND date BETWEEN ? AND ?
+            AND score_value IS NOT NULL
+        """, (game_id, start, end))
+        count = cursor.fetchone()[0]
+
+        if count > max_points and method == 'buckets':
+            days = (to_date(end) - to_date(start)).days + 1
+            cursor.execute("""
+                SELECT MIN(date), AVG(score_value), MIN(score_value), MAX(score_value), COUNT(*)
                 FROM progress
-                WHERE completed = 1
-            )
-            SELECT 
+                WHERE game_id = ?
+                AND date BETWEEN ? AND ?
+                AND score_value IS NOT NULL
+                GROUP BY CAST((julianday(date) - julianday(?)) * ? / ? AS INTEGER)
+                ORDER BY 1
+            """, (game_id, start, end, start, max_points, days))
+            return [tuple(row) for row in cursor.fetchall()]
+
+        cursor.execute("""
+            SELECT date, score_value
+            FROM progress
+            WHERE game_id = ?
+            AND date BETWEEN ? AND ?
+            AND score_value IS NOT NULL
+            ORDER BY date
+        """, (game_id, start, end))
+        rows = cursor.fetchall()
+        if count > max_points and method == 'lttb':
+            points = [(to_date(row[0]).toordinal(), row[1]) for row in rows]
+            rows = [rows[i] for i in lttb(points, max_points)]
+        return [(row[0], row[1], row[1], row[1], 1) for row in rows]
+
+    @cached_stats
+    def get_completion_percentage(self, game_id):
+        """Get (completed, total) for a game over days where any game was completed"""
+        cursor = self.conn.cursor()
+        # daily_summary already knows which days were active, so only the
+        # game's own progress rows are read
+        cursor.execute("""
+            SELECT
                 COUNT(CASE WHEN p.completed = 1 THEN 1 END) as completed_count,
-                COUNT(p.date) as total_count
-            FROM active_days ad
-            LEFT JOIN progress p ON p.date = ad.date
+                COUNT(*) as total_count
+            FROM progress p
+            JOIN daily_summary s ON s.date = p.date
             WHERE p.game_id = ?
+            AND s.completed_games > 0
         """, (game_id,))
         return cursor.fetchone()
 
@@ -355,3 +889,32 @@ class DatabaseManager:
             ORDER BY date DESC
         """, (game_id,))
         return cursor.fetchall()
+
+    def get_game_history_page(self, game_id, before=None, limit=50):
+        """Get up to limit completed entries for a game older than the date before.
+
+        Pages are keyed on date rather than OFFSET, so each one is a single
+        index range scan however deep into the history it is. Pass the date
+        of the last row of a page as before to get the next one.
+        """
+        cursor = self.conn.cursor()
+        if before is None:
+            cursor.execute("""
+                SELECT date, completed, score, note
+                FROM progress
+                WHERE game_id = ?
+                AND completed = 1
+                ORDER BY date DESC
+                LIMIT ?
+            """, (game_id, limit))
+        else:
+            cursor.execute("""
+                SELECT date, completed, score, note
+                FROM progress
+                WHERE game_id = ?
+                AND date < ?
+                AND completed = 1
+                ORDER BY date DESC
+                LIMIT ?
+            """, (game_id, str(before), limit))
+        return cursor.fetchall()
@@ -0,0 +1,99 @@
+import sys
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+class QuerySignals(QObject):
+    finished = pyqtSignal(str, int, object)
+    failed = pyqtSignal(str, int, object)
+
+
+class QueryTask(QRunnable):
+    def __init__(self, executor, key, generation, query, args):
+        super().__init__()
+        self.executor = executor
+        self.key = key
+        self.generation = generation
+        self.query = query
+        self.args = args
+        self.signals = QuerySignals()
+
+    def run(self):
+        try:
+            with self.executor.db.readers.acquire() as reader:
+                result = self.query(reader, *self.args)
+        except Exception as error:
+            self.signals.failed.emit(self.key, self.generation, error)
+        else:
+            self.signals.finished.emit(self.key, self.generation, result)
+
+
+class QueryExecutor(QObject):
+    """Runs DatabaseManager queries on a thread pool and hands results back on the UI thread.
+
+    Each request has a key; submitting a new request under the same key
+    makes any earlier one stale, so its result is dropped instead of
+    overwriting newer data (e.g. rapid clicks on calendar days).
+
+        executor.submit('day_games', lambda db: db.get_day_games(day), self.show_games)
+
+    Queries receive a read-only DatabaseManager borrowed from the
+    manager's reader pool for the duration of the call.
+    """
+
+    def __init__(self, db_manager, max_threads=2, parent=None):
+        super().__init__(parent)
+        self.db = db_manager
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_threads)
+        self._generations = {}
+        self._pending = {}
+
+    def submit(self, key, query, *args, on_result=None, on_error=None):
+        """Run query(reader, *args) in the background and pass its result to on_result"""
+        self.cancel(key)
+        generation = self._generations.get(key, 0)
+
+        task = QueryTask(self, key, generation, query, args)
+        task.signals.finished.connect(self._deliver)
+        task.signals.failed.connect(self._fail)
+        self._pending[key] = (task, on_result, on_error)
+        self.pool.start(task)
+        return generation
+
+    def cancel(self, key):
+        """Drop the outstanding request for key, skipping it if it hasn't started yet"""
+        self._generations[key] = self._generations.get(key, 0) + 1
+        pending = self._pending.pop(key, None)
+        if pending:
+            try:
+                self.pool.tryTake(pending[0])
+            except RuntimeError:
+                # The task already ran and the pool deleted it
+                pass
+
+    def is_pending(self, key):
+        return key in self._pending
+
+    def shutdown(self):
+        for key in list(self._pending):
+            self.cancel(key)
+        self.pool.waitForDone()
+
+    def _take(self, key, generation):
+        if self._generations.get(key) != generation or key not in self._pending:
+            return None
+        return self._pending.pop(key)
+
+    def _deliver(self, key, generation, result):
+        pending = self._take(key, generation)
+        if pending and pending[1]:
+            pending[1](result)
+
+    def _fail(self, key, generation, error):
+        pending = self._take(key, generation)
+        if not pending:
+            return
+        if pending[2]:
+            pending[2](error)
+        else:
+            print(f"Query '{key}' failed: {error}", file=sys.stderr)
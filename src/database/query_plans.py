@@ -0,0 +1,122 @@
+"""Query plan regression check for DatabaseManager.
+
+Builds a synthetic database, runs every DatabaseManager query against it
+while recording the SQL that reaches SQLite, and prints the EXPLAIN QUERY
+PLAN of each statement. Exits with status 1 if a hot query scans one of
+the history tables, unless it is listed in SCAN_ALLOWED.
+
+Run from the src directory:
+
+    python -m database.query_plans [--games N] [--years N]
+"""
+import argparse
+import sys
+from datetime import date, timedelta
+
+from database.db_manager import DatabaseManager, MEMORY_PATH
+from benchmarks.dataset import generate_dataset
+
+# Tables that grow with history; scanning them is a regression
+HISTORY_TABLES = ('progress', 'daily_summary', 'streak_runs', 'game_streak_runs')
+
+# Queries that summarise every game's whole history and so must read all of it
+SCAN_ALLOWED = {
+    'get_game_stats',
+    # Every game counts towards every summarised day, so removing one
+    # updates them all
+    'delete_game',
+}
+
+
+def hot_queries(db, game_id):
+    """Call every query the UI runs, keyed by a readable name"""
+    today = date.today()
+    return {
+        'get_daily_progress': lambda: db.get_daily_progress(today),
+        'get_day_games': lambda: db.get_day_games(today.isoformat()),
+        'get_month_completion_stats': lambda: db.get_month_completion_stats(today.year, today.month),
+        'get_completion_range': lambda: db.get_completion_range(
+            (today - timedelta(days=90)).isoformat(), today.isoformat()
+        ),
+        'get_completion_months': lambda: db.get_completion_months(today.year, 1, 12),
+        'get_current_streak': db.get_current_streak,
+        'get_longest_streak': db.get_longest_streak,
+        'get_game_streak': lambda: db.get_game_streak(game_id, 10),
+        'get_game_streaks': db.get_game_streaks,
+        'get_game_stats': db.get_game_stats,
+        'get_game_stats(game_id)': lambda: db.get_game_stats(game_id),
+        'get_monthly_scores': lambda: db.get_monthly_scores(game_id, today.year, today.month),
+        'get_score_series': lambda: db.get_score_series(game_id, None, None, 100),
+        'get_game_profile': lambda: db.get_game_profile(game_id),
+        'get_completion_percentage': lambda: db.get_completion_percentage(game_id),
+        'get_game_history': lambda: db.get_game_history(game_id),
+        'get_game_history_page': lambda: db.get_game_history_page(game_id, today.isoformat()),
+        'update_game_progress': lambda: db.update_game_progress(game_id, today, True, '7', None),
+        'delete_game': lambda: db.delete_game(game_id),
+    }
+
+
+def capture_statements(db, call):
+    statements = []
+    db.conn.set_trace_callback(statements.append)
+    try:
+        call()
+    finally:
+        db.conn.set_trace_callback(None)
+    return [
+        sql for sql in statements
+        if sql.lstrip().split(None, 1)[0].upper() in ('SELECT', 'WITH', 'INSERT', 'UPDATE', 'DELETE')
+    ]
+
+
+def full_scans(plan):
+    """Return plan lines that scan a history table, with or without an index.
+
+    Scanning a covering index still reads every row of the table, so only
+    SEARCH (an index seek or range) counts as using the index.
+    """
+    scans = []
+    for detail in plan:
+        words = detail.split()
+        if len(words) >= 2 and words[0] == 'SCAN' and words[1] in HISTORY_TABLES:
+            scans.append(detail)
+    return scans
+
+
+def check(db, game_id, verbose=False):
+    failures = []
+    for name, call in hot_queries(db, game_id).items():
+        for sql in capture_statements(db, call):
+            plan = [row[3] for row in db.conn.execute('EXPLAIN QUERY PLAN ' + sql)]
+            scans = [] if name in SCAN_ALLOWED else full_scans(plan)
+            if verbose or scans:
+                print(f"{'FAIL' if scans else 'ok  '} {name}")
+                for detail in plan:
+                    print(f"       {detail}")
+            if scans:
+                failures.append((name, sql, scans))
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--games', type=int, default=20)
+    parser.add_argument('--years', type=float, default=1.0)
+    parser.add_argument('-v', '--verbose', action='store_true')
+    args = parser.parse_args(argv)
+
+    db = DatabaseManager(MEMORY_PATH)
+    game_ids = generate_dataset(db, games=args.games, years=args.years)
+    db.conn.execute('ANALYZE')
+    failures = check(db, game_ids[len(game_ids) // 2], args.verbose)
+    db.close()
+
+    if failures:
+        print(f"{len(failures)} statement(s) do a full table scan")
+        return 1
+    print("No full table scans on hot queries")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
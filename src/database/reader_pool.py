@@ -0,0 +1,47 @@
+import queue
+import threading
+from contextlib import contextmanager
+
+
+class ReaderPool:
+    """A fixed-size pool of read-only DatabaseManager instances.
+
+    Connections are opened lazily up to size and handed to one thread at a
+    time; acquire() blocks while all of them are in use. In WAL mode these
+    readers see the last committed state and never wait on the writer.
+    """
+
+    def __init__(self, factory, size=2):
+        self.factory = factory
+        self.size = size
+        self._idle = queue.LifoQueue()
+        self._all = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def acquire(self, timeout=None):
+        reader = self._checkout(timeout)
+        try:
+            yield reader
+        finally:
+            self._idle.put(reader)
+
+    def _checkout(self, timeout):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if len(self._all) < self.size:
+                reader = self.factory()
+                self._all.append(reader)
+                return reader
+        return self._idle.get(timeout=timeout)
+
+    def close(self):
+        with self._lock:
+            for reader in self._all:
+                reader.close()
+            self._all.clear()
+        while not self._idle.empty():
+            self._idle.get_nowait()
@@ -0,0 +1,40 @@
+def lttb(points, threshold):
+    """Largest-Triangle-Three-Buckets downsampling of (x, y) points.
+
+    Keeps the first and last points and, from each of threshold - 2 equal
+    buckets in between, the point forming the largest triangle with the
+    previously kept point and the average of the next bucket. That keeps
+    the visual shape of the line (peaks and dips) with far fewer points.
+    Returns the indexes of the points to keep.
+    """
+    count = len(points)
+    if threshold >= count or threshold < 3:
+        return list(range(count))
+
+    kept = [0]
+    bucket_size = (count - 2) / (threshold - 2)
+    previous = 0
+    for bucket in range(threshold - 2):
+        start = int(bucket * bucket_size) + 1
+        end = int((bucket + 1) * bucket_size) + 1
+
+        # Average of the next bucket (or the last point for the final bucket)
+        next_start = end
+        next_end = min(int((bucket + 2) * bucket_size) + 1, count)
+        if next_start >= next_end:
+            next_start, next_end = count - 1, count
+        avg_x = sum(points[i][0] for i in range(next_start, next_end)) / (next_end - next_start)
+        avg_y = sum(points[i][1] for i in range(next_start, next_end)) / (next_end - next_start)
+
+        prev_x, prev_y = points[previous]
+        best, best_area = start, -1.0
+        for i in range(start, min(end, count - 1)):
+            x, y = points[i]
+            area = abs((prev_x - avg_x) * (y - prev_y) - (prev_x - x) * (avg_y - prev_y))
+            if area > best_area:
+                best, best_area = i, area
+        kept.append(best)
+        previous = best
+
+    kept.append(count - 1)
+    return kept
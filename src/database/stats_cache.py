@@ -0,0 +1,122 @@
+import functools
+import threading
+from collections import OrderedDict
+from datetime import date
+
+
+class StatsCache:
+    """LRU cache of query results tagged with a write generation.
+
+    Every write bumps the generation, and an entry computed under an older
+    generation is treated as a miss, so results never outlive the data they
+    were computed from.
+
+    It also counts writes per game, so views built from one game's data
+    can tell whether that game has changed since (see game_generation),
+    and entries computed from a single game's rows can be tagged with that
+    instead, surviving writes to other games.
+    """
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self._epoch = 0
+        self._game_generations = {}
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def bump(self):
+        with self._lock:
+            self.generation += 1
+
+    def touch_games(self, game_ids=None):
+        """Record a write to the given games, or to every game if game_ids is None"""
+        with self._lock:
+            if game_ids is None:
+                self._epoch += 1
+                return
+            for game_id in game_ids:
+                self._game_generations[game_id] = self._game_generations.get(game_id, 0) + 1
+
+    def game_generation(self, game_id):
+        """A value that changes whenever game_id's progress is written"""
+        with self._lock:
+            return (self._epoch, self._game_generations.get(game_id, 0))
+
+    def get_or_compute(self, key, compute, game_id=None):
+        """The cached value for key, or compute() stored under the current generation.
+
+        With game_id the entry is only invalidated by writes to that game.
+        """
+        with self._lock:
+            if game_id is None:
+                generation = self.generation
+            else:
+                generation = (self._epoch, self._game_generations.get(game_id, 0))
+            entry = self._entries.get(key)
+            if entry and entry[0] == generation:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        value = compute()
+
+        with self._lock:
+            current = self._entries.get(key)
+            if current and current[0] > generation:
+                return value
+            self._entries[key] = (generation, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def info(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'generation': self.generation
+            }
+
+
+def cached_stats(method):
+    """Cache a DatabaseManager query per arguments in its stats_cache.
+
+    The current date is part of the key because results such as the
+    current streak change at midnight without any write.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args):
+        self.check_external_writes()
+        key = (method.__name__, args, date.today())
+        return self.stats_cache.get_or_compute(key, lambda: method(self, *args))
+    return wrapper
+
+
+def cached_game_stats(method):
+    """cached_stats for a query that only reads the rows of the game passed first.
+
+    Its entries are tagged with that game's generation, so a write to
+    another game keeps them. Called without a game it caches like
+    cached_stats.
+    """
+    @functools.wraps(method)
+    def wrapper(self, game_id=None, *args):
+        self.check_external_writes()
+        key = (method.__name__, (game_id,) + args, date.today())
+        return self.stats_cache.get_or_compute(
+            key, lambda: method(self, game_id, *args), game_id or None
+        )
+    return wrapper
@@ -0,0 +1,220 @@
+from datetime import date, timedelta
+
+
+def to_date(value):
+    """Convert a date, datetime or ISO string to a date"""
+    if isinstance(value, date):
+        return date(value.year, value.month, value.day)
+    return date.fromisoformat(str(value)[:10])
+
+
+class StreakRuns:
+    """Runs of consecutive completed days stored as (start_date, end_date) rows.
+
+    Every write only touches the runs next to the changed day, so adding or
+    removing a day (including back-dated edits that merge or split runs) and
+    reading the current or longest streak never scan the whole history.
+
+    With a key_column the table holds a separate set of runs per key (e.g.
+    per game_id), and every method takes the key to work on.
+    """
+
+    def __init__(self, table='streak_runs', key_column=None):
+        self.table = table
+        self.key_column = key_column
+
+    def create_table(self, cursor):
+        if self.key_column:
+            cursor.execute(f'''
+                CREATE TABLE IF NOT EXISTS {self.table} (
+                    {self.key_column} INTEGER NOT NULL,
+                    start_date DATE NOT NULL,
+                    end_date DATE NOT NULL,
+                    length INTEGER NOT NULL,
+                    PRIMARY KEY ({self.key_column}, start_date)
+                )
+            ''')
+        else:
+            cursor.execute(f'''
+                CREATE TABLE IF NOT EXISTS {self.table} (
+                    start_date DATE PRIMARY KEY,
+                    end_date DATE NOT NULL,
+                    length INTEGER NOT NULL
+                )
+            ''')
+        prefix = f'{self.key_column}, ' if self.key_column else ''
+        cursor.execute(f'''
+            CREATE INDEX IF NOT EXISTS idx_{self.table}_end_date
+            ON {self.table} ({prefix}end_date)
+        ''')
+        cursor.execute(f'''
+            CREATE INDEX IF NOT EXISTS idx_{self.table}_length
+            ON {self.table} ({prefix}length)
+        ''')
+
+    def _key(self, key):
+        """SQL condition and parameters selecting key's runs ('' for an unkeyed table)"""
+        if self.key_column:
+            return f'{self.key_column} = ? AND ', (key,)
+        return '', ()
+
+    def find_run(self, cursor, day, key=None):
+        """Return the (start, end) run containing day, or None"""
+        condition, params = self._key(key)
+        cursor.execute(f'''
+            SELECT start_date, end_date
+            FROM {self.table}
+            WHERE {condition}start_date <= ?
+            ORDER BY start_date DESC
+            LIMIT 1
+        ''', params + (day.isoformat(),))
+        row = cursor.fetchone()
+        if row and row[1] >= day.isoformat():
+            return to_date(row[0]), to_date(row[1])
+        return None
+
+    def add_day(self, cursor, value, key=None):
+        day = to_date(value)
+        if self.find_run(cursor, day, key):
+            return
+
+        condition, params = self._key(key)
+        start = end = day
+        cursor.execute(
+            f'SELECT start_date FROM {self.table} WHERE {condition}end_date = ?',
+            params + ((day - timedelta(days=1)).isoformat(),)
+        )
+        before = cursor.fetchone()
+        if before:
+            start = to_date(before[0])
+            self._delete(cursor, start, key)
+
+        cursor.execute(
+            f'SELECT end_date FROM {self.table} WHERE {condition}start_date = ?',
+            params + ((day + timedelta(days=1)).isoformat(),)
+        )
+        after = cursor.fetchone()
+        if after:
+            end = to_date(after[0])
+            self._delete(cursor, day + timedelta(days=1), key)
+
+        self._insert(cursor, start, end, key)
+
+    def remove_day(self, cursor, value, key=None):
+        day = to_date(value)
+        run = self.find_run(cursor, day, key)
+        if not run:
+            return
+
+        start, end = run
+        self._delete(cursor, start, key)
+        if start < day:
+            self._insert(cursor, start, day - timedelta(days=1), key)
+        if day < end:
+            self._insert(cursor, day + timedelta(days=1), end, key)
+
+    def clear(self, cursor, key=None):
+        """Delete every run, or only key's runs on a keyed table"""
+        if self.key_column and key is not None:
+            cursor.execute(f'DELETE FROM {self.table} WHERE {self.key_column} = ?', (key,))
+        else:
+            cursor.execute(f'DELETE FROM {self.table}')
+
+    def rebuild(self, cursor, days, key=None):
+        """Replace all runs (of key) with those formed by the given completed days"""
+        self.clear(cursor, key)
+        start = end = None
+        for day in sorted(set(to_date(d) for d in days)):
+            if end and day == end + timedelta(days=1):
+                end = day
+                continue
+            if start:
+                self._insert(cursor, start, end, key)
+            start = end = day
+        if start:
+            self._insert(cursor, start, end, key)
+
+    def current(self, cursor, today=None, key=None):
+        """Length of the run ending today, or yesterday if today isn't done yet"""
+        today = to_date(today or date.today())
+        condition, params = self._key(key)
+        cursor.execute(f'''
+            SELECT start_date, end_date
+            FROM {self.table}
+            WHERE {condition}end_date >= ?
+            AND start_date <= ?
+            ORDER BY end_date
+            LIMIT 1
+        ''', params + ((today - timedelta(days=1)).isoformat(), today.isoformat()))
+        row = cursor.fetchone()
+        if not row:
+            return 0
+        end = min(to_date(row[1]), today)
+        return (end - to_date(row[0])).days + 1
+
+    def longest(self, cursor, key=None):
+        condition, params = self._key(key)
+        cursor.execute(
+            f'SELECT MAX(length) FROM {self.table} WHERE {condition}1',
+            params
+        )
+        result = cursor.fetchone()
+        return result[0] or 0
+
+    def runs(self, cursor, key=None, limit=None):
+        """Runs as (start_date, end_date, length), most recent first"""
+        condition, params = self._key(key)
+        cursor.execute(f'''
+            SELECT start_date, end_date, length
+            FROM {self.table}
+            WHERE {condition}1
+            ORDER BY start_date DESC
+            LIMIT ?
+        ''', params + (-1 if limit is None else limit,))
+        return cursor.fetchall()
+
+    def by_key(self, cursor, keys, today=None):
+        """{key: (current, longest)} for each key returned by the SQL query keys.
+
+        Each key costs two index seeks, so this stays cheap however long
+        the history is. Keys without any runs map to (0, 0).
+        """
+        today = to_date(today or date.today())
+        cursor.execute(f'''
+            WITH k(key) AS ({keys})
+            SELECT k.key,
+                   (SELECT CAST(julianday(MIN(r.end_date, :today))
+                                - julianday(r.start_date) AS INTEGER) + 1
+                    FROM {self.table} r
+                    WHERE r.{self.key_column} = k.key
+                    AND r.end_date >= :yesterday
+                    AND r.start_date <= :today
+                    ORDER BY r.end_date
+                    LIMIT 1),
+                   (SELECT MAX(r.length)
+                    FROM {self.table} r
+                    WHERE r.{self.key_column} = k.key)
+            FROM k
+        ''', {'today': today.isoformat(),
+              'yesterday': (today - timedelta(days=1)).isoformat()})
+        return {row[0]: (row[1] or 0, row[2] or 0) for row in cursor.fetchall()}
+
+    def _insert(self, cursor, start, end, key=None):
+        if self.key_column:
+            cursor.execute(
+                f'''INSERT INTO {self.table} ({self.key_column}, start_date, end_date, length)
+                    VALUES (?, ?, ?, ?)''',
+                (key, start.isoformat(), end.isoformat(), (end - start).days + 1)
+            )
+        else:
+            cursor.execute(
+                f'INSERT INTO {self.table} (start_date, end_date, length) VALUES (?, ?, ?)',
+                (start.isoformat(), end.isoformat(), (end - start).days + 1)
+            )
+
+    def _delete(self, cursor, start, key=None):
+        condition, params = self._key(key)
+        cursor.execute(
+            f'DELETE FROM {self.table} WHERE {condition}start_date = ?',
+            params + (start.isoformat(),)
+        )
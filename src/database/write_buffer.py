@@ -0,0 +1,73 @@
+import atexit
+import threading
+from database.streaks import to_date
+
+
+class WriteBehindBuffer:
+    """Collects progress updates and writes them to the database in batches.
+
+    Only the latest state per (game_id, date) is kept, so a burst of edits
+    to one game becomes a single row in the next flush. Pending entries can
+    be read back with pending() so the UI shows what the user entered even
+    before it reaches the database. on_pending is called whenever a new
+    entry arrives, letting the owner schedule a flush (e.g. with a QTimer).
+    Anything still pending when the interpreter exits is flushed then.
+    """
+
+    def __init__(self, db_manager, on_pending=None):
+        self.db = db_manager
+        self.on_pending = on_pending
+        self._pending = {}
+        self._lock = threading.Lock()
+        atexit.register(self.flush)
+
+    def put(self, game_id, date, completed, score=None, note=None):
+        key = (game_id, to_date(date).isoformat())
+        with self._lock:
+            self._pending[key] = {
+                'completed': completed,
+                'score': score,
+                'note': note
+            }
+        if self.on_pending:
+            self.on_pending()
+
+    def pending(self, game_id, date):
+        """The unwritten state for a game on a date, or None"""
+        with self._lock:
+            return self._pending.get((game_id, to_date(date).isoformat()))
+
+    def pending_for_date(self, date):
+        """Unwritten states on a date keyed by game id"""
+        day = to_date(date).isoformat()
+        with self._lock:
+            return {game_id: entry for (game_id, entry_day), entry in self._pending.items()
+                    if entry_day == day}
+
+    def flush(self):
+        """Write everything pending in one transaction; returns the number of rows"""
+        with self._lock:
+            batch, self._pending = self._pending, {}
+        if not batch:
+            return 0
+
+        try:
+            self.db.update_game_progress_many([
+                (game_id, day, entry['completed'], entry['score'], entry['note'])
+                for (game_id, day), entry in batch.items()
+            ])
+        except Exception:
+            # Put the batch back without overwriting anything newer
+            with self._lock:
+                for key, entry in batch.items():
+                    self._pending.setdefault(key, entry)
+            raise
+        return len(batch)
+
+    def close(self):
+        self.flush()
+        atexit.unregister(self.flush)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._pending)
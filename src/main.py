@@ -1,14 +1,56 @@
 import sys
 import os
+import time
+
+# Taken before the Qt and UI imports so --profile-startup can report their cost
+STARTUP_TIME = time.perf_counter()
+
 from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QObject, QEvent, QTimer
 from ui.main_window import MainWindow
 
+IMPORTED_TIME = time.perf_counter()
+
+
+class FirstPaintProfiler(QObject):
+    """Reports startup timings once the main window has painted, then quits"""
+
+    def __init__(self, app, window_created_time):
+        super().__init__()
+        self.app = app
+        self.window_created_time = window_created_time
+        self.reported = False
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint and not self.reported:
+            self.reported = True
+            # Let this paint finish before reporting and quitting
+            QTimer.singleShot(0, self.report)
+        return False
+
+    def report(self):
+        painted = time.perf_counter()
+        print(f"imports:        {(IMPORTED_TIME - STARTUP_TIME) * 1000:8.1f} ms")
+        print(f"main window:    {(self.window_created_time - IMPORTED_TIME) * 1000:8.1f} ms")
+        print(f"first paint:    {(painted - STARTUP_TIME) * 1000:8.1f} ms")
+        loaded = [name for name in ('matplotlib', 'numpy') if name in sys.modules]
+        print(f"heavy modules:  {', '.join(loaded) or 'none'}")
+        self.app.quit()
+
+
 def main():
     # Force X11 backend for WSL
     os.environ["QT_QPA_PLATFORM"] = "xcb"
     
+    profile_startup = '--profile-startup' in sys.argv
+    if profile_startup:
+        sys.argv.remove('--profile-startup')
+
     app = QApplication(sys.argv)
     window = MainWindow()
+    if profile_startup:
+        profiler = FirstPaintProfiler(app, time.perf_counter())
+        window.main_menu_page.installEventFilter(profiler)
     window.show()
     sys.exit(app.exec())
 
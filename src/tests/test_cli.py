@@ -0,0 +1,69 @@
+import json
+from datetime import datetime
+
+import pytest
+
+import cli
+from database.db_manager import DatabaseManager
+from models.game import Game
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / 'games.db')
+    db = DatabaseManager(path)
+    for name in ('Wordle', 'Connections'):
+        db.add_game(Game(id=None, name=name, url="", description="", score_type="6",
+                         reminder_time=None, created_at=datetime(2024, 1, 1)))
+    db.close()
+    return path
+
+
+def run(db_path, *argv):
+    return cli.main(['--db', db_path, *argv])
+
+
+def test_complete_by_name_and_id(db_path, capsys):
+    assert run(db_path, 'complete', 'wordle', '--score', '4', '--date', '2024-03-01') == 0
+    assert capsys.readouterr().out == "[x] Wordle  4/6\n"
+
+    # Connections is id 2; --undo keeps the score written before it
+    assert run(db_path, 'score', '2', '3', '--date', '2024-03-01') == 0
+    assert run(db_path, 'complete', '2', '--undo', '--date', '2024-03-01') == 0
+    assert capsys.readouterr().out.splitlines()[-1] == "[ ] Connections  3/6"
+
+    assert run(db_path, '--json', 'today', '--date', '2024-03-01') == 0
+    result = json.loads(capsys.readouterr().out)
+    assert [(game['name'], game['completed'], game['score']) for game in result['games']] == \
+        [('Connections', 0, '3'), ('Wordle', 1, '4')]
+
+
+def test_rebuild_and_streak(db_path, capsys):
+    for day in ('2024-03-01', '2024-03-02', '2024-03-04'):
+        run(db_path, 'complete', 'Wordle', '--date', day)
+    capsys.readouterr()
+
+    assert run(db_path, '--json', 'rebuild') == 0
+    assert json.loads(capsys.readouterr().out)['longest'] == 2
+    assert run(db_path, '--json', 'streak', 'Wordle') == 0
+    assert [run_['length'] for run_ in json.loads(capsys.readouterr().out)['runs']] == [1, 2]
+
+
+def test_errors(db_path, tmp_path, capsys):
+    assert run(db_path, 'complete', 'Crossword') == 1
+    assert capsys.readouterr().err == "error: no game named Crossword\n"
+    assert cli.main(['--db', str(tmp_path / 'missing.db'), 'today']) == 1
+    assert "no database" in capsys.readouterr().err
+
+    db = DatabaseManager(db_path)
+    db.add_game(Game(id=None, name="wordle", url="", description="", score_type="6",
+                     reminder_time=None, created_at=datetime(2024, 1, 1)))
+    db.close()
+    assert run(db_path, 'note', 'Wordle', 'hi') == 1
+    assert "(ids 1, 3); use the id" in capsys.readouterr().err
+    assert run(db_path, 'note', '3', 'hi') == 0
+
+    for argv in (['today', '--date', '2024-13-01'], ['month', '2024-13']):
+        with pytest.raises(SystemExit) as exit:
+            run(db_path, *argv)
+        assert exit.value.code == 2
@@ -0,0 +1,80 @@
+import random
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from database.db_manager import DatabaseManager, MEMORY_PATH
+from models.game import Game
+
+
+def make_game(created_at=datetime(2024, 1, 1)):
+    return Game(id=None, name="game", url="", description="", score_type="10",
+                reminder_time=None, created_at=created_at)
+
+
+def snapshot(db):
+    """Every table DatabaseManager maintains incrementally"""
+    return {
+        table: [tuple(row) for row in db.conn.execute(f'SELECT * FROM {table} ORDER BY 1, 2')]
+        for table in ('daily_summary', 'streak_runs', 'game_streak_runs')
+    }
+
+
+def rebuilt(db):
+    db.rebuild_daily_summary()
+    db.rebuild_streaks()
+    db.rebuild_game_streaks()
+    return snapshot(db)
+
+
+@pytest.fixture
+def db():
+    db = DatabaseManager(MEMORY_PATH)
+    yield db
+    db.close()
+
+
+def test_deleting_the_only_game_with_progress_drops_the_day(db):
+    db.add_game(make_game())
+    only = db.add_game(make_game())
+    db.update_game_progress(only, date(2024, 1, 10), False, None, None)
+
+    db.delete_game(only)
+
+    assert db.get_completion_range('2024-01-01', '2024-01-31') == {}
+    assert snapshot(db) == rebuilt(db)
+
+
+def test_every_game_counts_towards_every_day(db):
+    first = db.add_game(make_game(datetime(2024, 1, 1)))
+    db.update_game_progress(first, date(2024, 1, 5), True, None, None)
+    db.add_game(make_game(datetime(2024, 2, 1)))
+
+    # A game added later still counts on earlier days, as the calendar always did
+    assert db.get_completion_range('2024-01-01', '2024-01-31') == {
+        '2024-01-05': {'total': 2, 'completed': 1}
+    }
+    assert snapshot(db) == rebuilt(db)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_incremental_maintenance_matches_a_rebuild(db, seed):
+    rng = random.Random(seed)
+    start = date(2024, 1, 1)
+    game_ids = []
+    for _ in range(600):
+        roll = rng.random()
+        if roll < 0.05 or not game_ids:
+            created = datetime(2024, 1, 1) + timedelta(days=rng.randint(0, 40))
+            game_ids.append(db.add_game(make_game(created)))
+        elif roll < 0.09 and len(game_ids) > 1:
+            game_id = rng.choice(game_ids)
+            game_ids.remove(game_id)
+            db.delete_game(game_id)
+        else:
+            db.update_game_progress(
+                rng.choice(game_ids), start + timedelta(days=rng.randint(0, 60)),
+                rng.random() < 0.6, str(rng.randint(0, 10)), None
+            )
+
+    assert snapshot(db) == rebuilt(db)
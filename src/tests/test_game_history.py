@@ -0,0 +1,40 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from database.db_manager import DatabaseManager, MEMORY_PATH
+from models.game import Game
+
+
+@pytest.fixture
+def db():
+    db = DatabaseManager(MEMORY_PATH)
+    yield db
+    db.close()
+
+
+def test_history_pages_follow_the_date_cursor(db):
+    game_id = db.add_game(Game(id=None, name="game", url="", description="", score_type="10",
+                               reminder_time=None, created_at=datetime(2024, 1, 1)))
+    other = db.add_game(Game(id=None, name="other", url="", description="", score_type="10",
+                             reminder_time=None, created_at=datetime(2024, 1, 1)))
+    start = date(2024, 1, 1)
+    for offset in range(20):
+        # Every other day completed; the other game on the same days must not leak in
+        day = start + timedelta(days=offset)
+        db.update_game_progress(game_id, day, offset % 2 == 0, str(offset % 10), None)
+        db.update_game_progress(other, day, True, None, None)
+
+    pages = [db.get_game_history_page(game_id, limit=4)]
+    for _ in range(5):  # Bounded, so a cursor that doesn't advance fails instead of hanging
+        page = db.get_game_history_page(game_id, before=pages[-1][-1][0], limit=4)
+        if not page:
+            break
+        pages.append(page)
+
+    # 10 completed days in pages of 4 end with a short page
+    assert [len(page) for page in pages] == [4, 4, 2]
+    dates = [row[0] for page in pages for row in page]
+    assert dates == sorted(set(dates), reverse=True)
+    assert [tuple(row) for page in pages for row in page] == \
+        [tuple(row) for row in db.get_game_history(game_id)]
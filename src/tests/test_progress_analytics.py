@@ -0,0 +1,62 @@
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pytest
+
+from analytics import ProgressAnalytics
+from benchmarks.dataset import generate_dataset
+from database.db_manager import DatabaseManager, MEMORY_PATH
+from models.game import Game
+
+
+@pytest.fixture
+def db():
+    db = DatabaseManager(MEMORY_PATH)
+    yield db
+    db.close()
+
+
+def assert_same(analytics, fresh):
+    assert analytics.game_ids == fresh.game_ids
+    for got, expected in zip(analytics.activity(60), fresh.activity(60)):
+        np.testing.assert_array_equal(got, expected)
+    assert analytics.completion_rates(date.today() - timedelta(days=59)) == \
+        fresh.completion_rates(date.today() - timedelta(days=59))
+
+
+def test_deleted_games_leave_the_arrays(db):
+    game_ids = generate_dataset(db, games=5, years=0.2, seed=0)
+    analytics = ProgressAnalytics(db)
+
+    db.delete_game(game_ids[1])
+
+    assert game_ids[1] not in analytics.game_ids
+    assert game_ids[1] not in analytics.completion_rates(date.today() - timedelta(days=30))
+    assert_same(analytics, ProgressAnalytics(db))
+
+
+class WritingSource:
+    """A load source that commits a write through db as the load starts reading"""
+
+    def __init__(self, db, reader, write):
+        self.db, self.reader, self.write = db, reader, write
+
+    @property
+    def conn(self):
+        self.write()
+        return self.reader.conn
+
+
+def test_writes_during_a_load_are_replayed(db):
+    game_ids = generate_dataset(db, games=3, years=0.1, seed=0)
+    game = Game(id=None, name="late", url="", description="", score_type="10",
+                reminder_time=None, created_at=datetime(2024, 1, 1))
+
+    def write():
+        db.update_game_progress(game_ids[0], date.today(), True, "9", None)
+        db.add_game(game)
+
+    with db.readers.acquire() as reader:
+        analytics = ProgressAnalytics(db, source=WritingSource(db, reader, write))
+
+    assert_same(analytics, ProgressAnalytics(db))
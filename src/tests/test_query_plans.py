@@ -0,0 +1,41 @@
+import pytest
+
+from benchmarks.dataset import generate_dataset
+from database.db_manager import DatabaseManager, MEMORY_PATH
+from database.query_plans import check, full_scans
+
+
+@pytest.fixture
+def dataset():
+    db = DatabaseManager(MEMORY_PATH)
+    game_ids = generate_dataset(db, games=10, years=0.5, seed=0)
+    db.conn.execute('ANALYZE')
+    yield db, game_ids[len(game_ids) // 2]
+    db.close()
+
+
+def test_full_scans_counts_covering_index_scans():
+    plan = ['SCAN progress USING COVERING INDEX idx_progress_date_completed',
+            'SEARCH daily_summary USING INDEX sqlite_autoindex_daily_summary_1 (date=?)']
+    assert full_scans(plan) == plan[:1]
+
+
+def test_hot_queries_do_not_scan_history(dataset):
+    db, game_id = dataset
+    failures = check(db, game_id)
+    assert [(name, scans) for name, sql, scans in failures] == []
+
+
+def test_completion_percentage_matches_profile(dataset):
+    db, game_id = dataset
+    assert tuple(db.get_completion_percentage(game_id)) == db.get_game_profile(game_id)['completion']
+
+
+def test_first_date_of_a_score_is_an_index_seek(dataset):
+    db, game_id = dataset
+    plan = [row[3] for row in db.conn.execute(
+        'EXPLAIN QUERY PLAN SELECT MIN(date) FROM progress WHERE game_id = ? AND score_value = ?',
+        (game_id, 5.0)
+    )]
+    assert plan == ['SEARCH progress USING COVERING INDEX idx_progress_game_score_date '
+                    '(game_id=? AND score_value=?)']
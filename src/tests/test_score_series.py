@@ -0,0 +1,67 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from database.db_manager import DatabaseManager, MEMORY_PATH
+from database.series import lttb
+from models.game import Game
+
+START = date(2021, 1, 1)
+DAYS = 1000
+
+
+@pytest.fixture
+def db():
+    db = DatabaseManager(MEMORY_PATH)
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def game_id(db):
+    game_id = db.add_game(Game(id=None, name="game", url="", description="", score_type="10",
+                               reminder_time=None, created_at=datetime(2021, 1, 1)))
+    db.update_game_progress_many([
+        (game_id, START + timedelta(days=offset), True, str((offset * 7) % 11), None)
+        for offset in range(DAYS)
+    ])
+    return game_id
+
+
+def end():
+    return START + timedelta(days=DAYS - 1)
+
+
+@pytest.mark.parametrize('method', ['buckets', 'lttb'])
+def test_long_ranges_are_downsampled(db, game_id, method):
+    series = db.get_score_series(game_id, None, end(), 50, method)
+
+    assert 2 < len(series) <= 50
+    assert series[0][0] == START.isoformat()
+    dates = [point[0] for point in series]
+    assert dates == sorted(set(dates))
+    if method == 'buckets':
+        assert sum(point[4] for point in series) == DAYS
+        assert all(low <= mean <= high for _, mean, low, high, _ in series)
+    else:
+        # LTTB keeps real points, including the last one
+        assert series[-1][0] == end().isoformat()
+        assert all(point[4] == 1 for point in series)
+
+
+def test_short_ranges_keep_every_score(db, game_id):
+    series = db.get_score_series(game_id, START, START + timedelta(days=9), 50)
+
+    assert [point[0] for point in series] == \
+        [(START + timedelta(days=offset)).isoformat() for offset in range(10)]
+
+
+def test_lttb_keeps_the_ends_within_the_threshold():
+    points = [(x, (x * 37) % 101) for x in range(500)]
+
+    kept = lttb(points, 40)
+
+    assert kept[0] == 0 and kept[-1] == 499
+    assert len(kept) <= 40
+    assert kept == sorted(set(kept))
+    assert lttb(points[:10], 40) == list(range(10))
@@ -0,0 +1,74 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+import database.stats_cache
+from database.db_manager import DatabaseManager, MEMORY_PATH
+from models.game import Game
+
+
+@pytest.fixture
+def db():
+    db = DatabaseManager(MEMORY_PATH)
+    yield db
+    db.close()
+
+
+def add_game(db):
+    return db.add_game(Game(id=None, name="game", url="", description="", score_type="10",
+                            reminder_time=None, created_at=datetime(2024, 1, 1)))
+
+
+def lookups(db, call):
+    """(hits, misses) added by call()"""
+    before = db.stats_cache.info()
+    call()
+    after = db.stats_cache.info()
+    return after['hits'] - before['hits'], after['misses'] - before['misses']
+
+
+def test_a_write_bumps_the_generation(db):
+    game_id = add_game(db)
+    db.get_game_stats()
+    assert lookups(db, db.get_game_stats) == (1, 0)
+
+    generation = db.stats_cache.generation
+    db.update_game_progress(game_id, date(2024, 1, 2), True, '5', None)
+
+    assert db.stats_cache.generation > generation
+    assert lookups(db, db.get_game_stats) == (0, 1)
+    assert db.get_game_stats()[0]['times_completed'] == 1
+
+
+def test_a_write_keeps_other_games_entries(db):
+    first, second = add_game(db), add_game(db)
+    db.get_game_stats(second)
+    db.get_game_streak(second, 10)
+
+    db.update_game_progress(first, date(2024, 1, 2), True, '5', None)
+
+    assert lookups(db, lambda: db.get_game_stats(second)) == (1, 0)
+    assert lookups(db, lambda: db.get_game_streak(second, 10)) == (1, 0)
+    assert lookups(db, lambda: db.get_game_stats(first)) == (0, 1)
+
+    db.update_game_progress(second, date(2024, 1, 2), True, '7', None)
+
+    assert lookups(db, lambda: db.get_game_stats(second)) == (0, 1)
+    assert db.get_game_stats(second)[0]['best_score'] == 7
+
+
+def test_entries_expire_at_midnight(db, monkeypatch):
+    today = [date(2024, 3, 1)]
+
+    class FakeDate(date):
+        @classmethod
+        def today(cls):
+            return today[0]
+
+    monkeypatch.setattr(database.stats_cache, 'date', FakeDate)
+    db.get_longest_streak()
+    assert lookups(db, db.get_longest_streak) == (1, 0)
+
+    today[0] += timedelta(days=1)
+
+    assert lookups(db, db.get_longest_streak) == (0, 1)
@@ -0,0 +1,74 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from database.db_manager import DatabaseManager, MEMORY_PATH
+from models.game import Game
+
+TODAY = date.today()
+
+
+def day(offset):
+    return TODAY + timedelta(days=offset)
+
+
+@pytest.fixture
+def db():
+    db = DatabaseManager(MEMORY_PATH)
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def game_id(db):
+    return db.add_game(Game(id=None, name="game", url="", description="", score_type="",
+                            reminder_time=None, created_at=datetime(2024, 1, 1)))
+
+
+def streaks(db):
+    runs = [tuple(row) for row in db.conn.execute('SELECT * FROM streak_runs ORDER BY 1')]
+    return db.get_current_streak(), db.get_longest_streak(), runs
+
+
+def assert_matches_rebuild(db):
+    incremental = streaks(db)
+    db.rebuild_streaks()
+    assert streaks(db) == incremental
+    return incremental
+
+
+def set_completed(db, game_id, offset, completed):
+    db.update_game_progress(game_id, day(offset), completed, None, None)
+    return assert_matches_rebuild(db)
+
+
+def test_runs_merge_split_and_extend(db, game_id):
+    for offset in (-6, -5, -4, -2, -1, 0):
+        set_completed(db, game_id, offset, True)
+    current, longest, runs = assert_matches_rebuild(db)
+    assert (current, longest, len(runs)) == (3, 3, 2)
+
+    # Filling the gap merges the two runs
+    current, longest, runs = set_completed(db, game_id, -3, True)
+    assert (current, longest) == (7, 7)
+    assert runs == [(day(-6).isoformat(), day(0).isoformat(), 7)]
+
+    # Clearing it again splits them
+    current, longest, runs = set_completed(db, game_id, -3, False)
+    assert (current, longest, len(runs)) == (3, 3, 2)
+
+    # Days next to a run extend it at either edge
+    current, longest, runs = set_completed(db, game_id, -7, True)
+    assert longest == 4 and runs[0][0] == day(-7).isoformat()
+    set_completed(db, game_id, 0, False)
+    current, longest, runs = set_completed(db, game_id, 0, True)
+    assert current == 3
+
+    # Removing an edge day shrinks the run rather than splitting it
+    current, longest, runs = set_completed(db, game_id, -7, False)
+    assert longest == 3 and runs[0] == (day(-6).isoformat(), day(-4).isoformat(), 3)
+
+    # Removing the middle of a run splits it in two
+    current, longest, runs = set_completed(db, game_id, -1, False)
+    assert (current, longest) == (1, 3)
+    assert [run[2] for run in runs] == [3, 1, 1]
@@ -1,4 +1,12 @@
 from .menu_buttons import MenuButton
-from .game_widget import GameWidget
+from .game_widget import CalendarGameRow
+from .game_list import DailyGamesModel, GameItemDelegate, GameListView
+from .history_list import GameHistoryModel, HistoryItemDelegate, HistoryListView
+from .charts import Sparkline, MiniHeatmap, PieChart, LineChart
 
-__all__ = ['MenuButton', 'GameWidget']
+__all__ = [
+    'MenuButton', 'CalendarGameRow',
+    'DailyGamesModel', 'GameItemDelegate', 'GameListView',
+    'GameHistoryModel', 'HistoryItemDelegate', 'HistoryListView',
+    'Sparkline', 'MiniHeatmap', 'PieChart', 'LineChart'
+]
@@ -0,0 +1,329 @@
+from datetime import date
+
+from PyQt6.QtWidgets import QWidget, QSizePolicy
+from PyQt6.QtCore import Qt, QPointF, QRectF, QSize
+from PyQt6.QtGui import QColor, QFont, QPainter, QPainterPath, QPen
+from ui.theme import COLORS
+
+
+def scale_points(values, rect, maximum, gaps=True, positions=None):
+    """Map values onto rect, returning runs of unbroken QPointFs.
+
+    None values split the line into separate runs, or are skipped over
+    with gaps=False. positions gives each value's x as a fraction (0-1) of
+    the width; by default values are evenly spaced.
+    """
+    count = len(values)
+    step = rect.width() / (count - 1) if count > 1 else 0
+    runs, run = [], []
+    for i, value in enumerate(values):
+        if value is None:
+            if not gaps:
+                continue
+            if run:
+                runs.append(run)
+            run = []
+            continue
+        if positions is not None:
+            x = rect.left() + rect.width() * positions[i]
+        else:
+            x = rect.left() + i * step if count > 1 else rect.center().x()
+        y = rect.bottom() - rect.height() * min(max(value / maximum, 0), 1)
+        run.append(QPointF(x, y))
+    if run:
+        runs.append(run)
+    return runs
+
+
+def date_positions(labels):
+    """Each date's x as a fraction of the span from the first date to the last"""
+    days = [date.fromisoformat(str(label)[:10]).toordinal() for label in labels]
+    if not days or days[-1] == days[0]:
+        return [0.5] * len(days)
+    span = days[-1] - days[0]
+    return [(day - days[0]) / span for day in days]
+
+
+def blend(low, high, amount):
+    """The colour amount (0-1) of the way from low to high"""
+    low, high = QColor(low), QColor(high)
+    return QColor(
+        round(low.red() + (high.red() - low.red()) * amount),
+        round(low.green() + (high.green() - low.green()) * amount),
+        round(low.blue() + (high.blue() - low.blue()) * amount)
+    )
+
+
+class Sparkline(QWidget):
+    """A small line of values painted directly with QPainter.
+
+    None values are skipped, joining their neighbours. Values are scaled
+    from 0 to maximum, or to the largest value when no maximum is given.
+    """
+
+    def __init__(self, values=(), maximum=None, color=COLORS['primary'], parent=None):
+        super().__init__(parent)
+        self.color = QColor(color)
+        self.values = []
+        self.maximum = None
+        self.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
+        self.set_values(values, maximum)
+
+    def set_values(self, values, maximum=None):
+        self.values = list(values)
+        present = [value for value in self.values if value is not None]
+        self.maximum = maximum or (max(present) if present else None) or 1
+        self.update()
+
+    def sizeHint(self):
+        return QSize(160, 32)
+
+    def paintEvent(self, event):
+        if not self.values:
+            return
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        rect = QRectF(self.rect()).adjusted(3, 3, -3, -3)
+
+        painter.setPen(QPen(self.color, 1.5))
+        runs = scale_points(self.values, rect, self.maximum, gaps=False)
+        for run in runs:
+            if len(run) == 1:
+                painter.drawPoint(run[0])
+            else:
+                painter.drawPolyline(run)
+
+        # Mark the latest value
+        if runs:
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(self.color)
+            painter.drawEllipse(runs[-1][-1], 2.5, 2.5)
+
+
+class MiniHeatmap(QWidget):
+    """A grid of small cells shaded by value, filled column by column.
+
+    Values run from 0 (empty colour) to 1 (full colour); None cells are
+    drawn as blanks. With rows=7 and a value per day the columns are weeks.
+    """
+
+    def __init__(self, values=(), rows=1, color=COLORS['good'], empty=COLORS['empty'],
+                 blank=COLORS['blank'], parent=None):
+        super().__init__(parent)
+        self.rows = rows
+        self.color = color
+        self.empty = empty
+        self.blank = QColor(blank)
+        self.values = []
+        self.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
+        self.set_values(values)
+
+    def set_values(self, values):
+        self.values = list(values)
+        self.updateGeometry()
+        self.update()
+
+    def columns(self):
+        return max(1, -(-len(self.values) // self.rows))
+
+    def sizeHint(self):
+        return QSize(self.columns() * 10, self.rows * 10)
+
+    def paintEvent(self, event):
+        if not self.values:
+            return
+        painter = QPainter(self)
+        painter.setPen(Qt.PenStyle.NoPen)
+        cell = min(self.width() / self.columns(), self.height() / self.rows)
+        for i, value in enumerate(self.values):
+            column, row = divmod(i, self.rows)
+            painter.setBrush(self.blank if value is None else blend(self.empty, self.color, value))
+            painter.drawRoundedRect(
+                QRectF(column * cell + 1, row * cell + 1, cell - 2, cell - 2), 2, 2
+            )
+
+
+class PieChart(QWidget):
+    """A pie of (label, value, colour) slices with percentages and a legend"""
+
+    def __init__(self, slices=(), title="", parent=None):
+        super().__init__(parent)
+        self.slices = list(slices)
+        self.title = title
+        self.setMinimumSize(220, 220)
+
+    def set_slices(self, slices):
+        self.slices = list(slices)
+        self.update()
+
+    def sizeHint(self):
+        return QSize(320, 320)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.fillRect(self.rect(), QColor(COLORS['surface']))
+        rect = QRectF(self.rect()).adjusted(10, 10, -10, -10)
+
+        font = QFont()
+        font.setPixelSize(15)
+        painter.setFont(font)
+        painter.setPen(QColor(COLORS['text']))
+        painter.drawText(rect, Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop, self.title)
+
+        total = sum(value for _, value, _ in self.slices)
+        if total <= 0:
+            return
+
+        legend_height = 22
+        size = min(rect.width(), rect.height() - 30 - legend_height)
+        pie = QRectF(rect.center().x() - size / 2, rect.top() + 30, size, size)
+
+        font.setPixelSize(12)
+        painter.setFont(font)
+        angle = 90 * 16  # Start at 12 o'clock and go clockwise
+        for label, value, color in self.slices:
+            span = -round(value / total * 360 * 16)
+            painter.setPen(QPen(QColor(COLORS['surface']), 1))
+            painter.setBrush(QColor(color))
+            painter.drawPie(pie, angle, span)
+            angle += span
+
+        # Percentages for slices big enough to hold them
+        path = QPainterPath()
+        angle = 90.0
+        for label, value, color in self.slices:
+            sweep = value / total * 360
+            if sweep >= 20:
+                path.moveTo(pie.center())
+                path.arcMoveTo(pie.adjusted(size / 4, size / 4, -size / 4, -size / 4),
+                               angle - sweep / 2)
+                text_rect = QRectF(0, 0, 60, 20)
+                text_rect.moveCenter(path.currentPosition())
+                painter.setPen(QColor(COLORS['on_color']))
+                painter.drawText(text_rect, Qt.AlignmentFlag.AlignCenter, f"{value / total:.1%}")
+            angle -= sweep
+
+        # Legend
+        x = rect.left()
+        y = pie.bottom() + 6
+        metrics = painter.fontMetrics()
+        for label, value, color in self.slices:
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(color))
+            painter.drawRect(QRectF(x, y + 4, 10, 10))
+            painter.setPen(QColor(COLORS['subtle']))
+            painter.drawText(QPointF(x + 14, y + 13), label)
+            x += 14 + metrics.horizontalAdvance(label) + 16
+
+
+class LineChart(QWidget):
+    """A line chart of dated values with an optional min/max band.
+
+    Labels are ISO dates (as in DatabaseManager.get_score_series) and
+    points are placed by date between the first and the last, so missing
+    days and empty buckets show as gaps along the time axis.
+    """
+
+    MARGINS = (40, 36, 16, 32)  # left, top, right, bottom
+
+    def __init__(self, title="", empty_text="No scores in this range", parent=None):
+        super().__init__(parent)
+        self.title = title
+        self.empty_text = empty_text
+        self.labels = []
+        self.positions = []
+        self.values = []
+        self.lows = None
+        self.highs = None
+        self.maximum = 1
+        self.setMinimumSize(300, 240)
+
+    def set_series(self, labels, values, maximum, lows=None, highs=None, title=None):
+        self.labels = list(labels)
+        self.positions = date_positions(self.labels)
+        self.values = list(values)
+        self.lows = list(lows) if lows else None
+        self.highs = list(highs) if highs else None
+        self.maximum = maximum or 1
+        if title is not None:
+            self.title = title
+        self.update()
+
+    def sizeHint(self):
+        return QSize(480, 320)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.fillRect(self.rect(), QColor(COLORS['surface']))
+        left, top, right, bottom = self.MARGINS
+        plot = QRectF(self.rect()).adjusted(left, top, -right, -bottom)
+
+        font = QFont()
+        font.setPixelSize(15)
+        painter.setFont(font)
+        painter.setPen(QColor(COLORS['text']))
+        painter.drawText(QRectF(0, 8, self.width(), 20), Qt.AlignmentFlag.AlignHCenter, self.title)
+
+        # Axes with gridlines at 0, half and the maximum
+        font.setPixelSize(11)
+        painter.setFont(font)
+        for fraction in (0, 0.5, 1):
+            y = plot.bottom() - plot.height() * fraction
+            painter.setPen(QPen(QColor(COLORS['grid']), 1))
+            painter.drawLine(QPointF(plot.left(), y), QPointF(plot.right(), y))
+            painter.setPen(QColor(COLORS['secondary']))
+            painter.drawText(QRectF(0, y - 8, left - 6, 16),
+                             Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+                             f"{self.maximum * fraction:g}")
+        painter.setPen(QPen(QColor(COLORS['faint']), 1))
+        painter.drawLine(plot.bottomLeft(), plot.bottomRight())
+
+        if not self.values:
+            painter.drawText(plot, Qt.AlignmentFlag.AlignCenter, self.empty_text)
+            return
+
+        # Date labels at both ends and the middle of the time axis
+        first, last = str(self.labels[0])[:10], str(self.labels[-1])[:10]
+        label_rect = QRectF(0, plot.bottom() + 6, 90, 16)
+        labels = [(plot.left(), Qt.AlignmentFlag.AlignLeft, first)]
+        if last != first:
+            middle = date.fromordinal(
+                (date.fromisoformat(first).toordinal() + date.fromisoformat(last).toordinal()) // 2
+            )
+            labels += [(plot.center().x(), Qt.AlignmentFlag.AlignHCenter, middle.isoformat()),
+                       (plot.right(), Qt.AlignmentFlag.AlignRight, last)]
+        else:
+            labels = [(plot.center().x(), Qt.AlignmentFlag.AlignHCenter, first)]
+        painter.setPen(QColor(COLORS['secondary']))
+        for x, align, text in labels:
+            if align == Qt.AlignmentFlag.AlignLeft:
+                label_rect.moveLeft(x)
+            elif align == Qt.AlignmentFlag.AlignRight:
+                label_rect.moveRight(x)
+            else:
+                label_rect.moveLeft(x - label_rect.width() / 2)
+            painter.drawText(label_rect, align, text)
+
+        color = QColor(COLORS['primary'])
+        if self.lows and self.highs:
+            band = QPainterPath()
+            highs = scale_points(self.highs, plot, self.maximum, positions=self.positions)[0]
+            lows = scale_points(self.lows, plot, self.maximum, positions=self.positions)[0]
+            band.moveTo(highs[0])
+            for point in highs[1:] + lows[::-1]:
+                band.lineTo(point)
+            band.closeSubpath()
+            fill = QColor(color)
+            fill.setAlpha(40)
+            painter.fillPath(band, fill)
+
+        painter.setPen(QPen(color, 2))
+        for run in scale_points(self.values, plot, self.maximum, positions=self.positions):
+            if len(run) > 1:
+                painter.drawPolyline(run)
+            if len(self.values) <= 60:
+                painter.setBrush(color)
+                for point in run:
+                    painter.drawEllipse(point, 3, 3)
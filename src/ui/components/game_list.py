@@ -0,0 +1,322 @@
+from PyQt6.QtWidgets import (
+    QStyledItemDelegate, QStyle, QLineEdit, QDialog, QListView, QAbstractItemView
+)
+from PyQt6.QtCore import (
+    Qt, QAbstractListModel, QModelIndex, QRect, QRectF, QSize, QEvent, QUrl, pyqtSignal
+)
+from PyQt6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPainterPath, QDesktopServices
+from ui.components.game_widget import NoteDialog
+from ui.theme import COLORS
+
+GameRole = Qt.ItemDataRole.UserRole + 1
+CompletedRole = Qt.ItemDataRole.UserRole + 2
+ScoreRole = Qt.ItemDataRole.UserRole + 3
+NoteRole = Qt.ItemDataRole.UserRole + 4
+
+ROLE_KEYS = {
+    CompletedRole: 'completed',
+    ScoreRole: 'score',
+    NoteRole: 'note'
+}
+
+
+class DailyGamesModel(QAbstractListModel):
+    """Today's games and their progress as rows of get_daily_progress dicts.
+
+    The number of completed games is kept up to date as rows change, so
+    the page never has to recount them.
+    """
+    progress_edited = pyqtSignal(int, bool, str, str)  # game id, completed, score, note
+    completion_changed = pyqtSignal(int, int)  # completed, total
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows = []
+        self.row_by_id = {}
+        self.completed_count = 0
+
+    def reconcile(self, rows):
+        """Bring the model in line with rows, touching only rows that differ.
+
+        Rows are matched by game id: missing games are removed, new ones
+        inserted and changed ones updated in place, so the view keeps its
+        scroll position, hover and any open editor.
+        """
+        new_ids = {row['game'].id for row in rows}
+        for position in range(len(self.rows) - 1, -1, -1):
+            if self.rows[position]['game'].id not in new_ids:
+                self._remove(position)
+
+        for position, row in enumerate(rows):
+            game_id = row['game'].id
+            if position < len(self.rows) and self.rows[position]['game'].id == game_id:
+                self._update(position, row)
+                continue
+            current = self.row_by_id.get(game_id)
+            if current is not None:
+                # The game moved; take it out and put it back where it belongs
+                self._remove(current)
+            self._insert(position, row)
+
+        self.completion_changed.emit(self.completed_count, len(self.rows))
+
+    def add_row(self, row):
+        self._insert(len(self.rows), row)
+        self.completion_changed.emit(self.completed_count, len(self.rows))
+
+    def remove_game(self, game_id):
+        position = self.row_by_id.get(game_id)
+        if position is not None:
+            self._remove(position)
+            self.completion_changed.emit(self.completed_count, len(self.rows))
+
+    def _insert(self, position, row):
+        self.beginInsertRows(QModelIndex(), position, position)
+        self.rows.insert(position, row)
+        self.completed_count += 1 if row.get('completed') else 0
+        self._index_rows()
+        self.endInsertRows()
+
+    def _remove(self, position):
+        self.beginRemoveRows(QModelIndex(), position, position)
+        row = self.rows.pop(position)
+        self.completed_count -= 1 if row.get('completed') else 0
+        self._index_rows()
+        self.endRemoveRows()
+
+    def _update(self, position, row):
+        current = self.rows[position]
+        if all(current.get(key) == row.get(key) for key in ('game', 'completed', 'score', 'note')):
+            return
+        self.completed_count += bool(row.get('completed')) - bool(current.get('completed'))
+        self.rows[position] = row
+        index = self.index(position)
+        self.dataChanged.emit(index, index)
+
+    def _index_rows(self):
+        self.row_by_id = {row['game'].id: position for position, row in enumerate(self.rows)}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self.rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return row['game'].name
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return row['game'].description or None
+        if role == GameRole:
+            return row['game']
+        if role in ROLE_KEYS:
+            return row.get(ROLE_KEYS[role])
+        return None
+
+    def flags(self, index):
+        flags = Qt.ItemFlag.ItemIsEnabled
+        if index.isValid() and has_score(self.rows[index.row()]['game']):
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if role == Qt.ItemDataRole.EditRole:
+            role = ScoreRole
+        if not index.isValid() or role not in ROLE_KEYS:
+            return False
+
+        row = self.rows[index.row()]
+        key = ROLE_KEYS[role]
+        if key == 'completed':
+            value = bool(value)
+        if row.get(key) == value:
+            return False
+
+        if key == 'completed':
+            self.completed_count += 1 if value else -1
+        row[key] = value
+        self.dataChanged.emit(index, index, [role])
+        self.progress_edited.emit(
+            row['game'].id,
+            bool(row.get('completed')),
+            row.get('score') or "",
+            row.get('note') or ""
+        )
+        if key == 'completed':
+            self.completion_changed.emit(self.completed_count, len(self.rows))
+        return True
+
+
+def has_score(game):
+    return bool(game.score_type and game.score_type.strip())
+
+
+class GameItemDelegate(QStyledItemDelegate):
+    """Paints a daily game row and edits its checkbox, score and note in place"""
+
+    ROW_HEIGHT = 76
+    MARGIN = 5
+    PADDING = 10
+    NOTE_SIZE = 30
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.ROW_HEIGHT)
+
+    def layout(self, rect, index):
+        """Rectangles for each part of the row at rect"""
+        card = rect.adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN)
+        inner = card.adjusted(self.PADDING, self.PADDING, -self.PADDING, -self.PADDING)
+        checkbox = QRect(inner.left(), inner.top(), 36, inner.height())
+        note = QRect(inner.right() - self.NOTE_SIZE, inner.top(), self.NOTE_SIZE, self.NOTE_SIZE)
+
+        name_width = QFontMetrics(self.name_font()).horizontalAdvance(index.data() or "")
+        text_left = checkbox.right() + 10
+        name = QRect(text_left, inner.top(), name_width, 28)
+        score = QRect(name.right() + 8, inner.top(), 60, 28)
+        description = QRect(text_left, name.bottom() + 2, note.left() - text_left - 10,
+                            inner.bottom() - name.bottom() - 2)
+        return {
+            'card': card,
+            'checkbox': checkbox,
+            'name': name,
+            'score': score,
+            'description': description,
+            'note': note
+        }
+
+    def name_font(self):
+        font = QFont()
+        font.setPixelSize(16)
+        font.setBold(True)
+        return font
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        parts = self.layout(option.rect, index)
+        game = index.data(GameRole)
+
+        # Card background
+        hovered = option.state & QStyle.StateFlag.State_MouseOver
+        path = QPainterPath()
+        path.addRoundedRect(QRectF(parts['card']), 10, 10)
+        painter.fillPath(path, QColor(COLORS['card_hover'] if hovered else COLORS['card']))
+
+        # Checkbox
+        font = QFont()
+        font.setPixelSize(24)
+        painter.setFont(font)
+        painter.setPen(QColor(COLORS['text']))
+        painter.drawText(parts['checkbox'], Qt.AlignmentFlag.AlignVCenter,
+                         "☑" if index.data(CompletedRole) else "☐")
+
+        # Name
+        painter.setFont(self.name_font())
+        painter.drawText(parts['name'], Qt.AlignmentFlag.AlignVCenter, index.data())
+
+        # Score and its denomination
+        if has_score(game):
+            font = QFont()
+            font.setPixelSize(14)
+            painter.setFont(font)
+            score = str(index.data(ScoreRole) or "")
+            score_rect = parts['score']
+            if score:
+                painter.setPen(QColor(COLORS['good']))
+                painter.drawText(score_rect, Qt.AlignmentFlag.AlignVCenter, score)
+                score_rect = score_rect.adjusted(painter.fontMetrics().horizontalAdvance(score), 0, 0, 0)
+            else:
+                painter.setPen(QColor(COLORS['faint']))
+                painter.drawText(score_rect, Qt.AlignmentFlag.AlignVCenter, "Score")
+                score_rect = score_rect.adjusted(painter.fontMetrics().horizontalAdvance("Score"), 0, 0, 0)
+            denomination = (f"/{game.score_type}" if game.score_type.strip().isdigit()
+                            else f" {game.score_type}")
+            painter.setPen(QColor(COLORS['secondary']))
+            painter.drawText(score_rect.adjusted(0, 0, 200, 0), Qt.AlignmentFlag.AlignVCenter,
+                             denomination)
+
+        # Description, elided to the space available
+        if game.description:
+            font = QFont()
+            font.setPixelSize(13)
+            painter.setFont(font)
+            painter.setPen(QColor(COLORS['muted']))
+            text = painter.fontMetrics().elidedText(
+                game.description.replace("\n", " "),
+                Qt.TextElideMode.ElideRight,
+                parts['description'].width()
+            )
+            painter.drawText(parts['description'], Qt.AlignmentFlag.AlignTop, text)
+
+        # Note button
+        note = index.data(NoteRole)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(COLORS['secondary']))
+        painter.drawEllipse(parts['note'])
+        font = QFont()
+        font.setPixelSize(16)
+        painter.setFont(font)
+        painter.setPen(QColor(COLORS['on_color']))
+        painter.drawText(parts['note'], Qt.AlignmentFlag.AlignCenter, "📝" if note else "+")
+
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() not in (QEvent.Type.MouseButtonRelease, QEvent.Type.MouseButtonDblClick):
+            return False
+        if event.button() != Qt.MouseButton.LeftButton:
+            return False
+
+        parts = self.layout(option.rect, index)
+        pos = event.position().toPoint()
+        game = index.data(GameRole)
+
+        if event.type() == QEvent.Type.MouseButtonDblClick:
+            if has_score(game) and parts['score'].contains(pos):
+                self.parent().edit(index)
+                return True
+            return False
+
+        if parts['checkbox'].contains(pos):
+            model.setData(index, not index.data(CompletedRole), CompletedRole)
+        elif parts['note'].contains(pos):
+            dialog = NoteDialog(index.data(NoteRole) or "", self.parent())
+            if dialog.exec() == QDialog.DialogCode.Accepted:
+                model.setData(index, dialog.get_note(), NoteRole)
+        elif not (has_score(game) and parts['score'].contains(pos)) and game.url:
+            url = game.url
+            # Add https:// prefix if no protocol is specified
+            if not url.startswith(('http://', 'https://')):
+                url = 'https://' + url
+            QDesktopServices.openUrl(QUrl(url))
+        return True
+
+    def createEditor(self, parent, option, index):
+        editor = QLineEdit(parent)
+        editor.setPlaceholderText("Score")
+        return editor
+
+    def setEditorData(self, editor, index):
+        editor.setText(str(index.data(ScoreRole) or ""))
+
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.text(), ScoreRole)
+
+    def updateEditorGeometry(self, editor, option, index):
+        score = self.layout(option.rect, index)['score']
+        editor.setGeometry(score.adjusted(-4, 0, 20, 0))
+
+
+class GameListView(QListView):
+    """A list view of DailyGamesModel rows painted by GameItemDelegate"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setItemDelegate(GameItemDelegate(self))
+        self.setUniformItemSizes(True)
+        self.setMouseTracking(True)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setFrameShape(QListView.Shape.NoFrame)
+        self.setCursor(Qt.CursorShape.PointingHandCursor)
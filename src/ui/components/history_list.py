@@ -0,0 +1,123 @@
+from PyQt6.QtWidgets import QStyledItemDelegate, QListView, QAbstractItemView
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QRectF, QSize
+from PyQt6.QtGui import QColor, QFont, QPainter, QPainterPath
+from ui.theme import COLORS
+
+
+class GameHistoryModel(QAbstractListModel):
+    """A game's completed entries, newest first, fetched a page at a time.
+
+    The view asks for more rows through canFetchMore/fetchMore as it is
+    scrolled towards the end; each page is a keyset query on date run on
+    the background QueryExecutor.
+    """
+
+    def __init__(self, queries, game_id, page_size=50, parent=None):
+        super().__init__(parent)
+        self.queries = queries
+        self.game_id = game_id
+        self.page_size = page_size
+        self.rows = []
+        self.exhausted = False
+        self.loading = False
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self.rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return str(entry[0])
+        if role == Qt.ItemDataRole.UserRole:
+            return entry
+        if role == Qt.ItemDataRole.ToolTipRole and entry[3]:
+            return entry[3]
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self.exhausted and not self.loading
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        self.loading = True
+        game_id = self.game_id
+        before = self.rows[-1][0] if self.rows else None
+        page_size = self.page_size
+        self.queries.submit(
+            f'history:{game_id}',
+            lambda db: db.get_game_history_page(game_id, before, page_size),
+            on_result=self.append_page,
+            on_error=self.fetch_failed
+        )
+
+    def append_page(self, page):
+        self.loading = False
+        if len(page) < self.page_size:
+            self.exhausted = True
+        if page:
+            self.beginInsertRows(QModelIndex(), len(self.rows), len(self.rows) + len(page) - 1)
+            self.rows.extend(page)
+            self.endInsertRows()
+
+    def fetch_failed(self, error):
+        self.loading = False
+        self.exhausted = True
+
+
+class HistoryItemDelegate(QStyledItemDelegate):
+    """Paints one history entry: its date, score and note"""
+
+    ROW_HEIGHT = 84
+    MARGIN = 5
+    PADDING = 10
+    LINE_HEIGHT = 20
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.ROW_HEIGHT)
+
+    def paint(self, painter, option, index):
+        entry = index.data(Qt.ItemDataRole.UserRole)
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        card = option.rect.adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN)
+        path = QPainterPath()
+        path.addRoundedRect(QRectF(card), 10, 10)
+        painter.fillPath(path, QColor(COLORS['card']))
+
+        line = card.adjusted(self.PADDING, self.PADDING, -self.PADDING, 0)
+        line.setHeight(self.LINE_HEIGHT)
+
+        font = QFont()
+        font.setBold(True)
+        painter.setFont(font)
+        painter.setPen(QColor(COLORS['text']))
+        painter.drawText(line, Qt.AlignmentFlag.AlignVCenter, str(entry[0]))
+
+        painter.setFont(QFont())
+        if entry[2]:  # Score
+            line.translate(0, self.LINE_HEIGHT)
+            painter.drawText(line, Qt.AlignmentFlag.AlignVCenter, f"Score: {entry[2]}")
+        if entry[3]:  # Note
+            line.translate(0, self.LINE_HEIGHT)
+            text = painter.fontMetrics().elidedText(
+                f"Note: {entry[3]}".replace("\n", " "),
+                Qt.TextElideMode.ElideRight,
+                line.width()
+            )
+            painter.drawText(line, Qt.AlignmentFlag.AlignVCenter, text)
+
+        painter.restore()
+
+
+class HistoryListView(QListView):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setItemDelegate(HistoryItemDelegate(self))
+        self.setUniformItemSizes(True)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setFrameShape(QListView.Shape.NoFrame)
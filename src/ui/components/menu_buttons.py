@@ -1,23 +1,8 @@
 from PyQt6.QtWidgets import QPushButton
+from ui.theme import styled
 
 class MenuButton(QPushButton):
     def __init__(self, text, parent=None):
         super().__init__(text, parent)
         self.setFixedHeight(80)
-        self.setStyleSheet("""
-            QPushButton {
-                background-color: #4a90e2;
-                border: none;
-                border-radius: 10px;
-                color: white;
-                font-size: 18px;
-                font-weight: bold;
-                margin: 5px;
-            }
-            QPushButton:hover {
-                background-color: #357abd;
-            }
-            QPushButton:pressed {
-                background-color: #2968a6;
-            }
-        """)
+        styled(self, 'menuButton')
@@ -0,0 +1,125 @@
+import sqlite3
+import sys
+import threading
+from dataclasses import dataclass, field
+from PyQt6.QtCore import QObject, QTimer, Qt, pyqtSignal
+
+COALESCE_MS = 100  # Writes this close together are reported as one change
+POLL_MS = 2000  # How often to look for commits made by other connections
+
+
+@dataclass
+class DataChange:
+    """What a burst of DatabaseManager writes changed.
+
+    progress maps game ids to the ISO dates their progress was written
+    on. reset means another connection changed the database, so anything
+    derived from it should be reloaded rather than patched.
+    """
+    progress: dict = field(default_factory=dict)
+    added: set = field(default_factory=set)
+    deleted: set = field(default_factory=set)
+    reset: bool = False
+
+    def __bool__(self):
+        return bool(self.progress or self.added or self.deleted or self.reset)
+
+    @property
+    def game_ids(self):
+        """Every game whose row may look different now"""
+        return set(self.progress) | self.added | self.deleted
+
+    @property
+    def dates(self):
+        return set().union(*self.progress.values())
+
+    def record(self, event, payload):
+        """Fold one write listener event into the change"""
+        if event == 'progress':
+            for game_id, day, completed, score_value in payload:
+                if game_id not in self.deleted:
+                    self.progress.setdefault(game_id, set()).add(day)
+        elif event == 'game_added':
+            self.added.add(payload)
+        elif event == 'game_deleted':
+            self.deleted.add(payload)
+            self.added.discard(payload)
+            self.progress.pop(payload, None)
+        elif event == 'reset':
+            self.reset = True
+
+    def merge(self, other):
+        """Add a later change to this one"""
+        for game_id in other.deleted:
+            self.record('game_deleted', game_id)
+        for game_id in other.added:
+            self.record('game_added', game_id)
+        for game_id, days in other.progress.items():
+            self.progress.setdefault(game_id, set()).update(days)
+        self.reset = self.reset or other.reset
+        return self
+
+
+class DataEvents(QObject):
+    """DatabaseManager writes as a Qt signal, coalesced into one DataChange per burst.
+
+    Write listeners run on whichever thread made the write; events are
+    collected under a lock and changed is emitted on the UI thread once
+    writes have been quiet for COALESCE_MS, so a batched flush of many
+    rows reaches the pages as a single change.
+
+    Commits from other connections (e.g. cli.py) don't call the
+    listeners, so the database is also polled every POLL_MS and such a
+    commit arrives as a change with reset set.
+
+        main_window.data_events.changed.connect(self.on_data_changed)
+    """
+    changed = pyqtSignal(object)  # DataChange
+    _arrived = pyqtSignal()
+
+    def __init__(self, db_manager, interval=COALESCE_MS, poll_interval=POLL_MS, parent=None):
+        super().__init__(parent)
+        self.db = db_manager
+        self._pending = DataChange()
+        self._lock = threading.Lock()
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(interval)
+        self.timer.timeout.connect(self.emit_pending)
+        # Queued, so the timer is always started from the UI thread
+        self._arrived.connect(self._schedule, Qt.ConnectionType.QueuedConnection)
+        db_manager.add_write_listener(self.on_write)
+        self.poll_timer = QTimer(self)
+        self.poll_timer.setInterval(poll_interval)
+        self.poll_timer.timeout.connect(self.poll)
+        self.poll_timer.start()
+        self.poll()  # Commits before this one aren't changes
+
+    def on_write(self, event, payload):
+        with self._lock:
+            self._pending.record(event, payload)
+        self._arrived.emit()
+
+    def _schedule(self):
+        self.timer.start()
+
+    def poll(self):
+        """Record a reset if another connection has committed since the last poll"""
+        try:
+            self.db.check_external_writes()
+        except sqlite3.Error as error:
+            # Raising from a Qt slot aborts the app; the next poll tries again
+            print(f"Checking for external changes failed: {error}", file=sys.stderr)
+
+    def emit_pending(self):
+        """Emit everything collected so far without waiting for the timer"""
+        self.timer.stop()
+        with self._lock:
+            change, self._pending = self._pending, DataChange()
+        if change:
+            self.changed.emit(change)
+
+    def close(self):
+        self.db.remove_write_listener(self.on_write)
+        self.timer.stop()
+        self.poll_timer.stop()
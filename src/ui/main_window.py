@@ -1,42 +1,67 @@
+import sqlite3
+import sys
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QStackedWidget, QLabel, QPushButton
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from database.db_manager import DatabaseManager
+from database.query_executor import QueryExecutor
+from database.write_buffer import WriteBehindBuffer
 from ui.components.menu_buttons import MenuButton
+from ui.data_events import DataEvents
+from ui.theme import apply_theme, styled
 from ui.pages.daily_page import DailyPage
 from ui.pages.calendar_page import CalendarPage
 from ui.pages.stats_page import StatsPage
 from ui.pages.settings_page import SettingsPage
 
+CLOSE_FLUSH_ATTEMPTS = 3  # Tries at writing buffered edits when the window closes
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Game Tracker")
         self.setMinimumSize(800, 600)
+        # One stylesheet for the whole app, set before any page is built
+        apply_theme()
         self.showMaximized()
         
         # Initialize database
         self.db = DatabaseManager()
+        self.queries = QueryExecutor(self.db, max_threads=self.db.readers.size, parent=self)
+
+        # Progress edits are buffered and written in batches shortly after
+        self.writes = WriteBehindBuffer(self.db, on_pending=self.schedule_flush)
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(500)
+        self.flush_timer.timeout.connect(self.flush_writes)
+
+        # Pages listen here to refresh just what a write changed
+        self.data_events = DataEvents(self.db, parent=self)
+
+        # In-memory progress arrays, loaded in the background the first time a page needs them
+        self._analytics = None
+        self._analytics_ready = False
+        self._analytics_stale = False
+        self._analytics_waiting = []
+        self.data_events.changed.connect(self.reload_analytics)
         
         # Create the stacked widget to manage different pages
         self.stacked_widget = QStackedWidget()
         self.setCentralWidget(self.stacked_widget)
         
-        # Create pages
+        # The main menu is built up front; other pages the first time they are shown
         self.main_menu_page = self.create_main_menu()
-        self.daily_page = DailyPage(self.db, self)
-        self.calendar_page = CalendarPage(self.db, self)
-        self.stats_page = StatsPage(self.db, self)
-        self.settings_page = SettingsPage(self.db, self)
-        
-        # Add pages to stacked widget
         self.stacked_widget.addWidget(self.main_menu_page)
-        self.stacked_widget.addWidget(self.daily_page)
-        self.stacked_widget.addWidget(self.calendar_page)
-        self.stacked_widget.addWidget(self.stats_page)
-        self.stacked_widget.addWidget(self.settings_page)
+        self.page_classes = {
+            'daily': DailyPage,
+            'calendar': CalendarPage,
+            'stats': StatsPage,
+            'settings': SettingsPage
+        }
+        self.pages = {}
 
     def create_main_menu(self):
         page = QWidget()
@@ -45,16 +70,8 @@ class MainWindow(QMainWindow):
         layout.setContentsMargins(40, 40, 40, 40)
 
         # Title
-        title = QLabel("Game Tracker")
+        title = styled(QLabel("Game Tracker"), 'appTitle')
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title.setStyleSheet("""
-            QLabel {
-                color: #4a90e2;
-                font-size: 36px;
-                font-weight: bold;
-                margin-bottom: 20px;
-            }
-        """)
         layout.addWidget(title)
 
         # Main buttons
@@ -63,21 +80,8 @@ class MainWindow(QMainWindow):
         stats_btn = MenuButton("Statistics")
         
         # Settings button
-        settings_btn = QPushButton()
+        settings_btn = styled(QPushButton(), 'settingsButton')
         settings_btn.setFixedSize(50, 50)
-        settings_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #6c757d;
-                border: none;
-                border-radius: 25px;
-                color: white;
-                font-size: 18px;
-                margin-top: 20px;
-            }
-            QPushButton:hover {
-                background-color: #5a6268;
-            }
-        """)
         settings_btn.setText("⚙")
 
         # Add buttons to layout
@@ -102,17 +106,130 @@ class MainWindow(QMainWindow):
 
         return page
 
+    def analytics(self, on_ready):
+        """Call on_ready(ProgressAnalytics) once the arrays are loaded; right away if they are"""
+        if self._analytics_ready:
+            on_ready(self._analytics)
+            return
+        self._analytics_waiting.append(on_ready)
+        if not self.queries.is_pending('analytics'):
+            self.load_analytics()
+
+    def cancel_analytics(self, on_ready):
+        if on_ready in self._analytics_waiting:
+            self._analytics_waiting.remove(on_ready)
+
+    def load_analytics(self):
+        """(Re)load the analytics arrays from a reader, off the UI thread"""
+        self._analytics_ready = False
+        db, analytics = self.db, self._analytics
+
+        def load(reader):
+            if analytics is not None:
+                analytics.load(reader)
+                return analytics
+            # NumPy is slow to import, so it is only loaded when first needed
+            from analytics import ProgressAnalytics
+            return ProgressAnalytics(db, source=reader, reload_on_reset=False)
+
+        self.queries.submit('analytics', load, on_result=self.analytics_loaded)
+
+    def analytics_loaded(self, analytics):
+        self._analytics = analytics
+        if self._analytics_stale:
+            # Another connection wrote while it was loading
+            self._analytics_stale = False
+            self.load_analytics()
+            return
+        self._analytics_ready = True
+        waiting, self._analytics_waiting = self._analytics_waiting, []
+        for on_ready in waiting:
+            on_ready(analytics)
+
+    def reload_analytics(self, change):
+        # Connected before any page, so pages asking for analytics on a reset wait for this
+        if not change.reset:
+            return
+        if self.queries.is_pending('analytics'):
+            self._analytics_stale = True
+        elif self._analytics is not None:
+            self.load_analytics()
+
+    def page(self, name):
+        if name not in self.pages:
+            page = self.page_classes[name](self.db, self)
+            self.stacked_widget.addWidget(page)
+            self.pages[name] = page
+        return self.pages[name]
+
+    def show_page(self, name):
+        self.flush_writes()
+        # Hand the page what changed now, including commits made elsewhere,
+        # rather than after it has been shown
+        self.data_events.poll()
+        self.data_events.emit_pending()
+        self.stacked_widget.setCurrentWidget(self.page(name))
+
     def show_main_menu(self):
+        self.flush_writes()
         self.stacked_widget.setCurrentWidget(self.main_menu_page)
 
     def show_daily_page(self):
-        self.stacked_widget.setCurrentWidget(self.daily_page)
+        self.show_page('daily')
 
     def show_calendar_page(self):
-        self.stacked_widget.setCurrentWidget(self.calendar_page)
+        self.show_page('calendar')
 
     def show_stats_page(self):
-        self.stacked_widget.setCurrentWidget(self.stats_page)
+        self.show_page('stats')
 
     def show_settings_page(self):
-        self.stacked_widget.setCurrentWidget(self.settings_page)
+        self.show_page('settings')
+
+    def schedule_flush(self):
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+
+    def flush_writes(self):
+        """Write buffered edits, retrying later if the database can't take them now.
+
+        An exception escaping a Qt slot aborts the app, so a write that
+        fails (e.g. locked past busy_timeout) is reported and the batch,
+        which the buffer has kept, is tried again on the next timer.
+        """
+        try:
+            self.writes.flush()
+        except sqlite3.Error as error:
+            print(f"Saving progress failed, retrying: {error}", file=sys.stderr)
+            self.flush_timer.start()
+
+    def close_writes(self, attempts=CLOSE_FLUSH_ATTEMPTS):
+        """Write buffered edits before closing; returns False if some are still unwritten.
+
+        Each attempt already waits up to the connection's busy_timeout for
+        a lock held elsewhere, so a few attempts ride out a long write by
+        another process.
+        """
+        for attempt in range(1, attempts + 1):
+            try:
+                self.writes.close()
+                return True
+            except sqlite3.Error as error:
+                print(f"Saving progress failed on close (attempt {attempt} of {attempts}): {error}",
+                      file=sys.stderr)
+        return False
+
+    def closeEvent(self, event):
+        self.flush_timer.stop()
+        saved = self.close_writes()
+        self.data_events.close()
+        self.queries.shutdown()
+        if self._analytics:
+            self._analytics.close()
+        if saved:
+            self.db.close()
+        else:
+            # The buffer is still registered with atexit and flushes through
+            # this connection once more on exit, so it has to stay open
+            print("Unsaved progress will be written again on exit", file=sys.stderr)
+        super().closeEvent(event)
@@ -1,18 +1,38 @@
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
-    QCalendarWidget, QFrame, QScrollArea
+    QCalendarWidget, QScrollArea
 )
 from PyQt6.QtCore import Qt, QDate
 from PyQt6.QtGui import QColor, QTextCharFormat
-from datetime import datetime
-from ui.components.game_widget import GameWidget
+import time
+from collections import OrderedDict
+from database.db_manager import month_offset
+from ui.components.game_widget import CalendarGameRow
+from ui.theme import styled
+from ui.data_events import DataChange
+
+MONTH_CACHE_SIZE = 36  # Month colour maps kept for flipping back and forth
+PREFETCH_MONTHS = 3  # Months loaded ahead of and behind the one shown
+DAY_CACHE_SIZE = 31  # Recently viewed days whose games are kept
+DAY_CACHE_SECONDS = 60  # How long a day's games are reused
 
 class CalendarPage(QWidget):
     def __init__(self, db_manager, main_window):
         super().__init__()
         self.db = db_manager
         self.main_window = main_window
+        # Bumped on every data change, so background loads started before it are dropped
+        self.data_version = 0
+        # (year, month) -> {QDate: QColor}, least recently used first
+        self.month_colors = OrderedDict()
+        # date string -> (time fetched, get_day_games result)
+        self.day_games = OrderedDict()
+        # The date the day panel is showing, if any
+        self.shown_day = None
+        # Changes that arrived while the page was hidden, as one DataChange
+        self.pending_change = None
         self.setup_ui()
+        main_window.data_events.changed.connect(self.on_data_changed)
         
     def setup_ui(self):
         layout = QVBoxLayout(self)
@@ -22,24 +42,12 @@ class CalendarPage(QWidget):
         
         back_btn = QPushButton("←")
         back_btn.setFixedSize(40, 40)
-        back_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4a90e2;
-                border: none;
-                border-radius: 20px;
-                color: white;
-                font-size: 20px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #357abd;
-            }
-        """)
+        styled(back_btn, 'backButton')
         back_btn.clicked.connect(self.main_window.show_main_menu)
         header_layout.addWidget(back_btn)
         
         title = QLabel("Calendar")
-        title.setStyleSheet("font-size: 24px; font-weight: bold;")
+        styled(title, 'pageTitle')
         header_layout.addWidget(title)
         header_layout.addStretch()
         
@@ -48,115 +56,250 @@ class CalendarPage(QWidget):
         # Create Calendar widget
         self.calendar = QCalendarWidget()
         self.calendar.setVerticalHeaderFormat(QCalendarWidget.VerticalHeaderFormat.NoVerticalHeader)
-        self.calendar.setStyleSheet("""
-            QCalendarWidget {
-                background-color: white;
-                border: 1px solid #ddd;
-                border-radius: 10px;
-            }
-            QCalendarWidget QToolButton {
-                color: #4a90e2;
-                background-color: white;
-                border: none;
-            }
-            QCalendarWidget QMenu {
-                background-color: white;
-            }
-            QCalendarWidget QSpinBox {
-                background-color: white;
-                border: 1px solid #ddd;
-                border-radius: 5px;
-            }
-        """)
         self.calendar.clicked.connect(self.date_selected)
+        self.calendar.currentPageChanged.connect(self.show_month)
         layout.addWidget(self.calendar)
         
         # Scroll area for daily games
         self.scroll_area = QScrollArea()
         self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setStyleSheet("QScrollArea { border: none; }")
         
         self.daily_games_widget = QWidget()
         self.daily_games_layout = QVBoxLayout(self.daily_games_widget)
         self.daily_games_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
+
+        # The day panel's widgets are created once and rebound for each day
+        self.day_status_label = QLabel()
+        self.day_status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        styled(self.day_status_label, role='status')
+        self.day_status_label.hide()
+        self.daily_games_layout.addWidget(self.day_status_label)
+        self.date_header = QLabel()
+        styled(self.date_header, role='heading')
+        self.date_header.hide()
+        self.daily_games_layout.addWidget(self.date_header)
+        self.day_rows = []
         
         self.scroll_area.setWidget(self.daily_games_widget)
         layout.addWidget(self.scroll_area)
         
-        # Update calendar data for current month
-        self.update_calendar_data()
+        # The current month is coloured by showEvent
     
+    def showEvent(self, event):
+        if self.pending_change is not None:
+            change, self.pending_change = self.pending_change, None
+            self.apply_change(change)
+        self.update_calendar_data()
+        super().showEvent(event)
+
+    def on_data_changed(self, change):
+        # Changes made while another page is shown are applied on the next visit
+        if not self.isVisible():
+            if self.pending_change is None:
+                self.pending_change = DataChange()
+            self.pending_change.merge(change)
+            return
+        self.apply_change(change)
+
+    def apply_change(self, change):
+        """Bring the cached months and days up to date with a DataChange.
+
+        Progress writes recolour only the days they touched, from one range
+        query; adding or deleting a game changes every day's total, so then
+        the caches are dropped and refilled as months are shown.
+        """
+        self.data_version += 1
+        if change.reset or change.added or change.deleted:
+            self.month_colors.clear()
+            self.day_games.clear()
+            if self.isVisible():
+                self.update_calendar_data()
+            self.refresh_shown_day()
+            return
+
+        dates = change.dates
+        if not dates:
+            return
+        stats = self.db.get_completion_range(min(dates), max(dates))
+        for date_str in dates:
+            self.day_games.pop(date_str, None)
+            colors = self.month_colors.get((int(date_str[:4]), int(date_str[5:7])))
+            if colors is None:
+                continue
+            date = QDate.fromString(date_str, Qt.DateFormat.ISODate)
+            color = self.day_color(stats.get(date_str))
+            if color is None:
+                colors.pop(date, None)
+            else:
+                colors[date] = color
+            if self.isVisible():
+                self.calendar.setDateTextFormat(date, self.day_format(color))
+
+        if self.shown_day and self.shown_day.toString(Qt.DateFormat.ISODate) in dates:
+            self.refresh_shown_day()
+
+    def refresh_shown_day(self):
+        if self.shown_day is not None:
+            self.date_selected(self.shown_day)
+
     def update_calendar_data(self):
-        current_date = self.calendar.selectedDate()
-        year = current_date.year()
-        month = current_date.month()
-        
-        # Get completion stats for the month
-        stats = self.db.get_month_completion_stats(year, month)
-        
-        # Create format for each day based on completion rate
+        self.show_month(self.calendar.yearShown(), self.calendar.monthShown())
+
+    def show_month(self, year, month):
+        """Colour the month now on the calendar's page and prefetch the ones around it.
+
+        The month itself is read on the spot if it isn't cached, which is a
+        single indexed range query; its neighbours are loaded together in
+        the background so flipping pages finds them ready.
+        """
+        if (year, month) not in self.month_colors:
+            self.store_months(self.db.get_completion_months(year, month, 1))
+        self.apply_month_colors(year, month)
+
+        window = [month_offset(year, month, delta)
+                  for delta in range(-PREFETCH_MONTHS, PREFETCH_MONTHS + 1)]
+        missing = [key for key in window if key not in self.month_colors]
+        if missing:
+            first_year, first_month = missing[0]
+            count = (missing[-1][0] - first_year) * 12 + missing[-1][1] - first_month + 1
+            version = self.data_version
+            self.main_window.queries.submit(
+                'calendar_months',
+                lambda db: db.get_completion_months(first_year, first_month, count),
+                on_result=lambda months: self.prefetched_months(version, months)
+            )
+
+    def prefetched_months(self, version, months):
+        if version != self.data_version:
+            # Read before the latest change, so load them again
+            if self.isVisible():
+                self.update_calendar_data()
+            return
+        self.store_months(months)
+        # The page shown may be one of them if it was reached while loading
+        shown = (self.calendar.yearShown(), self.calendar.monthShown())
+        if any(month_offset(*shown, delta) in months for delta in (-1, 0, 1)):
+            self.apply_month_colors(*shown)
+
+    def store_months(self, months):
+        for key, stats in months.items():
+            if key in self.month_colors:
+                continue
+            self.month_colors[key] = self.month_color_map(stats)
+            self.month_colors.move_to_end(key)
+        while len(self.month_colors) > MONTH_CACHE_SIZE:
+            self.month_colors.popitem(last=False)
+
+    def month_color_map(self, stats):
+        """{QDate: QColor} for every tracked day of a month's completion stats"""
+        colors = {}
         for date_str, day_stats in stats.items():
-            date = QDate.fromString(date_str, Qt.DateFormat.ISODate)
-            fmt = QTextCharFormat()
-            
-            if day_stats['total'] > 0:
-                completion_rate = day_stats['completed'] / day_stats['total']
-                
-                # Create color gradient from red to green
-                if completion_rate == 0:
-                    color = QColor(255, 200, 200)  # Light red
-                elif completion_rate == 1:
-                    color = QColor(200, 255, 200)  # Light green
-                else:
-                    # Interpolate between red and green
-                    red = int(255 * (1 - completion_rate))
-                    green = int(255 * completion_rate)
-                    color = QColor(red, green, 200)
-                
-                fmt.setBackground(color)
-                self.calendar.setDateTextFormat(date, fmt)
-    
-    # In calendar_page.py
+            color = self.day_color(day_stats)
+            if color is not None:
+                colors[QDate.fromString(date_str, Qt.DateFormat.ISODate)] = color
+        return colors
+
+    def day_color(self, day_stats):
+        """A day's colour from its completion stats, or None if nothing was tracked"""
+        if not day_stats or day_stats['total'] <= 0:
+            return None
+        completion_rate = day_stats['completed'] / day_stats['total']
 
+        # Create color gradient from red to green
+        if completion_rate == 0:
+            return QColor(255, 200, 200)  # Light red
+        if completion_rate == 1:
+            return QColor(200, 255, 200)  # Light green
+        # Interpolate between red and green
+        red = int(255 * (1 - completion_rate))
+        green = int(255 * completion_rate)
+        return QColor(red, green, 200)
+
+    def day_format(self, color):
+        fmt = QTextCharFormat()
+        if color is not None:
+            fmt.setBackground(color)
+        return fmt
+
+    def apply_month_colors(self, year, month):
+        """Replace the calendar's day colours with those of the page for year/month.
+
+        The page also shows a few days of the months either side, so those
+        are coloured too when they are cached.
+        """
+        self.calendar.setDateTextFormat(QDate(), QTextCharFormat())
+        for delta in (-1, 0, 1):
+            key = month_offset(year, month, delta)
+            colors = self.month_colors.get(key)
+            if colors is None:
+                continue
+            if delta == 0:
+                self.month_colors.move_to_end(key)
+            for date, color in colors.items():
+                self.calendar.setDateTextFormat(date, self.day_format(color))
+    
     def date_selected(self, date):
-        # Clear existing games
-        while self.daily_games_layout.count():
-            child = self.daily_games_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-        
-        # Get games for selected date
+        self.shown_day = date
         date_str = date.toString(Qt.DateFormat.ISODate)
-        games = self.db.get_day_games(date_str)
+        games = self.cached_day_games(date_str)
+        if games is not None:
+            self.main_window.queries.cancel('day_games')
+            self.show_day_games(date, games)
+            return
+
+        self.show_day_status("Loading...")
         
+        # Get games for selected date in the background
+        version = self.data_version
+        self.main_window.queries.submit(
+            'day_games',
+            lambda db: db.get_day_games(date_str),
+            on_result=lambda games: self.day_games_loaded(date, version, games)
+        )
+
+    def cached_day_games(self, date_str):
+        """A recently fetched get_day_games result for the date, or None"""
+        entry = self.day_games.get(date_str)
+        if entry is None:
+            return None
+        fetched, games = entry
+        if time.monotonic() - fetched > DAY_CACHE_SECONDS:
+            del self.day_games[date_str]
+            return None
+        self.day_games.move_to_end(date_str)
+        return games
+
+    def day_games_loaded(self, date, version, games):
+        if version == self.data_version:
+            self.day_games[date.toString(Qt.DateFormat.ISODate)] = (time.monotonic(), games)
+        while len(self.day_games) > DAY_CACHE_SIZE:
+            self.day_games.popitem(last=False)
+        self.show_day_games(date, games)
+
+    def show_day_status(self, text):
+        """Replace the day panel with a single message"""
+        self.date_header.hide()
+        for row in self.day_rows:
+            row.hide()
+        self.day_status_label.setText(text)
+        self.day_status_label.show()
+
+    def show_day_games(self, date, games):
         if not games:
-            no_games_label = QLabel("No games tracked on this date")
-            no_games_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            no_games_label.setStyleSheet("color: #666; padding: 20px;")
-            self.daily_games_layout.addWidget(no_games_label)
+            self.show_day_status("No games tracked on this date")
             return
-        
-        # Add date header
-        date_header = QLabel(date.toString("MMMM d, yyyy"))
-        date_header.setStyleSheet("font-size: 18px; font-weight: bold; margin-bottom: 10px;")
-        self.daily_games_layout.addWidget(date_header)
-        
-        # Add games
-        for game_data in games:
-            # Create the proper game data structure
-            formatted_game_data = {
-                'game': {
-                    'name': game_data['name'],
-                    'url': game_data['url'],
-                    'description': game_data['description'],
-                    'score_type': game_data['score_type']
-                },
-                'completed': game_data.get('completed', False),
-                'score': game_data.get('score', ''),
-                'note': game_data.get('note', '')
-            }
-            
-            # print("Raw game data:", game_data)
-            game_widget = GameWidget(formatted_game_data, mode="calendar")  # Add mode parameter
-            self.daily_games_layout.addWidget(game_widget) 
-            
+
+        self.day_status_label.hide()
+        self.date_header.setText(date.toString("MMMM d, yyyy"))
+        self.date_header.show()
+
+        # Rebind pooled rows, adding more only when a day has more games than ever before
+        while len(self.day_rows) < len(games):
+            row = CalendarGameRow()
+            self.daily_games_layout.addWidget(row)
+            self.day_rows.append(row)
+        for row, game in zip(self.day_rows, games):
+            row.bind(game)
+            row.show()
+        for row in self.day_rows[len(games):]:
+            row.hide()
@@ -1,11 +1,11 @@
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
-    QLabel, QFrame, QScrollArea, QDialog
+    QLabel, QFrame, QDialog
 )
-from PyQt6.QtCore import Qt
 from datetime import datetime
-from ui.components.game_widget import GameWidget
+from ui.components.game_list import DailyGamesModel, GameListView
 from ui.dialogs.add_game_dialog import AddGameDialog
+from ui.theme import styled
 
 class DailyPage(QWidget):
     def __init__(self, db_manager, main_window):
@@ -14,6 +14,7 @@ class DailyPage(QWidget):
         self.main_window = main_window
         self.setup_ui()
         self.load_daily_games()
+        main_window.data_events.changed.connect(self.on_data_changed)
 
     def setup_ui(self):
         layout = QVBoxLayout(self)
@@ -23,46 +24,23 @@ class DailyPage(QWidget):
         
         back_btn = QPushButton("←")
         back_btn.setFixedSize(40, 40)
-        back_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4a90e2;
-                border: none;
-                border-radius: 20px;
-                color: white;
-                font-size: 20px;
-                font-weight: bold;
-            }
-        """)
+        styled(back_btn, 'backButton')
         back_btn.clicked.connect(self.go_back)
         
         header_layout.addWidget(back_btn)
         
         title = QLabel("Daily Games")
-        title.setStyleSheet("font-size: 24px; font-weight: bold;")
+        styled(title, 'pageTitle')
         header_layout.addWidget(title)
         
         # Progress indicator
         self.progress_label = QLabel()
-        self.progress_label.setStyleSheet("""
-            QLabel {
-                color: #28a745;
-                font-size: 16px;
-                margin-left: 20px;
-            }
-        """)
+        styled(self.progress_label, 'progressLabel')
         header_layout.addWidget(self.progress_label)
         header_layout.addStretch()
         
         add_game_btn = QPushButton("Add Game")
-        add_game_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #28a745;
-                color: white;
-                border: none;
-                border-radius: 15px;
-                padding: 8px 15px;
-            }
-        """)
+        styled(add_game_btn, 'addGameButton')
         add_game_btn.clicked.connect(self.show_add_game_dialog)
         header_layout.addWidget(add_game_btn)
         
@@ -71,21 +49,16 @@ class DailyPage(QWidget):
         # Add a line separator
         line = QFrame()
         line.setFrameShape(QFrame.Shape.HLine)
-        line.setStyleSheet("background-color: #cccccc;")
+        styled(line, 'separator')
         layout.addWidget(line)
         
-        # Create a scroll area for games
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setStyleSheet("QScrollArea { border: none; }")
-        
-        # Create a widget to hold the games list
-        self.games_widget = QWidget()
-        self.games_container = QVBoxLayout(self.games_widget)
-        self.games_container.setAlignment(Qt.AlignmentFlag.AlignTop)
-        
-        scroll_area.setWidget(self.games_widget)
-        layout.addWidget(scroll_area)
+        # Games are rows of a model painted by a delegate, so only visible rows cost anything
+        self.games_model = DailyGamesModel(self)
+        self.games_model.progress_edited.connect(self.handle_game_completion)
+        self.games_model.completion_changed.connect(self.update_progress_label)
+        self.games_view = GameListView()
+        self.games_view.setModel(self.games_model)
+        layout.addWidget(self.games_view)
 
     def go_back(self):
         self.main_window.show_main_menu()
@@ -94,62 +67,51 @@ class DailyPage(QWidget):
         dialog = AddGameDialog(self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             game = dialog.get_game_data()
-            self.db.add_game(game)
+            game.id = self.db.add_game(game)
+            # A new game has no progress yet, so it can be added without a reload
+            self.games_model.add_row({
+                'game': game,
+                'completed': False,
+                'score': None,
+                'note': None
+            })
+
+    def on_data_changed(self, change):
+        # Progress written for today came from this page's own edits, which
+        # the model already shows; only the list of games needs following
+        if change.reset or change.added - set(self.games_model.row_by_id):
             self.load_daily_games()
+            return
+        for game_id in change.deleted:
+            self.games_model.remove_game(game_id)
 
     def load_daily_games(self):
-        # Clear existing games from container
-        while self.games_container.count():
-            child = self.games_container.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-            elif child.layout():
-                while child.layout().count():
-                    item = child.layout().takeAt(0)
-                    if item.widget():
-                        item.widget().deleteLater()
-
-        # Get today's progress for all games
-        today_progress = self.db.get_daily_progress(datetime.now().date())
-        
-        # Track completed games
-        completed_count = 0
-        total_count = len(today_progress)
+        self.progress_label.setText("Loading...")
+        today = datetime.now().date()
+        self.main_window.queries.submit(
+            'daily_progress',
+            lambda db: db.get_daily_progress(today),
+            on_result=self.show_daily_games
+        )
 
-        # Add games to container
+    def show_daily_games(self, today_progress):
+        # Show edits that are still waiting to be written
+        pending = self.main_window.writes.pending_for_date(datetime.now().date())
         for progress in today_progress:
-            game_widget = GameWidget(progress)
-            game_widget.game_completed.connect(self.handle_game_completion)
-            
-            # If game was already completed today
-            if progress.get('completed'):
-                game_widget.completed = True
-                game_widget.update_appearance()
-                completed_count += 1
-            
-            self.games_container.addWidget(game_widget)
-        
-        # Update progress label
-        self.update_progress_label(completed_count, total_count)
+            if progress['game'].id in pending:
+                progress.update(pending[progress['game'].id])
 
-    def handle_game_completion(self, game_data, score, note):
-        # Get the game widget that emitted the signal
-        game_widget = self.sender()
-        
-        # Update database with completion status, score, and note
-        self.db.update_game_progress(
-            game_data['game'].id,
+        self.games_model.reconcile(today_progress)
+
+    def handle_game_completion(self, game_id, completed, score, note):
+        # Queue completion status, score, and note for the next batched write
+        self.main_window.writes.put(
+            game_id,
             datetime.now().date(),
-            completed=game_widget.completed,
+            completed=completed,
             score=score,
             note=note
         )
-        
-        # Update progress label
-        completed_count = sum(1 for i in range(self.games_container.count())
-                            if self.games_container.itemAt(i).widget().completed)
-        total_count = self.games_container.count()
-        self.update_progress_label(completed_count, total_count)
 
     def update_progress_label(self, completed, total):
         if total > 0:
@@ -1,5 +1,6 @@
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QFrame
 from PyQt6.QtCore import Qt
+from ui.theme import styled
 
 class SettingsPage(QWidget):
     def __init__(self, db_manager, main_window):
@@ -16,22 +17,13 @@ class SettingsPage(QWidget):
         
         back_btn = QPushButton("←")
         back_btn.setFixedSize(40, 40)
-        back_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4a90e2;
-                border: none;
-                border-radius: 20px;
-                color: white;
-                font-size: 20px;
-                font-weight: bold;
-            }
-        """)
+        styled(back_btn, 'backButton')
         back_btn.clicked.connect(self.go_back)
         
         header_layout.addWidget(back_btn)
         
         title = QLabel("Settings")
-        title.setStyleSheet("font-size: 24px; font-weight: bold;")
+        styled(title, 'pageTitle')
         header_layout.addWidget(title)
         header_layout.addStretch()
         
@@ -40,7 +32,7 @@ class SettingsPage(QWidget):
         # Add a line separator
         line = QFrame()
         line.setFrameShape(QFrame.Shape.HLine)
-        line.setStyleSheet("background-color: #cccccc;")
+        styled(line, 'separator')
         layout.addWidget(line)
         
         # Placeholder content
@@ -1,16 +1,38 @@
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, 
-    QFrame, QScrollArea, QGridLayout, QStackedWidget
+    QFrame, QScrollArea, QGridLayout, QStackedWidget, QButtonGroup
 )
 from PyQt6.QtCore import Qt
-from datetime import datetime
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
+import math
+from collections import OrderedDict
+from datetime import date, timedelta
 from PyQt6.QtCore import pyqtSignal
+from ui.components.history_list import GameHistoryModel, HistoryListView
+from ui.components.charts import Sparkline, MiniHeatmap, PieChart, LineChart
+from ui.theme import COLORS, styled
+from ui.data_events import DataChange
+
+# Score chart ranges in days; None covers the game's whole history
+SCORE_RANGES = {'Week': 7, 'Month': 30, 'Year': 365, 'All': None}
+DEFAULT_SCORE_RANGE = 'Month'
+SCORE_POINTS = 120  # Longer ranges are downsampled to this many points
+ACTIVITY_DAYS = 28  # Days of activity shown on each game's overview row
+DETAIL_CACHE_SIZE = 8  # Game detail views kept alive for quick switching
+
+
+def score_range_start(range_name):
+    days = SCORE_RANGES[range_name]
+    return (date.today() - timedelta(days=days - 1)).isoformat() if days else None
+
+
+def fetch_profile(db, game_id):
+    """Everything a GameDetailWidget shows, for the default score range"""
+    return db.get_game_profile(game_id, score_range_start(DEFAULT_SCORE_RANGE))
+
 
 class ClickableFrame(QFrame):
     clicked = pyqtSignal()
+    hovered = pyqtSignal()
 
     def __init__(self, parent=None, game_data=None):
         super().__init__(parent)
@@ -21,10 +43,16 @@ class ClickableFrame(QFrame):
             self.clicked.emit()
         super().mousePressEvent(a0)
 
+    def enterEvent(self, event):
+        self.hovered.emit()
+        super().enterEvent(event)
+
 class GameDetailWidget(QWidget):
-    def __init__(self, game_data, db, parent_page):
+    def __init__(self, game_data, db, parent_page, profile=None):
         super().__init__()
-        self.game_data = game_data
+        # A prefetched profile has fresher stats than the overview row
+        self.game_data = profile['stats'] if profile else game_data
+        self.profile = profile
         self.db = db
         self.parent_page = parent_page
         self.setup_ui()
@@ -38,25 +66,13 @@ class GameDetailWidget(QWidget):
         
         back_btn = QPushButton("←")
         back_btn.setFixedSize(40, 40)
-        back_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4a90e2;
-                border: none;
-                border-radius: 20px;
-                color: white;
-                font-size: 20px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #357abd;
-            }
-        """)
+        styled(back_btn, 'backButton')
         back_btn.clicked.connect(self.go_back)
         
         header_layout.addWidget(back_btn)
         
         title = QLabel(self.game_data[1])  # index 1 is name
-        title.setStyleSheet("font-size: 24px; font-weight: bold;")
+        styled(title, 'pageTitle')
         header_layout.addWidget(title)
         header_layout.addStretch()
         
@@ -65,17 +81,10 @@ class GameDetailWidget(QWidget):
         # Add a line separator
         line = QFrame()
         line.setFrameShape(QFrame.Shape.HLine)
-        line.setStyleSheet("background-color: #cccccc;")
+        styled(line, 'separator')
         layout.addWidget(line)
 
-        # Create scroll area for content
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("QScrollArea { border: none; }")
-        
-        content_widget = QWidget()
-        content_layout = QVBoxLayout(content_widget)
-        content_layout.setSpacing(20)
+        content_layout = layout
 
         # Stats grid
         stats_grid = QGridLayout()
@@ -84,8 +93,8 @@ class GameDetailWidget(QWidget):
         # Times completed
         completed_label = QLabel("Times Completed")
         completed_value = QLabel(str(self.game_data[3]))  # index 3 is times_completed
-        completed_label.setStyleSheet("color: #666; font-size: 16px;")
-        completed_value.setStyleSheet("font-size: 20px; font-weight: bold;")
+        styled(completed_label, role='caption', scale='large')
+        styled(completed_value, role='value', scale='large')
         stats_grid.addWidget(completed_label, 0, 0)
         stats_grid.addWidget(completed_value, 1, 0)
 
@@ -93,102 +102,203 @@ class GameDetailWidget(QWidget):
         if self.game_data[2] and self.game_data[2].isdigit():  # index 2 is score_type
             if self.game_data[6]:  # index 6 is best_score
                 best_label = QLabel("Best Score")
-                best_value = QLabel(f"{self.game_data[6]}/{self.game_data[2]}")
+                best_value = QLabel(f"{self.game_data[6]:g}/{self.game_data[2]}")
                 best_date = self.game_data[7]  # index 7 is best_score_date
                 if best_date:
                     best_value.setToolTip(f"Achieved on {best_date}")
-                best_label.setStyleSheet("color: #666; font-size: 16px;")
-                best_value.setStyleSheet("font-size: 20px; font-weight: bold; color: #28a745;")
+                styled(best_label, role='caption', scale='large')
+                styled(best_value, role='value', scale='large', tone='good')
                 stats_grid.addWidget(best_label, 0, 1)
                 stats_grid.addWidget(best_value, 1, 1)
 
+            if self.game_data[10] is not None:  # index 10 is median_score
+                median_label = QLabel("Median Score")
+                median_value = QLabel(f"{self.game_data[10]:g}/{self.game_data[2]}")
+                styled(median_label, role='caption', scale='large')
+                styled(median_value, role='value', scale='large')
+                stats_grid.addWidget(median_label, 0, 2)
+                stats_grid.addWidget(median_value, 1, 2)
+
+            if self.game_data[8] is not None:  # index 8 is worst_score
+                worst_label = QLabel("Worst Score")
+                worst_value = QLabel(f"{self.game_data[8]:g}/{self.game_data[2]}")
+                worst_date = self.game_data[9]  # index 9 is worst_score_date
+                if worst_date:
+                    worst_value.setToolTip(f"On {worst_date}")
+                styled(worst_label, role='caption', scale='large')
+                styled(worst_value, role='value', scale='large', tone='bad')
+                stats_grid.addWidget(worst_label, 0, 3)
+                stats_grid.addWidget(worst_value, 1, 3)
+
         content_layout.addLayout(stats_grid)
 
+        # Graphs are filled in by show_details once loaded
+        self.loading_label = QLabel("Loading...")
+        self.loading_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        styled(self.loading_label, role='status')
+        content_layout.addWidget(self.loading_label)
+        self.content_layout = content_layout
+
+        # History is paged in as the list is scrolled
+        self.history_label = QLabel("Game History")
+        styled(self.history_label, 'historyLabel', role='heading')
+        self.history_label.hide()
+        content_layout.addWidget(self.history_label)
+
+        self.history_model = GameHistoryModel(
+            self.parent_page.main_window.queries, self.game_data[0], parent=self
+        )
+        self.history_model.rowsInserted.connect(self.show_history)
+        self.history_view = HistoryListView()
+        self.history_view.setModel(self.history_model)
+        self.history_view.hide()
+        content_layout.addWidget(self.history_view, 1)
+
+        if self.profile:
+            self.show_profile(self.profile)
+        else:
+            self.load_details()
+
+    def show_history(self):
+        self.history_label.show()
+        self.history_view.show()
+
+    def load_details(self):
+        game_id = self.game_data[0]
+        # The profile brings the first history page; don't let the view ask for it too
+        self.history_model.loading = True
+        self.parent_page.main_window.queries.submit(
+            f'profile:{game_id}', fetch_profile, game_id,
+            on_result=self.show_profile,
+            on_error=self.history_model.fetch_failed
+        )
+
+    def show_profile(self, profile):
+        if profile is None:
+            # The game was deleted
+            self.loading_label.setText("This game no longer exists")
+            self.history_model.fetch_failed(None)
+            return
+        numeric = self.game_data[2] and self.game_data[2].isdigit()
+        self.show_details({
+            # Whether the game has any numeric score, in or out of the default range
+            'scored': bool(numeric) and profile['stats'][6] is not None,
+            'scores': profile['scores'] if numeric else [],
+            'completion': profile['completion'],
+            'streak': profile['streak'],
+        })
+        self.history_model.append_page(profile['history'])
+
+    def show_details(self, details):
+        # Graphs take the place of the loading label
+        insert_at = self.content_layout.indexOf(self.loading_label)
+        self.loading_label.deleteLater()
+        content_layout = QVBoxLayout()
+        content_layout.setSpacing(20)
+        self.content_layout.insertLayout(insert_at, content_layout)
+
         # Graphs section
         graphs_layout = QHBoxLayout()
         
-        # Score line graph (if applicable)
-        if self.game_data[2] and self.game_data[2].isdigit():
-            current_date = datetime.now()
-            scores_data = self.db.get_monthly_scores(
-                self.game_data[0],  # game_id
-                current_date.year,
-                current_date.month
-            )
-            
-            if scores_data:
-                fig = Figure(figsize=(6, 4))
-                ax = fig.add_subplot(111)
-                
-                dates = [row[0] for row in scores_data]
-                scores = [int(row[1]) for row in scores_data]
-                
-                ax.plot(dates, scores, 'b-o')
-                ax.set_ylim(0, int(self.game_data[2]))
-                ax.set_xlabel('Date')
-                ax.set_ylabel('Score')
-                ax.set_title('Monthly Scores')
-                
-                canvas = FigureCanvas(fig)
-                graphs_layout.addWidget(canvas)
+        # Score line graph (if applicable), even when the default range is
+        # empty so older scores can still be reached through the range buttons
+        if details.get('scored'):
+            score_layout = QVBoxLayout()
+
+            # Range selector
+            range_layout = QHBoxLayout()
+            range_group = QButtonGroup(self)
+            for range_name in SCORE_RANGES:
+                range_btn = QPushButton(range_name)
+                range_btn.setCheckable(True)
+                range_btn.setChecked(range_name == DEFAULT_SCORE_RANGE)
+                range_btn.clicked.connect(lambda checked, r=range_name: self.load_scores(r))
+                range_group.addButton(range_btn)
+                range_layout.addWidget(range_btn)
+            range_layout.addStretch()
+            score_layout.addLayout(range_layout)
+
+            self.score_chart = LineChart()
+            score_layout.addWidget(self.score_chart)
+            self.plot_scores(details['scores'], DEFAULT_SCORE_RANGE)
+            graphs_layout.addLayout(score_layout)
 
         # Completion pie chart
-        completion_data = self.db.get_completion_percentage(self.game_data[0])
+        completion_data = details['completion']
         if completion_data:
             completed, total = completion_data
             if total > 0:
-                fig = Figure(figsize=(4, 4))
-                ax = fig.add_subplot(111)
-                
-                labels = ['Completed', 'Missed']
-                sizes = [completed, total - completed]
-                colors = ['#28a745', '#dc3545']
-                
-                ax.pie(sizes, labels=labels, colors=colors, autopct='%1.1f%%')
-                ax.set_title('Completion Rate')
-                
-                canvas = FigureCanvas(fig)
-                graphs_layout.addWidget(canvas)
+                pie = PieChart([
+                    ('Completed', completed, COLORS['good']),
+                    ('Missed', total - completed, COLORS['bad'])
+                ], 'Completion Rate')
+                graphs_layout.addWidget(pie)
 
         content_layout.addLayout(graphs_layout)
 
-        # History section
-        history_data = self.db.get_game_history(self.game_data[0])
-        if history_data:
-            history_label = QLabel("Game History")
-            history_label.setStyleSheet("font-size: 18px; font-weight: bold; margin-top: 20px;")
-            content_layout.addWidget(history_label)
-
-            for entry in history_data:
-                entry_widget = QFrame()
-                entry_widget.setStyleSheet("""
-                    QFrame {
-                        background-color: #f8f9fa;
-                        border-radius: 10px;
-                        padding: 10px;
-                        margin: 5px;
-                    }
-                """)
-                entry_layout = QVBoxLayout(entry_widget)
-                
-                date_label = QLabel(str(entry[0]))
-                date_label.setStyleSheet("font-weight: bold;")
-                entry_layout.addWidget(date_label)
-                
-                if entry[2]:  # Score
-                    score_label = QLabel(f"Score: {entry[2]}")
-                    entry_layout.addWidget(score_label)
-                
-                if entry[3]:  # Note
-                    note_label = QLabel(f"Note: {entry[3]}")
-                    note_label.setWordWrap(True)
-                    entry_layout.addWidget(note_label)
-                
-                content_layout.addWidget(entry_widget)
-
-        content_layout.addStretch()
-        scroll.setWidget(content_widget)
-        layout.addWidget(scroll)
+        # Streaks, with the most recent runs of consecutive completions
+        streak = details.get('streak')
+        if streak and streak['longest']:
+            streak_label = QLabel(
+                f"Current streak: {streak['current']} days   "
+                f"Longest streak: {streak['longest']} days"
+            )
+            styled(streak_label, role='name')
+            content_layout.addWidget(streak_label)
+            runs_label = QLabel("Recent streaks:  " + "   ".join(
+                f"{start} to {end} ({length} days)" if length > 1 else f"{start} (1 day)"
+                for start, end, length in streak['runs']
+            ))
+            runs_label.setWordWrap(True)
+            styled(runs_label, role='note')
+            content_layout.addWidget(runs_label)
+
+        # Score distribution, once the analytics arrays are loaded
+        if self.game_data[2] and self.game_data[2].isdigit():
+            self.percentile_label = QLabel()
+            styled(self.percentile_label, role='note')
+            self.percentile_label.hide()
+            content_layout.addWidget(self.percentile_label)
+            self.parent_page.main_window.analytics(self.show_percentiles)
+
+    def show_percentiles(self, analytics):
+        percentiles = analytics.score_percentiles(self.game_data[0], (25, 50, 75, 90))
+        if percentiles:
+            names = {25: "25th", 50: "Median", 75: "75th", 90: "90th"}
+            self.percentile_label.setText("Score percentiles:  " + "   ".join(
+                f"{names[p]}: {value:g}" for p, value in percentiles.items()
+            ))
+            self.percentile_label.show()
+
+    def load_scores(self, range_name):
+        game_id = self.game_data[0]
+        start = score_range_start(range_name)
+        self.parent_page.main_window.queries.submit(
+            f'scores:{game_id}',
+            lambda db: db.get_score_series(game_id, start, None, SCORE_POINTS),
+            on_result=lambda series: self.plot_scores(series, range_name)
+        )
+
+    def plot_scores(self, series, range_name):
+        # Downsampled buckets also show their spread around the mean
+        bucketed = any(row[4] > 1 for row in series)
+        self.score_chart.set_series(
+            [row[0] for row in series],
+            [row[1] for row in series],
+            int(self.game_data[2]),
+            lows=[row[2] for row in series] if bucketed else None,
+            highs=[row[3] for row in series] if bucketed else None,
+            title=f'Scores ({range_name})'
+        )
+
+    def dispose(self):
+        """Drop any outstanding queries and schedule the widget for deletion"""
+        game_id = self.game_data[0]
+        queries = self.parent_page.main_window.queries
+        for key in (f'profile:{game_id}', f'scores:{game_id}', f'history:{game_id}'):
+            queries.cancel(key)
+        self.parent_page.main_window.cancel_analytics(self.show_percentiles)
+        self.deleteLater()
 
     def go_back(self):
         self.parent_page.stacked_widget.setCurrentWidget(self.parent_page.main_stats)
@@ -198,8 +308,15 @@ class StatsPage(QWidget):
         super().__init__()
         self.db = db_manager
         self.main_window = main_window
+        self.current_detail_widget = None
+        # game id -> (game generation, GameDetailWidget), least recently shown first
+        self.detail_cache = OrderedDict()
+        # game id -> (game generation, get_game_profile result) fetched on hover
+        self.profiles = OrderedDict()
+        # Changes that arrived while the page was hidden, as one DataChange
+        self.pending_change = None
         self.setup_ui()
-        self.current_detail_widget = None  # Add this to track current detail widget
+        main_window.data_events.changed.connect(self.on_data_changed)
 
     def setup_ui(self):
         # Create main layout
@@ -217,14 +334,55 @@ class StatsPage(QWidget):
         self.stacked_widget.addWidget(self.main_stats)
 
     def show_game_details(self, game_data):
-        # Remove previous detail widget if it exists
-        if self.current_detail_widget:
-            self.stacked_widget.removeWidget(self.current_detail_widget)
-        
-        # Create new detail widget
-        self.current_detail_widget = GameDetailWidget(game_data, self.db, self)
-        self.stacked_widget.addWidget(self.current_detail_widget)
-        self.stacked_widget.setCurrentWidget(self.current_detail_widget)
+        game_id = game_data[0]
+        generation = self.db.stats_cache.game_generation(game_id)
+
+        # Reuse the cached view unless the game has been written to since
+        cached = self.detail_cache.pop(game_id, None)
+        if cached and cached[0] == generation:
+            detail_widget = cached[1]
+        else:
+            if cached:
+                self.dispose_detail_widget(cached[1])
+            profile = self.profiles.pop(game_id, None)
+            profile = profile[1] if profile and profile[0] == generation else None
+            detail_widget = GameDetailWidget(game_data, self.db, self, profile)
+            self.stacked_widget.addWidget(detail_widget)
+        self.detail_cache[game_id] = (generation, detail_widget)
+
+        while len(self.detail_cache) > DETAIL_CACHE_SIZE:
+            _, (_, evicted) = self.detail_cache.popitem(last=False)
+            self.dispose_detail_widget(evicted)
+
+        self.current_detail_widget = detail_widget
+        self.stacked_widget.setCurrentWidget(detail_widget)
+
+    def prefetch_profile(self, game_id):
+        """Load a game's profile in the background so its details open ready"""
+        generation = self.db.stats_cache.game_generation(game_id)
+        for cache in (self.detail_cache, self.profiles):
+            cached = cache.get(game_id)
+            if cached and cached[0] == generation:
+                return
+        key = f'profile:{game_id}'
+        if self.main_window.queries.is_pending(key):
+            return
+        self.main_window.queries.submit(
+            key, fetch_profile, game_id,
+            on_result=lambda profile: self.store_profile(game_id, generation, profile)
+        )
+
+    def store_profile(self, game_id, generation, profile):
+        self.profiles[game_id] = (generation, profile)
+        self.profiles.move_to_end(game_id)
+        while len(self.profiles) > DETAIL_CACHE_SIZE:
+            self.profiles.popitem(last=False)
+
+    def dispose_detail_widget(self, detail_widget):
+        if detail_widget is self.current_detail_widget:
+            self.current_detail_widget = None
+        self.stacked_widget.removeWidget(detail_widget)
+        detail_widget.dispose()
 
     def go_back(self):
         if self.stacked_widget.currentWidget() == self.main_stats:
@@ -241,41 +399,34 @@ class StatsPage(QWidget):
 
         # Overall Stats Section
         overall_stats = QFrame()
-        overall_stats.setStyleSheet("""
-            QFrame {
-                background-color: #f8f9fa;
-                border-radius: 10px;
-                padding: 15px;
-            }
-        """)
+        styled(overall_stats, role='card')
         overall_layout = QVBoxLayout(overall_stats)
         
         # Overall Stats Title
         overall_title = QLabel("Overall Statistics")
-        overall_title.setStyleSheet("font-size: 18px; font-weight: bold; margin-bottom: 10px;")
+        styled(overall_title, role='heading')
         overall_layout.addWidget(overall_title)
         
         # Streaks Grid
         streaks_grid = QGridLayout()
         
         # Current Streak
-        current_streak = self.db.get_current_streak()
         current_streak_label = QLabel("Current Streak")
-        current_streak_value = QLabel(f"{current_streak} days")
-        current_streak_label.setStyleSheet("color: #666;")
-        current_streak_value.setStyleSheet("font-size: 24px; font-weight: bold; color: #28a745;")
+        self.current_streak_value = QLabel()
+        styled(current_streak_label, role='caption')
+        styled(self.current_streak_value, role='value', scale='huge', tone='good')
         
         # Longest Streak
-        longest_streak = self.db.get_longest_streak()
         longest_streak_label = QLabel("Longest Streak")
-        longest_streak_value = QLabel(f"{longest_streak} days")
-        longest_streak_label.setStyleSheet("color: #666;")
-        longest_streak_value.setStyleSheet("font-size: 24px; font-weight: bold; color: #4a90e2;")
+        self.longest_streak_value = QLabel()
+        styled(longest_streak_label, role='caption')
+        styled(self.longest_streak_value, role='value', scale='huge', tone='accent')
         
         streaks_grid.addWidget(current_streak_label, 0, 0)
-        streaks_grid.addWidget(current_streak_value, 1, 0)
+        streaks_grid.addWidget(self.current_streak_value, 1, 0)
         streaks_grid.addWidget(longest_streak_label, 0, 1)
-        streaks_grid.addWidget(longest_streak_value, 1, 1)
+        streaks_grid.addWidget(self.longest_streak_value, 1, 1)
+        self.update_overall_stats()
         
         overall_layout.addLayout(streaks_grid)
         layout.addWidget(overall_stats)
@@ -283,96 +434,207 @@ class StatsPage(QWidget):
         # Games Stats Section
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("QScrollArea { border: none; }")
         
         games_widget = QWidget()
-        games_layout = QVBoxLayout(games_widget)
-        games_layout.setSpacing(15)
+        self.games_layout = QVBoxLayout(games_widget)
+        self.games_layout.setSpacing(15)
+
+        # game id -> its overview row, in get_game_stats (id) order
+        self.game_rows = {}
+        game_streaks = self.db.get_game_streaks()
+        for game in self.db.get_game_stats():
+            self.game_rows[game[0]] = self.create_game_row(game, game_streaks)
+            self.games_layout.addWidget(self.game_rows[game[0]])
         
-        games_stats = self.db.get_game_stats()
+        self.games_layout.addStretch()
+        scroll.setWidget(games_widget)
+        layout.addWidget(scroll)
+
+        # Recent activity comes from the analytics arrays, loaded in the background
+        self.main_window.analytics(self.show_activity)
+
+    def update_overall_stats(self):
+        self.current_streak_value.setText(f"{self.db.get_current_streak()} days")
+        self.longest_streak_value.setText(f"{self.db.get_longest_streak()} days")
+
+    def show_activity(self, analytics, game_ids=None):
+        """Fill in the recent activity of the overview rows for game_ids (default: all)"""
+        activity_ids, activity_completed, activity_scores = analytics.activity(ACTIVITY_DAYS)
+        activity_rows = {game_id: row for row, game_id in enumerate(activity_ids)}
+        completion_rates = analytics.completion_rates(
+            date.today() - timedelta(days=ACTIVITY_DAYS - 1)
+        )
+        for game_id in self.game_rows if game_ids is None else game_ids:
+            game_widget = self.game_rows.get(game_id)
+            row = activity_rows.get(game_id)
+            if game_widget is None or row is None:
+                continue
+            game = game_widget.game_data
+            game_widget.recent_value.setText(f"{completion_rates.get(game_id, 0):.0%}")
+
+            # Completions, plus scores for numeric games
+            game_widget.heatmap.set_values([
+                None if done < 0 else float(done)
+                for done in activity_completed[row].tolist()
+            ])
+            scores = [None if math.isnan(score) else score
+                      for score in activity_scores[row].tolist()]
+            if game[2] and game[2].isdigit() and any(score is not None for score in scores):
+                if game_widget.sparkline is None:
+                    game_widget.sparkline = Sparkline(maximum=int(game[2]))
+                    game_widget.activity_layout.addWidget(game_widget.sparkline)
+                game_widget.sparkline.set_values(scores, int(game[2]))
+
+    def create_game_row(self, game, game_streaks):
+        game_widget = ClickableFrame(self, game)
+        game_widget.clicked.connect(lambda g=game: self.show_game_details(g))
+        game_widget.hovered.connect(lambda g=game: self.prefetch_profile(g[0]))
         
-        for game in games_stats:
-            game_widget = ClickableFrame(self, game)
-            game_widget.clicked.connect(lambda g=game: self.show_game_details(g))
-            
-            game_widget.setStyleSheet("""
-                QFrame {
-                    background-color: #f8f9fa;
-                    border-radius: 10px;
-                    padding: 15px;
-                }
-                QFrame:hover {
-                    background-color: #e9ecef;
-                }
-            """)
-            game_widget.setCursor(Qt.CursorShape.PointingHandCursor)
-            
-            game_layout = QVBoxLayout(game_widget)
-            
-            # Game Name
-            name_label = QLabel(game[1])
-            name_label.setStyleSheet("font-size: 16px; font-weight: bold;")
-            game_layout.addWidget(name_label)
-            
-            # Stats Grid
-            stats_grid = QGridLayout()
-            stats_grid.setSpacing(10)
-            
-            # Times Completed - simplified styling
-            completed_label = QLabel("Times Completed")
-            completed_value = QLabel(str(game[3]))
-            completed_label.setStyleSheet("color: #666;")
-            completed_value.setStyleSheet("font-weight: bold;")
-            stats_grid.addWidget(completed_label, 0, 0)
-            stats_grid.addWidget(completed_value, 1, 0)
-            
-            # Score stats if applicable - simplified styling
-            if game[2] and game[2].isdigit():
-                if game[5]:
-                    avg_score = round(game[5], 2)
-                    avg_label = QLabel("Average Score")
-                    avg_value = QLabel(f"{avg_score}/{game[2]}")
-                    avg_label.setStyleSheet("color: #666;")
-                    avg_value.setStyleSheet("font-weight: bold;")
-                    stats_grid.addWidget(avg_label, 0, 1)
-                    stats_grid.addWidget(avg_value, 1, 1)
-                
-                if game[6]:
-                    best_label = QLabel("Best Score")
-                    best_value = QLabel(f"{game[6]}/{game[2]}")
-                    best_date = game[7]
-                    if best_date:
-                        best_value.setToolTip(f"Achieved on {best_date}")
-                    best_label.setStyleSheet("color: #666;")
-                    best_value.setStyleSheet("font-weight: bold; color: #28a745;")
-                    stats_grid.addWidget(best_label, 0, 2)
-                    stats_grid.addWidget(best_value, 1, 2)
+        styled(game_widget, role='card', clickable=True)
+        game_widget.setCursor(Qt.CursorShape.PointingHandCursor)
+        
+        game_layout = QVBoxLayout(game_widget)
+        
+        # Game Name
+        name_label = QLabel(game[1])
+        styled(name_label, role='name')
+        game_layout.addWidget(name_label)
+        
+        # Stats Grid
+        stats_grid = QGridLayout()
+        stats_grid.setSpacing(10)
+        
+        # Times Completed - simplified styling
+        completed_label = QLabel("Times Completed")
+        completed_value = QLabel(str(game[3]))
+        styled(completed_label, role='caption')
+        styled(completed_value, role='value')
+        stats_grid.addWidget(completed_label, 0, 0)
+        stats_grid.addWidget(completed_value, 1, 0)
+        
+        # Score stats if applicable - simplified styling
+        if game[2] and game[2].isdigit():
+            if game[5]:
+                avg_score = round(game[5], 2)
+                avg_label = QLabel("Average Score")
+                avg_value = QLabel(f"{avg_score}/{game[2]}")
+                styled(avg_label, role='caption')
+                styled(avg_value, role='value')
+                stats_grid.addWidget(avg_label, 0, 1)
+                stats_grid.addWidget(avg_value, 1, 1)
             
-            game_layout.addLayout(stats_grid)
-            games_layout.addWidget(game_widget)
+            if game[6]:
+                best_label = QLabel("Best Score")
+                best_value = QLabel(f"{game[6]:g}/{game[2]}")
+                best_date = game[7]
+                if best_date:
+                    best_value.setToolTip(f"Achieved on {best_date}")
+                styled(best_label, role='caption')
+                styled(best_value, role='value', tone='good')
+                stats_grid.addWidget(best_label, 0, 2)
+                stats_grid.addWidget(best_value, 1, 2)
+
+        recent_label = QLabel(f"Last {ACTIVITY_DAYS} Days")
+        game_widget.recent_value = QLabel("–")
+        styled(recent_label, role='caption')
+        styled(game_widget.recent_value, role='value')
+        stats_grid.addWidget(recent_label, 0, 3)
+        stats_grid.addWidget(game_widget.recent_value, 1, 3)
+
+        current, longest = game_streaks.get(game[0], (0, 0))
+        streak_label = QLabel("Streak")
+        streak_value = QLabel(f"{current} days")
+        streak_value.setToolTip(f"Longest: {longest} days")
+        styled(streak_label, role='caption')
+        styled(streak_value, role='value')
+        if current:
+            styled(streak_value, tone='good')
+        stats_grid.addWidget(streak_label, 0, 4)
+        stats_grid.addWidget(streak_value, 1, 4)
         
-        games_layout.addStretch()
-        scroll.setWidget(games_widget)
-        layout.addWidget(scroll)
+        game_layout.addLayout(stats_grid)
+
+        # Recent activity, blank until show_activity fills it in
+        game_widget.activity_layout = QHBoxLayout()
+        game_widget.heatmap = MiniHeatmap([None] * ACTIVITY_DAYS)
+        game_widget.heatmap.setToolTip(f"Last {ACTIVITY_DAYS} days")
+        game_widget.activity_layout.addWidget(game_widget.heatmap)
+        game_widget.activity_layout.addStretch()
+        game_widget.sparkline = None
+        game_layout.addLayout(game_widget.activity_layout)
+
+        return game_widget
+
+    def showEvent(self, event):
+        if self.pending_change is not None:
+            change, self.pending_change = self.pending_change, None
+            self.apply_change(change)
+        super().showEvent(event)
+
+    def on_data_changed(self, change):
+        # Changes made while another page is shown are applied on the next visit
+        if not self.isVisible():
+            if self.pending_change is None:
+                self.pending_change = DataChange()
+            self.pending_change.merge(change)
+            return
+        self.apply_change(change)
+
+    def apply_change(self, change):
+        """Rebuild only the overview rows and detail views of the games that changed"""
+        self.update_overall_stats()
+        if change.reset:
+            game_ids = set(self.game_rows) | {game[0] for game in self.db.get_game_stats()}
+        else:
+            game_ids = change.game_ids
+        if not game_ids:
+            return
+
+        shown = self.current_detail_widget
+        if shown is not None and self.stacked_widget.currentWidget() is not shown:
+            shown = None
+        for game_id in change.deleted:
+            cached = self.detail_cache.pop(game_id, None)
+            if cached:
+                self.dispose_detail_widget(cached[1])
+            self.profiles.pop(game_id, None)
+
+        game_streaks = self.db.get_game_streaks()
+        for game_id in sorted(game_ids):
+            stats = self.db.get_game_stats(game_id)
+            old_row = self.game_rows.pop(game_id, None)
+            if stats:
+                new_row = self.create_game_row(stats[0], game_streaks)
+                self.game_rows[game_id] = new_row
+                if old_row is not None:
+                    position = self.games_layout.indexOf(old_row)
+                else:
+                    # Rows are in id order; the stretch is always last
+                    later = [self.games_layout.indexOf(self.game_rows[other])
+                             for other in self.game_rows if other > game_id]
+                    position = min(later, default=self.games_layout.count() - 1)
+                self.games_layout.insertWidget(position, new_row)
+            if old_row is not None:
+                self.games_layout.removeWidget(old_row)
+                old_row.deleteLater()
+        self.main_window.analytics(
+            lambda analytics: self.show_activity(analytics, game_ids)
+        )
+
+        # Cached detail views check the game's generation, so reopening rebuilds a stale one
+        if shown is not None:
+            if shown.game_data[0] in self.game_rows:
+                if shown.game_data[0] in game_ids:
+                    self.show_game_details(self.game_rows[shown.game_data[0]].game_data)
+            else:
+                self.stacked_widget.setCurrentWidget(self.main_stats)
 
     def create_header(self):
         header_layout = QHBoxLayout()
         
         back_btn = QPushButton("←")
         back_btn.setFixedSize(40, 40)
-        back_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4a90e2;
-                border: none;
-                border-radius: 20px;
-                color: white;
-                font-size: 20px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #357abd;
-            }
-        """)
+        styled(back_btn, 'backButton')
         back_btn.clicked.connect(self.go_back)
         
         header_layout.addWidget(back_btn)
@@ -0,0 +1,250 @@
+"""The application's look, as one stylesheet set on the QApplication.
+
+COLORS is the palette. The stylesheet is built from it, and widgets that
+paint themselves with QPainter (the daily and history lists, charts)
+read their colours from it too.
+
+Widgets don't carry their own CSS. They are matched by object name for
+one-off parts (e.g. #backButton) and by dynamic properties for the
+variants shared across pages:
+
+    role   caption, value, heading, name, note, status, card
+    scale  large, huge (on captions and values; "size" is a QWidget property)
+    tone   good, bad, accent (text colour)
+    clickable  true on cards that open something
+
+Qt parses the stylesheet once and only matches it against each widget
+when the widget is polished, so properties must be set before a widget
+is first shown (styled() does that at construction time). Changing a
+property used by a selector afterwards needs the widget re-polished,
+which is why state such as a game's completion is shown through text
+rather than properties.
+"""
+from PyQt6.QtWidgets import QApplication
+
+COLORS = {
+    'primary': '#4a90e2',
+    'primary_hover': '#357abd',
+    'primary_pressed': '#2968a6',
+    'secondary': '#6c757d',
+    'secondary_hover': '#5a6268',
+    'good': '#28a745',
+    'bad': '#dc3545',
+    'text': '#212529',
+    'subtle': '#495057',
+    'muted': '#666',
+    'faint': '#adb5bd',
+    'on_color': 'white',
+    'surface': 'white',
+    'border': '#ddd',
+    'card': '#f8f9fa',
+    'card_hover': '#e9ecef',
+    'grid': '#e9ecef',
+    'empty': '#dee2e6',
+    'blank': '#f1f3f5',
+    'separator': '#cccccc',
+}
+
+STYLESHEET = """
+/* Page chrome */
+QPushButton#backButton {
+    background-color: %(primary)s;
+    border: none;
+    border-radius: 20px;
+    color: %(on_color)s;
+    font-size: 20px;
+    font-weight: bold;
+}
+QPushButton#backButton:hover {
+    background-color: %(primary_hover)s;
+}
+QLabel#pageTitle {
+    font-size: 24px;
+    font-weight: bold;
+}
+QLabel#appTitle {
+    color: %(primary)s;
+    font-size: 36px;
+    font-weight: bold;
+    margin-bottom: 20px;
+}
+QFrame#separator {
+    background-color: %(separator)s;
+}
+QScrollArea {
+    border: none;
+}
+
+/* Main menu */
+QPushButton#menuButton {
+    background-color: %(primary)s;
+    border: none;
+    border-radius: 10px;
+    color: %(on_color)s;
+    font-size: 18px;
+    font-weight: bold;
+    margin: 5px;
+}
+QPushButton#menuButton:hover {
+    background-color: %(primary_hover)s;
+}
+QPushButton#menuButton:pressed {
+    background-color: %(primary_pressed)s;
+}
+QPushButton#settingsButton {
+    background-color: %(secondary)s;
+    border: none;
+    border-radius: 25px;
+    color: %(on_color)s;
+    font-size: 18px;
+    margin-top: 20px;
+}
+QPushButton#settingsButton:hover {
+    background-color: %(secondary_hover)s;
+}
+
+/* Daily page */
+QLabel#progressLabel {
+    color: %(good)s;
+    font-size: 16px;
+    margin-left: 20px;
+}
+QPushButton#addGameButton {
+    background-color: %(good)s;
+    color: %(on_color)s;
+    border: none;
+    border-radius: 15px;
+    padding: 8px 15px;
+}
+
+/* Game rows */
+#gameRow {
+    background-color: %(card)s;
+    border-radius: 10px;
+    padding: 10px;
+    margin: 5px;
+}
+#gameRow:hover {
+    background-color: %(card_hover)s;
+}
+QLabel#checkbox {
+    font-size: 24px;
+    margin-right: 10px;
+    padding: 5px;
+}
+QLabel#gameName {
+    font-weight: bold;
+    font-size: 16px;
+}
+QLabel#scoreLabel {
+    background: transparent;
+    border: none;
+    color: %(good)s;
+    font-size: 14px;
+    padding: 2px 4px;
+}
+QLabel#scoreDenomination {
+    color: %(secondary)s;
+    font-size: 14px;
+}
+QLabel#noteLabel {
+    color: %(muted)s;
+    font-style: italic;
+}
+
+/* Calendar */
+QCalendarWidget {
+    background-color: %(surface)s;
+    border: 1px solid %(border)s;
+    border-radius: 10px;
+}
+QCalendarWidget QToolButton {
+    color: %(primary)s;
+    background-color: %(surface)s;
+    border: none;
+}
+QCalendarWidget QMenu {
+    background-color: %(surface)s;
+}
+QCalendarWidget QSpinBox {
+    background-color: %(surface)s;
+    border: 1px solid %(border)s;
+    border-radius: 5px;
+}
+
+/* Shared variants */
+QFrame[role="card"] {
+    background-color: %(card)s;
+    border-radius: 10px;
+    padding: 15px;
+}
+QFrame[role="card"][clickable="true"]:hover {
+    background-color: %(card_hover)s;
+}
+QLabel[role="heading"] {
+    font-size: 18px;
+    font-weight: bold;
+    margin-bottom: 10px;
+}
+QLabel#historyLabel {
+    margin-top: 20px;
+}
+QLabel[role="name"] {
+    font-size: 16px;
+    font-weight: bold;
+}
+QLabel[role="caption"] {
+    color: %(muted)s;
+}
+QLabel[role="caption"][scale="large"] {
+    font-size: 16px;
+}
+QLabel[role="value"] {
+    font-weight: bold;
+}
+QLabel[role="value"][scale="large"] {
+    font-size: 20px;
+}
+QLabel[role="value"][scale="huge"] {
+    font-size: 24px;
+}
+QLabel[role="note"] {
+    color: %(muted)s;
+    font-size: 14px;
+}
+QLabel[role="status"] {
+    color: %(muted)s;
+    padding: 20px;
+}
+QLabel[tone="good"] {
+    color: %(good)s;
+}
+QLabel[tone="bad"] {
+    color: %(bad)s;
+}
+QLabel[tone="accent"] {
+    color: %(primary)s;
+}
+""" % COLORS
+
+
+def apply_theme(app=None):
+    """Set the application stylesheet; call before the first widget is shown"""
+    app = app or QApplication.instance()
+    if app.styleSheet() != STYLESHEET:
+        app.setStyleSheet(STYLESHEET)
+
+
+def styled(widget, name=None, **properties):
+    """Give widget an object name and dynamic properties for STYLESHEET to match.
+
+    Returns the widget, so it can wrap a constructor:
+
+        title = styled(QLabel("Calendar"), 'pageTitle')
+        value = styled(QLabel("3"), role='value', tone='good')
+    """
+    if name:
+        widget.setObjectName(name)
+    for key, value in properties.items():
+        widget.setProperty(key, value)
+    return widget